@@ -8,15 +8,24 @@ Reads system names from input.txt and automatically captures each one
 import os
 import random
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, Future, ProcessPoolExecutor, wait
+from multiprocessing import util as mp_util
 from difflib import SequenceMatcher
 
 # Third-party imports
+import cv2
 import pyautogui
 import winsound
 
 # Local imports
+from capture import get_capture_backend
+from debug_writer import capture_artifacts, get_debug_writer
+from ocr_engine import get_engine
 from powerplay_ocr import PowerplayOCR
+from screenshot_context import ScreenshotContext
 import config
+import tracing
 
 def play_success_sound():
     """Play a success sound (high beep)"""
@@ -32,6 +41,18 @@ def play_error_sound():
     except:
         print('\a\a')
 
+def save_archive_image(path, image):
+    """
+    Write a lossless PNG with the fast archive compression level (config.ARCHIVE_PNG_COMPRESSION)
+
+    Args:
+        path: Output file path
+        image: NumPy array (BGR or grayscale)
+    """
+    if not cv2.imwrite(path, image, [cv2.IMWRITE_PNG_COMPRESSION, config.ARCHIVE_PNG_COMPRESSION]):
+        raise Exception(f"Could not write {path}")
+
+@tracing.traced()
 def find_and_click_system_in_dropdown(search_x, search_y, system_name, debug_index=0):
     """
     Find the correct system in the dropdown list using OCR and click it
@@ -45,8 +66,6 @@ def find_and_click_system_in_dropdown(search_x, search_y, system_name, debug_ind
     Returns:
         True if found and clicked, False otherwise
     """
-    import pytesseract
-    import cv2
     import numpy as np
     from PIL import Image
 
@@ -58,12 +77,10 @@ def find_and_click_system_in_dropdown(search_x, search_y, system_name, debug_ind
     dropdown_max_height = config.DROPDOWN_MAX_HEIGHT
 
     # Take screenshot of dropdown area immediately (dropdown should already be visible)
-    screenshot_full = pyautogui.screenshot(region=(dropdown_left, dropdown_top, dropdown_width, dropdown_max_height))
+    img_full = get_capture_backend().grab(region=(dropdown_left, dropdown_top, dropdown_width, dropdown_max_height))
 
     # Dynamically detect where the dropdown content ends
     # Strategy: Scan from BOTTOM to TOP looking for where content starts
-    # Convert to OpenCV format for analysis
-    img_full = cv2.cvtColor(np.array(screenshot_full), cv2.COLOR_RGB2BGR)
 
     # Convert to grayscale for brightness analysis
     gray = cv2.cvtColor(img_full, cv2.COLOR_BGR2GRAY)
@@ -102,12 +119,12 @@ def find_and_click_system_in_dropdown(search_x, search_y, system_name, debug_ind
                 break
 
     # Crop to just the dropdown area
-    screenshot = screenshot_full.crop((0, 0, dropdown_width, dropdown_height))
+    img = img_full[:dropdown_height, :dropdown_width]
 
     # Save screenshot for debugging
     debug_path = f"auto_capture/debug/dropdown/dropdown_{debug_index:03d}.png"
     os.makedirs('auto_capture/debug/dropdown', exist_ok=True)
-    screenshot.save(debug_path)
+    cv2.imwrite(debug_path, img)
 
     # Save debug info about the cropping
     debug_info_path = f"auto_capture/debug/dropdown/dropdown_{debug_index:03d}_info.txt"
@@ -126,9 +143,6 @@ def find_and_click_system_in_dropdown(search_x, search_y, system_name, debug_ind
             f.write(f"Row {y}: {dark_ratio:.1%} dark{marker}\n")
 
     # Preprocess image for better OCR accuracy
-    # Convert PIL to OpenCV format
-    img = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-
     # Upscale 2x (not 3x - was too large for OCR)
     img = cv2.resize(img, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
 
@@ -152,7 +166,7 @@ def find_and_click_system_in_dropdown(search_x, search_y, system_name, debug_ind
 
     # OCR the dropdown to find matching system names
     # Try PSM 11 (sparse text, find as much text as possible)
-    text = pytesseract.image_to_string(
+    text = get_engine().image_to_string(
         preprocessed_pil,
         config='--oem 3 --psm 11'
     )
@@ -376,6 +390,7 @@ def load_previous_capture(output_dir, current_time):
     print(f"  Loaded {len(previous_data)} systems from previous capture")
     return previous_data, is_same_cycle
 
+@tracing.traced()
 def click_and_paste(x, y, text, debug_index=0):
     """
     Click at coordinates and type text with randomized movement and timing
@@ -419,6 +434,248 @@ def click_and_paste(x, y, text, debug_index=0):
     # Wait for the game to process and display system info
     time.sleep(random.uniform(0.5, 1.0))
 
+@tracing.traced()
+def process_capture(ocr, system_name, i, screenshot_path):
+    """
+    Run OCR on one captured screenshot and write its debug artifacts
+
+    Args:
+        ocr: PowerplayOCR instance
+        system_name: System name from input.txt
+        i: Capture index (used for debug file naming)
+        screenshot_path: Path to the captured screenshot
+
+    Returns:
+        Dictionary with extracted powerplay information (including initial_control_points)
+    """
+    cache = ocr.ocr_cache
+    hits_before, misses_before = (cache.hits, cache.misses) if cache else (0, 0)
+
+    # Decode the screenshot once and share it between all stages below
+    screenshot = ScreenshotContext(screenshot_path)
+    # The searched-for name only needs one OCR pass to be confirmed
+    info = ocr.extract_powerplay_auto(screenshot, expected_name=system_name)
+
+    # Detect initial control points from status bar (non-competitive states only)
+    is_competitive = 'powers' in info and info['powers']
+    if not is_competitive:
+        initial_cp = ocr.detect_initial_control_points_from_bar(screenshot)
+        info['initial_control_points'] = initial_cp if initial_cp is not None else -1
+    else:
+        info['initial_control_points'] = -1  # Not applicable for competitive states
+
+    write_debug_artifacts(ocr, screenshot, info, system_name, i)
+
+    # OCR cache statistics for this capture (aggregated across workers in main)
+    if cache:
+        info['_ocr_cache_hits'] = cache.hits - hits_before
+        info['_ocr_cache_misses'] = cache.misses - misses_before
+
+    return info
+
+@tracing.traced()
+def write_debug_artifacts(ocr, screenshot, info, system_name, i):
+    """
+    Queue the panel crop, subsections and OCR text of one capture for verification
+
+    The files are written by the background debug writer (see config.DEBUG_ARTIFACTS);
+    in 'on_failure' mode only captures that fail validation reach the disk.
+
+    Args:
+        ocr: PowerplayOCR instance
+        screenshot: ScreenshotContext of the capture
+        info: Extracted powerplay information
+        system_name: System name from input.txt
+        i: Capture index (used for debug file naming)
+    """
+    writer = get_debug_writer()
+    if writer is None:
+        return
+
+    artifacts, failed = capture_artifacts(ocr, screenshot, info, 'auto_capture/debug', i,
+                                          f"CAPTURE #{i} - {system_name}")
+    writer.submit(artifacts, failed=failed)
+
+# Per-process OCR instance for Phase 2 worker processes
+_worker_ocr = None
+
+def _init_phase2_worker(trace=False):
+    """Create a warmed PowerplayOCR once per worker process"""
+    global _worker_ocr
+    if trace:
+        tracing.enable(f"Phase 2 worker {os.getpid()}")
+    _worker_ocr = PowerplayOCR()
+    _worker_ocr.engine.warm_up()
+    # Persist this worker's new OCR cache entries when the pool shuts it down
+    if _worker_ocr.ocr_cache:
+        mp_util.Finalize(None, _worker_ocr.ocr_cache.save, exitpriority=10)
+    # Finish this worker's queued debug files before it exits (atexit does not run in pool workers)
+    writer = get_debug_writer()
+    if writer:
+        mp_util.Finalize(None, writer.close, exitpriority=20)
+
+def _process_capture_in_worker(job):
+    """
+    Worker entry point - returns (info, error, trace events) so one bad screenshot can't stop the pool
+    """
+    system_name, i, screenshot_path = job
+    try:
+        info, error = process_capture(_worker_ocr, system_name, i, screenshot_path), None
+    except Exception as e:
+        info, error = None, str(e)
+    # Spans recorded in this worker travel back with the result and are merged into the main trace
+    return info, error, tracing.drain()
+
+def resolve_phase2_workers(workers=None):
+    """Number of Phase 2 worker processes (config.PHASE2_WORKERS, None = one per CPU core)"""
+    if workers is None:
+        workers = config.PHASE2_WORKERS or os.cpu_count() or 1
+    return max(1, workers)
+
+class Phase2Pipeline:
+    """
+    Bounded queue of screenshots being OCR'd by background worker processes
+
+    Screenshots can be submitted while Phase 1 is still capturing. When max_pending
+    screenshots are in flight, submit() waits for the oldest one to finish (backpressure).
+    Results are always returned in submission order.
+
+    At most two jobs per worker are handed to the pool at a time. If a worker process
+    dies (crash in the OCR engine, out of memory) the pool is recreated and every job
+    it lost is run again on its own, so a screenshot that keeps killing its worker is
+    reported as an error without taking the other screenshots with it.
+    """
+
+    def __init__(self, workers=None, max_pending=None):
+        """
+        Args:
+            workers: Number of worker processes (None = config.PHASE2_WORKERS)
+            max_pending: Maximum screenshots in flight before submit() blocks (None = unbounded)
+        """
+        self.workers = resolve_phase2_workers(workers)
+        self.max_pending = max_pending
+        self._pool = self._create_pool()
+        self._queue = deque()  # [job, future (None = not in the pool yet), run alone] in submission order
+        self._finished = deque()
+
+    def _create_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_phase2_worker,
+                                   initargs=(tracing.is_enabled(),))
+
+    def submit(self, job):
+        """
+        Queue a (system_name, index, screenshot_path) job for OCR
+
+        Args:
+            job: Tuple of (system_name, index, screenshot_path)
+        """
+        while self.max_pending and len(self._queue) >= self.max_pending:
+            self._collect_oldest()
+        self._queue.append([job, None, False])
+        self._fill()
+
+    def _in_pool(self):
+        return [entry[1] for entry in self._queue if entry[1] is not None and not entry[1].done()]
+
+    def _fill(self):
+        """Hand queued jobs to the pool in order, keeping it small so a dead worker loses few jobs"""
+        in_pool = len(self._in_pool())
+        if any(entry[2] and entry[1] is not None and not entry[1].done() for entry in self._queue):
+            return  # A job that was in the pool when a worker died runs on its own
+
+        for entry in self._queue:
+            if in_pool >= 2 * self.workers:
+                return
+            if entry[1] is not None:
+                continue
+            if entry[2] and in_pool:
+                return  # Wait for the pool to empty
+            try:
+                entry[1] = self._pool.submit(_process_capture_in_worker, entry[0])
+            except BrokenExecutor:
+                self._restart_pool()
+                return self._fill()
+            in_pool += 1
+            if entry[2]:
+                return
+
+    def _collect_oldest(self):
+        while True:
+            self._fill()
+            job, future, _ = self._queue[0]
+            if future is None or not future.done():
+                wait(self._in_pool(), return_when=FIRST_COMPLETED)
+                continue
+
+            try:
+                info, error, trace_events = future.result()
+            except BrokenExecutor:
+                self._restart_pool()
+                continue
+            self._queue.popleft()
+            tracing.add_events(trace_events)
+            self._finished.append((job, info, error))
+            return
+
+    def _restart_pool(self):
+        """Replace a broken pool; the jobs it lost are queued again to run one at a time"""
+        print("  -> [WARNING] A Phase 2 worker process died - restarting the worker pool")
+        self._pool.shutdown(wait=False)
+        self._pool = self._create_pool()
+        for entry in self._queue:
+            future = entry[1]
+            if future is None or (future.done() and future.exception() is None):
+                continue
+            if entry[2]:
+                # The worker died with no other job in the pool - this screenshot killed it
+                entry[1] = Future()
+                entry[1].set_result((None, "Worker process died while processing this screenshot", []))
+            else:
+                entry[1], entry[2] = None, True
+
+    def results(self):
+        """
+        Wait for all queued jobs and shut the pool down
+
+        Yields:
+            Tuples of (job, info, error) in submission order
+        """
+        try:
+            while self._finished or self._queue:
+                if not self._finished:
+                    self._collect_oldest()
+                yield self._finished.popleft()
+        finally:
+            self._pool.shutdown()
+
+def run_phase2(ocr, jobs, workers=None):
+    """
+    Process captured screenshots, fanning out to worker processes when more than one worker is used
+
+    Args:
+        ocr: PowerplayOCR instance used when running in-process
+        jobs: List of (system_name, index, screenshot_path) tuples
+        workers: Number of worker processes (None = config.PHASE2_WORKERS, 1 = in-process)
+
+    Yields:
+        Tuples of (job, info, error) in the same order as jobs
+    """
+    workers = min(resolve_phase2_workers(workers), max(1, len(jobs)))
+
+    if workers == 1:
+        for job in jobs:
+            try:
+                yield job, process_capture(ocr, *job), None
+            except Exception as e:
+                yield job, None, str(e)
+        return
+
+    print(f"Using {workers} worker processes")
+    pipeline = Phase2Pipeline(workers)
+    for job in jobs:
+        pipeline.submit(job)
+    yield from pipeline.results()
+
 def main():
     print("=" * 80)
     print("ELITE DANGEROUS POWERPLAY OCR - AUTOMATED CAPTURE")
@@ -441,6 +698,9 @@ def main():
     # Timestamped archive file
     archive_output_file = os.path.join(output_dir, f'powerplay_auto_capture_{timestamp}.txt')
 
+    if config.TRACE_ENABLED:
+        tracing.enable("auto_capture")
+
     # Check if input.txt exists
     if not os.path.exists('input.txt'):
         print("\nERROR: input.txt not found!")
@@ -455,6 +715,12 @@ def main():
         print("\nERROR: input.txt is empty!")
         return
 
+    # Capture every system once (pipelined and two-phase mode both see the same list)
+    unique_names = list(dict.fromkeys(system_names))
+    if len(unique_names) < len(system_names):
+        print(f"\nSkipping {len(system_names) - len(unique_names)} repeated system name(s) in input.txt")
+        system_names = unique_names
+
     print(f"\nFound {len(system_names)} systems to process:")
     for i, name in enumerate(system_names[:5], 1):
         print(f"  {i}. {name}")
@@ -476,9 +742,26 @@ def main():
 
     ocr = PowerplayOCR()
 
+    # The names in input.txt are known system names - save them before Phase 2 workers load the lexicon
+    if ocr.system_lexicon is not None:
+        for name in system_names:
+            ocr.system_lexicon.add(name)
+        ocr.system_lexicon.save()
+
     # Create directories for screenshots
     os.makedirs('auto_capture/screenshots', exist_ok=True)
 
+    # Create directories for debug output (written by Phase 2, which may start during Phase 1)
+    os.makedirs('auto_capture/debug/cropped', exist_ok=True)
+    os.makedirs('auto_capture/debug/ocr_text', exist_ok=True)
+    os.makedirs('auto_capture/debug/subsections', exist_ok=True)
+
+    # Pipelined mode: OCR each screenshot in background workers while the next system is captured
+    pipeline = None
+    if config.PIPELINE_CAPTURE:
+        pipeline = Phase2Pipeline(max_pending=config.PIPELINE_MAX_PENDING)
+        print(f"\nPipelined capture: OCR runs in {pipeline.workers} background worker(s) during capture")
+
     # Search field coordinates from config
     SEARCH_X = config.SEARCH_FIELD_X
     SEARCH_Y = config.SEARCH_FIELD_Y
@@ -496,6 +779,9 @@ def main():
         print(f"\n[{i}/{len(system_names)}] Capturing: {system_name}")
 
         try:
+            # One capture cycle per system (a replay backend moves to the next recorded frame)
+            get_capture_backend().next_frame()
+
             # Click, paste, enter, wait
             print(f"  -> Searching for system...")
             click_and_paste(SEARCH_X, SEARCH_Y, system_name, i)
@@ -504,22 +790,24 @@ def main():
             print(f"  -> Waiting for map to load...")
             time.sleep(1.0)
 
-            # Take screenshot only (no OCR yet)
+            # Take screenshot (OCR happens in Phase 2 or in the background pipeline)
             print(f"  -> Taking screenshot...")
-            screenshot_path = ocr.take_screenshot()
+            screenshot = ocr.capture_screenshot(save=False, panel_only=config.CAPTURE_PANEL_ONLY)
 
             # Save screenshot with system name
-            if screenshot_path:
-                import shutil
-
+            if screenshot is not None:
                 # Sanitize system name for filename (replace invalid chars)
                 safe_name = system_name.replace(' ', '_').replace('/', '-').replace('\\', '-')
 
-                # Save the full screenshot with system name
+                # Archive only the extended panel (Phase 2 and the debug tools read panel crops directly)
                 saved_path = f"auto_capture/screenshots/capture_{i:03d}_{safe_name}.png"
-                shutil.move(screenshot_path, saved_path)
+                save_archive_image(saved_path, screenshot.panel(extended=True))
                 screenshot_mapping[system_name] = (i, saved_path)
 
+                # Start OCR right away in pipelined mode
+                if pipeline:
+                    pipeline.submit((system_name, i, saved_path))
+
                 print(f"  -> [OK] Screenshot saved!")
             else:
                 print(f"  -> [ERROR] Screenshot failed!")
@@ -549,11 +837,6 @@ def main():
     print("\nYou can now close Elite Dangerous if needed.")
     print("Processing screenshots...")
 
-    # Create directories for debug output
-    os.makedirs('auto_capture/debug/cropped', exist_ok=True)
-    os.makedirs('auto_capture/debug/ocr_text', exist_ok=True)
-    os.makedirs('auto_capture/debug/subsections', exist_ok=True)
-
     # Initialize both output files with headers
     header = "System Name\tPower\tState\t\tUndermining\tReinforcement\tInitial CP\n"
     with open(main_output_file, 'w', encoding='utf-8') as f:
@@ -562,76 +845,32 @@ def main():
         f.write(header)
 
     collected_systems = {}
+    cache_hits = 0
+    cache_misses = 0
 
-    # Process each screenshot
-    for system_name, (i, screenshot_path) in screenshot_mapping.items():
-        print(f"\n[{i}/{len(system_names)}] Processing: {system_name}")
+    # Process each screenshot (in parallel across worker processes, results in input order)
+    # In pipelined mode most screenshots have already been processed during Phase 1
+    if pipeline:
+        results = pipeline.results()
+    else:
+        jobs = [(system_name, i, screenshot_path) for system_name, (i, screenshot_path) in screenshot_mapping.items()]
+        results = run_phase2(ocr, jobs)
 
-        try:
-            print(f"  -> Running OCR...")
-            info = ocr.extract_powerplay_auto(screenshot_path)
+    for (system_name, i, screenshot_path), info, error in results:
+        print(f"\n[{i}/{len(system_names)}] Processing: {system_name}")
 
-            # Detect initial control points from status bar (non-competitive states only)
-            is_competitive = 'powers' in info and info['powers']
-            if not is_competitive:
-                initial_cp = ocr.detect_initial_control_points_from_bar(screenshot_path)
-                info['initial_control_points'] = initial_cp if initial_cp is not None else -1
-            else:
-                info['initial_control_points'] = -1  # Not applicable for competitive states
+        if error:
+            print(f"  -> [ERROR] {error}")
+            # Keep the original screenshot for debugging errors
+            continue
 
-            # Get raw text for debug
-            text = ocr.extract_text(screenshot_path, preprocess_method='upscale', crop_panel=False, use_subsections=False)
+        cache_hits += info.get('_ocr_cache_hits', 0)
+        cache_misses += info.get('_ocr_cache_misses', 0)
 
-            # Determine if this is a competitive state
+        try:
             is_competitive = 'powers' in info and info['powers']
-
-            # Save cropped panel
-            if is_competitive:
-                cropped_img = ocr.crop_powerplay_panel(screenshot_path, extended=True)
-            else:
-                cropped_img = ocr.crop_powerplay_panel(screenshot_path, extended=False)
             cropped_path = f"auto_capture/debug/cropped/capture_{i:03d}.png"
-            cropped_img.save(cropped_path)
-
-            # Save subsections
-            if is_competitive:
-                subsections = ocr.crop_powerplay_subsections_competitive(screenshot_path)
-            else:
-                subsections = ocr.crop_powerplay_subsections(screenshot_path)
-            for section_name, section_img in subsections.items():
-                subsection_path = f"auto_capture/debug/subsections/capture_{i:03d}_{section_name}.png"
-                section_img.save(subsection_path)
-
-            # Save OCR text
             ocr_text_path = f"auto_capture/debug/ocr_text/capture_{i:03d}.txt"
-            with open(ocr_text_path, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write(f"CAPTURE #{i} - {system_name}\n")
-                f.write("=" * 80 + "\n\n")
-                f.write("RAW OCR TEXT:\n")
-                f.write("-" * 80 + "\n")
-                f.write(text)
-                f.write("\n" + "-" * 80 + "\n\n")
-                f.write("PARSED DATA:\n")
-                f.write(f"  System Name: '{info['system_name']}'\n")
-                f.write(f"  Controlling Power: '{info['controlling_power']}'\n")
-                f.write(f"  Opposing Power: '{info['opposing_power']}'\n")
-                f.write(f"  System Status: '{info['system_status']}'\n")
-                initial_cp = info.get('initial_control_points', -1)
-                if initial_cp >= 0:
-                    f.write(f"  Initial Control Points: {initial_cp:,}\n")
-                f.write(f"  Undermining Points: {info['undermining_points']}\n")
-                f.write(f"  Reinforcing Points: {info['reinforcing_points']}\n")
-
-                # Add voting details if available (shows OCR accuracy)
-                if '_undermining_votes' in info:
-                    f.write(f"\n  OCR Voting Results (Undermining):\n")
-                    f.write(f"    Votes: {info['_undermining_votes']}\n")
-                    f.write(f"    Winner: {info['_undermining_winner']}\n")
-                if '_reinforcing_votes' in info:
-                    f.write(f"  OCR Voting Results (Reinforcing):\n")
-                    f.write(f"    Votes: {info['_reinforcing_votes']}\n")
-                    f.write(f"    Winner: {info['_reinforcing_winner']}\n")
 
             # Check if valid
             if ocr.is_valid_powerplay_data(info):
@@ -666,7 +905,7 @@ def main():
 
                 print(f"  -> [OK] Data saved!")
 
-                # Delete original full screenshot (keep cropped for debug)
+                # Delete the archived panel capture (keep cropped for debug)
                 try:
                     os.remove(screenshot_path)
                 except:
@@ -696,9 +935,21 @@ def main():
             print(f"  -> [ERROR] {str(e)}")
             # Keep the original screenshot for debugging errors
 
+    # Wait for debug files of in-process captures (worker processes flush theirs on shutdown)
+    debug_writer = get_debug_writer()
+    if debug_writer:
+        debug_writer.flush()
+
     # Print final summary
     print("\n" + "=" * 80)
     print(f"PROCESSING COMPLETE - PARSED {len(collected_systems)}/{len(system_names)} SYSTEMS")
+    if cache_hits + cache_misses:
+        print(f"OCR cache: {cache_hits} hits / {cache_misses} misses "
+              f"({cache_hits / (cache_hits + cache_misses):.1%} hit rate)")
+    if tracing.is_enabled():
+        trace_path = os.path.join(config.TRACE_DIR, f'auto_capture_{timestamp}.json')
+        span_count = tracing.export(trace_path)
+        print(f"Trace: {span_count} spans -> {trace_path}")
     print("=" * 80)
 
     if collected_systems:
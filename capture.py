@@ -0,0 +1,204 @@
+"""
+Screen capture backends for PowerplayParser
+Every backend returns frames as in-memory BGR arrays, so captures can go
+straight into the pipeline without a PNG round trip
+"""
+
+# Standard library imports
+import glob
+import os
+import threading
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Local imports
+import config
+
+
+class PyAutoGUIBackend:
+    """
+    Portable fallback backend using pyautogui (PIL ImageGrab on Windows and macOS)
+    Each grab converts a PIL RGB image, so this is the slowest backend
+    """
+
+    name = 'pyautogui'
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def next_frame(self):
+        """Start a new capture cycle (live screens need no preparation)"""
+
+    def grab(self, region=None):
+        """
+        Capture the screen
+
+        Args:
+            region: Tuple of (x, y, width, height) for a partial capture (None = primary screen)
+
+        Returns:
+            NumPy array (BGR)
+        """
+        screenshot = self._pyautogui.screenshot(region=region)
+        return cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_RGB2BGR)
+
+
+class MSSBackend:
+    """
+    Native grabber backed by mss (DXGI/GDI on Windows, XShm on Linux)
+
+    One mss instance is kept per thread - its handles are not thread-safe.
+    """
+
+    name = 'mss'
+
+    def __init__(self):
+        import mss
+        self._mss = mss
+        self._local = threading.local()
+
+    def _get_grabber(self):
+        grabber = getattr(self._local, 'grabber', None)
+        if grabber is None:
+            grabber = self._mss.mss()
+            self._local.grabber = grabber
+        return grabber
+
+    def next_frame(self):
+        """Start a new capture cycle (live screens need no preparation)"""
+
+    def grab(self, region=None):
+        """
+        Capture the screen
+
+        Args:
+            region: Tuple of (x, y, width, height) for a partial capture (None = primary screen)
+
+        Returns:
+            NumPy array (BGR)
+        """
+        grabber = self._get_grabber()
+        # Monitor 1 is the primary screen, like pyautogui.screenshot() - monitor 0 would be the
+        # bounding box of all screens and shift every panel coordinate on multi-monitor setups
+        monitor = grabber.monitors[1]
+        if region:
+            # Regions are relative to the primary screen; mss works in virtual desktop coordinates
+            x, y, width, height = region
+            monitor = {'left': monitor['left'] + x, 'top': monitor['top'] + y, 'width': width, 'height': height}
+        return cv2.cvtColor(np.asarray(grabber.grab(monitor)), cv2.COLOR_BGRA2BGR)
+
+
+class ReplayBackend:
+    """
+    Serves recorded screenshots instead of the screen
+
+    Frames are the PNG files of a directory in name order. One frame stands for one
+    capture cycle: next_frame() moves to the next recording and every grab until the
+    following next_frame() - e.g. the dropdown search and the panel capture of one
+    system - is cut from it. Capture loops can so be benchmarked and tested without
+    a display or the game.
+    """
+
+    name = 'replay'
+
+    def __init__(self, directory, loop=True):
+        """
+        Args:
+            directory: Directory of recorded full-desktop screenshots (*.png)
+            loop: Start over after the last frame (otherwise next_frame() raises)
+        """
+        self.paths = sorted(glob.glob(os.path.join(directory, '*.png')))
+        if not self.paths:
+            raise ValueError(f"No recorded frames (*.png) in {directory}")
+        self.loop = loop
+        self.position = -1  # Index of the current frame (-1 = before the first one)
+        self._frame = None
+        self._lock = threading.RLock()
+
+    def next_frame(self):
+        """
+        Move to the next recorded frame
+
+        Raises:
+            IndexError: If the replay is not looping and the last frame was already served
+        """
+        with self._lock:
+            position = self.position + 1
+            if position >= len(self.paths):
+                if not self.loop:
+                    raise IndexError(f"Replay finished after {len(self.paths)} frames")
+                position = 0
+
+            frame = cv2.imread(self.paths[position])
+            if frame is None:
+                raise ValueError(f"Could not load recorded frame: {self.paths[position]}")
+            self.position, self._frame = position, frame
+
+    def grab(self, region=None):
+        """
+        Return the current recorded frame (the first one if next_frame() was never called)
+
+        Args:
+            region: Tuple of (x, y, width, height) to crop from the frame (None = whole frame)
+
+        Returns:
+            NumPy array (BGR)
+        """
+        with self._lock:
+            if self._frame is None:
+                self.next_frame()
+            frame = self._frame
+        if region:
+            x, y, width, height = region
+            frame = frame[y:y + height, x:x + width]
+        return frame.copy()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def create_backend(name='auto', replay_dir=None):
+    """
+    Create a capture backend
+
+    Args:
+        name: 'auto' (mss if installed, otherwise pyautogui), 'mss', 'pyautogui' or 'replay'
+        replay_dir: Directory of recorded frames (required for 'replay')
+
+    Returns:
+        Capture backend with a grab(region=None) method returning BGR arrays and a
+        next_frame() method to call at the start of every capture cycle
+    """
+    if name == 'replay':
+        if not replay_dir:
+            raise ValueError("The replay capture backend needs config.CAPTURE_REPLAY_DIR")
+        return ReplayBackend(replay_dir)
+
+    if name in ('auto', 'mss'):
+        try:
+            return MSSBackend()
+        except ImportError:
+            if name == 'mss':
+                print("mss not installed. Install with: pip install mss")
+
+    return PyAutoGUIBackend()
+
+
+def get_capture_backend():
+    """
+    Get the process-wide capture backend, creating it on first use (see config.CAPTURE_BACKEND)
+
+    Returns:
+        Capture backend instance
+    """
+    global _backend
+
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_backend(config.CAPTURE_BACKEND, config.CAPTURE_REPLAY_DIR)
+
+    return _backend
@@ -0,0 +1,90 @@
+"""
+Panel change detection for PowerplayParser
+Compares a downsampled fingerprint of the system name and status areas with
+the previous frame, so monitoring can skip OCR while the same system is shown
+"""
+
+# Standard library imports
+import threading
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Local imports
+import config
+from screenshot_context import ScreenshotContext
+
+# Fingerprinted areas as (left, top, right, bottom) in standard panel pixels (740×646).
+# Both layouts show the system name and the start of the status text here.
+FINGERPRINT_REGIONS = [
+    (14, 56, 552, 96),    # System name line
+    (14, 212, 424, 280),  # Status description
+]
+FINGERPRINT_SIZE = (64, 8)  # Downsampled width × height of each region
+
+
+def panel_fingerprint(image_path):
+    """
+    Downsampled grayscale fingerprint of the system name and status areas
+
+    Args:
+        image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+    Returns:
+        float32 NumPy array (one row of FINGERPRINT_SIZE pixels per region, concatenated)
+    """
+    gray = ScreenshotContext.wrap(image_path).panel_gray()
+    height, width = gray.shape[:2]
+    width_scale = width / config.PANEL_WIDTH_STANDARD
+    height_scale = height / config.PANEL_HEIGHT_STANDARD
+
+    parts = []
+    for left, top, right, bottom in FINGERPRINT_REGIONS:
+        region = gray[int(top * height_scale):int(bottom * height_scale),
+                      int(left * width_scale):int(right * width_scale)]
+        # Area averaging evens out anti-aliasing flicker and the animated map behind the panel
+        parts.append(cv2.resize(region, FINGERPRINT_SIZE, interpolation=cv2.INTER_AREA).ravel())
+    return np.concatenate(parts).astype(np.float32)
+
+
+class PanelChangeDetector:
+    """
+    Remembers the fingerprint of the last processed frame
+
+    A frame counts as changed when any fingerprint cell differs from the last one by
+    more than the threshold (in gray levels). A single changed character of the system
+    name moves a few cells by 40+ levels, while redraw noise stays within a few levels.
+    changed() and reset() may be called from different threads.
+    """
+
+    def __init__(self, threshold=12):
+        """
+        Args:
+            threshold: Largest per-cell gray-level difference (0-255) still counted as the same frame
+        """
+        self.threshold = threshold
+        self._last = None
+        self._lock = threading.Lock()
+
+    def changed(self, image_path):
+        """
+        Check a frame against the previous one and remember it
+
+        Args:
+            image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+        Returns:
+            True for the first frame and for frames that differ from the previous one
+        """
+        fingerprint = panel_fingerprint(image_path)
+        with self._lock:
+            last, self._last = self._last, fingerprint
+        if last is None or last.shape != fingerprint.shape:
+            return True
+        return float(np.abs(fingerprint - last).max()) > self.threshold
+
+    def reset(self):
+        """Forget the previous frame (the next frame counts as changed)"""
+        with self._lock:
+            self._last = None
@@ -15,6 +15,63 @@ QUIT_HOTKEY = 'esc'  # Key to press to exit hotkey mode
 # OCR Configuration
 OCR_CONFIG = r'--oem 3 --psm 6'  # Tesseract OCR engine mode and page segmentation mode
 
+# OCR Engine
+# 'auto': use tesserocr (in-process Tesseract API) if installed, otherwise pytesseract
+# 'tesserocr': prefer tesserocr, warn if it is missing
+# 'pytesseract': always launch the tesseract executable per call
+OCR_ENGINE = 'auto'
+TESSDATA_PATH = None  # tessdata directory for tesserocr (None = Tesseract default)
+
+# OCR result cache: skip Tesseract for subsection crops that are pixel-identical to one seen before
+# (power names, status words, rank labels repeat across systems and capture runs)
+OCR_CACHE_ENABLED = True
+OCR_CACHE_PATH = 'ocr_cache.json'  # None = keep the cache in memory only
+OCR_CACHE_MAX_ENTRIES = 20000      # Least recently used results are evicted beyond this
+
+# Known system names (input.txt and earlier captures): OCR'd names are snapped to the nearest one
+# if they differ only by misreads - never by a changed digit or designation (see system_lexicon.is_misread)
+SYSTEM_LEXICON_ENABLED = True
+SYSTEM_LEXICON_PATH = 'system_names.json'  # None = keep the lexicon in memory only
+SYSTEM_NAME_MAX_ERROR_RATE = 0.1           # Max edit distance of a snap, as a fraction of the name length
+
+# Batched OCR: stitch the first-attempt crops of all fields into one sheet and run a single
+# Tesseract pass (words are mapped back to fields by position). Retries still run per field.
+OCR_BATCH_FIELDS = False
+OCR_BATCH_GAP = 24  # Blank pixels between stacked crops
+
+# OCR cascades: attempts (preprocessing method, Tesseract config) per field, tried in order.
+# A field stops at the first attempt that parses with a mean word confidence (0-100) at or above
+# its threshold; if none does, the most confident parsed attempt is used.
+OCR_CASCADES = {
+    'system_name': [(method, '--oem 3 --psm 7 --dpi 300') for method in ['none', 'upscale', 'threshold']],
+    'power_score': [(method, '--oem 3 --psm 7 --dpi 300') for method in ['none', 'threshold', 'upscale']],
+    # PSM 8=single word, 7=single line, 13=raw line
+    'your_rank': [(method, f'--oem 3 --psm {psm} --dpi 300')
+                  for psm in [8, 7, 13] for method in ['none', 'threshold', 'upscale']],
+}
+OCR_CONFIDENCE_THRESHOLDS = {
+    'system_name': 80,
+    'power_score': 80,
+    'your_rank': 70,
+}
+
+# Template-matching digit reader for control point and score fields
+# Build the template file with tests/build_digit_templates.py; without it Tesseract is used
+DIGIT_TEMPLATES_PATH = 'digit_templates.npz'
+DIGIT_MIN_CONFIDENCE = 0.85  # Minimum per-glyph match score before falling back to Tesseract
+
+# Image-based power identification from reference renders of the power names
+# Build the template file with tests/build_power_templates.py; without it OCR + fuzzy matching is used
+POWER_TEMPLATES_PATH = 'power_templates.npz'
+POWER_MIN_CONFIDENCE = 0.8  # Minimum match score before falling back to OCR
+# OCR'd power names may differ from the known name by up to this fraction of its length (edit distance)
+POWER_NAME_MAX_ERROR_RATE = 0.3
+
+# Pixel-signature layout routing (standard vs competitive panel) without OCR
+# Build the signature file with tests/build_layout_signatures.py; without it the status text is OCR'd
+LAYOUT_SIGNATURES_PATH = 'layout_signatures.json'
+LAYOUT_MIN_CONFIDENCE = 0.5  # Below this the status text is OCR'd to decide
+
 # Image Preprocessing
 ENABLE_PREPROCESSING = True
 THRESHOLD_VALUE = 150
@@ -44,6 +101,63 @@ PANEL_HEIGHT_STANDARD = 646  # PANEL_BOTTOM_STANDARD - PANEL_TOP
 PANEL_WIDTH_EXTENDED = 742   # PANEL_RIGHT_EXTENDED - PANEL_LEFT
 PANEL_HEIGHT_EXTENDED = 840  # PANEL_BOTTOM_EXTENDED - PANEL_TOP
 
+# Auto-Capture Phase 2 (OCR) Parallelism
+# Number of worker processes used to OCR captured screenshots
+# None = one per CPU core, 1 = process sequentially in the main process
+PHASE2_WORKERS = None
+
+# Pipelined capture: start OCR on each screenshot while the next system is being captured
+# instead of waiting for Phase 1 to finish
+PIPELINE_CAPTURE = True
+PIPELINE_MAX_PENDING = 8  # Screenshots queued for OCR before capture waits for the oldest one
+
+# Tracing: record wall and CPU time of every pipeline stage in auto_capture and write a
+# Chrome trace-event file per run (open in chrome://tracing or https://ui.perfetto.dev)
+TRACE_ENABLED = False
+TRACE_DIR = 'traces'
+
+# Screen capture backend
+# 'auto' = mss if installed (pip install mss), otherwise pyautogui
+# 'replay' = serve the recorded screenshots in CAPTURE_REPLAY_DIR instead of the screen, one per
+#            capture cycle (system in auto_capture, tick in monitoring, hotkey press in manual capture)
+CAPTURE_BACKEND = 'auto'
+CAPTURE_REPLAY_DIR = None
+
+# Grab only the extended Powerplay panel instead of the whole desktop (~12x fewer pixels to
+# grab, store and decode per system). The dropdown search always grabs its own region.
+CAPTURE_PANEL_ONLY = True
+
+# PNG compression level (0-9) of the panel crops auto_capture archives in Phase 1 and of its debug
+# crops. Low levels encode several times faster for slightly larger files (still lossless).
+ARCHIVE_PNG_COMPRESSION = 1
+
+# Debug artifacts (panel crops, subsections, OCR text) of auto_capture and manual_capture,
+# written by a background thread
+# 'always' = every capture, 'on_failure' = only captures that fail validation (plus the
+# DEBUG_RING_SIZE successful captures before each failure), 'off' = none
+# The ring is per process: with PHASE2_WORKERS > 1 every auto_capture worker keeps its own, so a
+# failure brings out the captures that worker processed before it, not the preceding input lines.
+# Ring contents that no failure follows are dropped when the run ends.
+DEBUG_ARTIFACTS = 'always'
+DEBUG_RING_SIZE = 8
+DEBUG_WRITER_MAX_PENDING = 32  # Captures queued for writing before capture waits
+
+# Continuous monitoring: skip OCR while the system name and status areas are unchanged
+MONITOR_CHANGE_DETECTION = True
+MONITOR_CHANGE_THRESHOLD = 12  # Gray levels any downsampled cell may differ by and still count as unchanged
+
+# Continuous monitoring: drop frames without the Powerplay panel (galaxy map, other UI) before OCR
+# by checking the "POWERPLAY INFORMATION" header area. The header template is learned from the
+# first valid frames of a session, or loaded from the file built with tests/build_panel_header.py
+MONITOR_PANEL_CHECK = True
+PANEL_HEADER_TEMPLATE_PATH = 'panel_header.npz'
+PANEL_HEADER_MIN_CORRELATION = 0.8  # Normalized cross-correlation with the header template
+PANEL_HEADER_MIN_CONTRAST = 10  # Gray-level standard deviation below which the header area is blank
+
+# Continuous monitoring: OCR threads behind the capture timer. A frame still waiting for a free
+# thread is replaced by the next capture, so a slow OCR never delays capturing.
+MONITOR_OCR_WORKERS = 2
+
 # Galaxy Map Search Field Coordinates (for auto_capture.py)
 SEARCH_FIELD_X = 2700
 SEARCH_FIELD_Y = 168
@@ -0,0 +1,251 @@
+"""
+Background writer for PowerplayParser debug artifacts
+Panel crops, subsection images and OCR text files are encoded and written by a
+worker thread, so captures don't wait for PNG encoding. In 'on_failure' mode the
+artifacts of successful captures are only kept in a small in-memory ring buffer
+and reach the disk only if a failed capture follows.
+"""
+
+# Standard library imports
+import atexit
+import functools
+import os
+import queue
+import threading
+from collections import deque
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Local imports
+import config
+import tracing
+
+
+class DebugWriter:
+    """
+    Bounded queue of debug artifacts written by a background thread
+
+    An artifact is a (path, payload) pair. The payload is a NumPy image (saved as
+    PNG), a string (saved as UTF-8 text) or a zero-argument callable returning one
+    of them - callables are only evaluated if the artifact is actually written.
+    """
+
+    def __init__(self, mode='always', max_pending=32, ring_size=8, png_compression=1):
+        """
+        Args:
+            mode: 'always' (write every capture) or 'on_failure' (only failed captures and the
+                  ring_size captures before each of them)
+            max_pending: Captures queued for writing before submit() blocks
+            ring_size: Successful captures kept in memory in 'on_failure' mode
+            png_compression: PNG compression level (0-9)
+        """
+        if mode not in ('always', 'on_failure'):
+            raise ValueError(f"Unknown debug writer mode: {mode}")
+        self.mode = mode
+        self.png_compression = png_compression
+        self.written = 0
+        self.errors = 0
+        self._ring = deque(maxlen=ring_size)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='debug-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, artifacts, failed=False):
+        """
+        Hand over the debug artifacts of one capture
+
+        Args:
+            artifacts: List of (path, payload) pairs
+            failed: True if the capture could not be parsed (always written)
+        """
+        if self.mode == 'on_failure' and not failed:
+            self._ring.append(artifacts)
+            return
+
+        # A failure also brings out the captures that preceded it
+        while self._ring:
+            self._queue.put(self._ring.popleft())
+        self._queue.put(artifacts)
+
+    def flush(self):
+        """Wait until every queued artifact has been written"""
+        self._queue.join()
+
+    def close(self):
+        """Write everything still queued and stop the thread (ring buffer contents are dropped)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            artifacts = self._queue.get()
+            if artifacts is None:
+                self._queue.task_done()
+                return
+            for path, payload in artifacts:
+                try:
+                    self._write(path, payload)
+                    self.written += 1
+                except Exception as e:
+                    self.errors += 1
+                    print(f"Warning: Could not write debug artifact {path}: {e}")
+            self._queue.task_done()
+
+    def _write(self, path, payload):
+        if callable(payload):
+            payload = payload()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if isinstance(payload, np.ndarray):
+            if not cv2.imwrite(path, payload, [cv2.IMWRITE_PNG_COMPRESSION, self.png_compression]):
+                raise Exception("PNG encoding failed")
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+
+
+_writer = None
+_writer_pid = None
+_writer_lock = threading.Lock()
+
+
+def get_debug_writer():
+    """
+    Get the process-wide debug writer, creating it on first use (see config.DEBUG_ARTIFACTS)
+
+    The writer is flushed at interpreter exit. Pool worker processes must call
+    close() themselves (e.g. via multiprocessing.util.Finalize). Every process has
+    its own writer and therefore its own 'on_failure' ring.
+
+    Returns:
+        DebugWriter instance, or None if config.DEBUG_ARTIFACTS is 'off'
+    """
+    global _writer, _writer_pid
+
+    if config.DEBUG_ARTIFACTS == 'off':
+        return None
+
+    with _writer_lock:
+        # A forked child inherits the parent's writer object but not its thread
+        if _writer is None or _writer_pid != os.getpid():
+            _writer = DebugWriter(config.DEBUG_ARTIFACTS, config.DEBUG_WRITER_MAX_PENDING,
+                                  config.DEBUG_RING_SIZE, config.ARCHIVE_PNG_COMPRESSION)
+            _writer_pid = os.getpid()
+            atexit.register(_writer.close)
+
+    return _writer
+
+
+def capture_artifacts(ocr, screenshot, info, debug_dir, index, title):
+    """
+    Debug artifacts of one capture: panel crop, subsections and OCR text
+
+    The OCR text is a callable, so it is only formatted if the writer actually writes it.
+
+    Args:
+        ocr: PowerplayOCR instance
+        screenshot: ScreenshotContext of the capture
+        info: Extracted powerplay information
+        debug_dir: Output directory (cropped/, subsections/ and ocr_text/ are created below it)
+        index: Capture number used in the file names
+        title: Heading of the OCR text file, e.g. "CAPTURE #3 - LTT 970"
+
+    Returns:
+        Tuple of (list of (path, payload) artifacts, True if the capture failed validation)
+    """
+    is_competitive = 'powers' in info and info['powers']
+
+    # Cropped panel
+    artifacts = [(os.path.join(debug_dir, 'cropped', f'capture_{index:03d}.png'),
+                  screenshot.panel(extended=is_competitive))]
+
+    # Subsections
+    if is_competitive:
+        subsections = ocr.crop_powerplay_subsections_competitive(screenshot, as_array=True)
+    else:
+        subsections = ocr.crop_powerplay_subsections(screenshot, as_array=True)
+    for section_name, section_img in subsections.items():
+        artifacts.append((os.path.join(debug_dir, 'subsections', f'capture_{index:03d}_{section_name}.png'),
+                          section_img))
+
+    # OCR text
+    failed = not ocr.is_valid_powerplay_data(info)
+    artifacts.append((os.path.join(debug_dir, 'ocr_text', f'capture_{index:03d}.txt'),
+                      functools.partial(format_debug_text, ocr, screenshot, info, title, failed)))
+    return artifacts, failed
+
+
+@tracing.traced()
+def format_debug_text(ocr, screenshot, info, title, failed=False):
+    """
+    Field OCR text and parsed fields of one capture, as written to the ocr_text debug files
+
+    The text each field read is reused from the extraction; the extra full-panel OCR pass
+    only runs for captures that failed validation.
+
+    Args:
+        ocr: PowerplayOCR instance
+        screenshot: ScreenshotContext of the capture
+        info: Extracted powerplay information
+        title: Heading line
+        failed: True if the capture failed validation (adds the raw OCR text)
+
+    Returns:
+        Text of the debug file
+    """
+    lines = [
+        "=" * 80,
+        title,
+        "=" * 80,
+        "",
+        "FIELD OCR TEXT:",
+        "-" * 80,
+    ]
+    for field, text in info.get('_ocr_fields', {}).items():
+        lines.append(f"  {field}: {' | '.join(text.splitlines())}")
+    lines.append("-" * 80)
+    lines.append("")
+
+    if failed:
+        lines.extend([
+            "RAW OCR TEXT:",
+            "-" * 80,
+            ocr.raw_text(screenshot),
+            "-" * 80,
+            "",
+        ])
+
+    lines.extend([
+        "PARSED DATA:",
+        f"  System Name: '{info['system_name']}'",
+        f"  Controlling Power: '{info['controlling_power']}'",
+        f"  Opposing Power: '{info['opposing_power']}'",
+        f"  System Status: '{info['system_status']}'",
+    ])
+    initial_cp = info.get('initial_control_points', -1)
+    if initial_cp >= 0:
+        lines.append(f"  Initial Control Points: {initial_cp:,}")
+    lines.append(f"  Undermining Points: {info['undermining_points']}")
+    lines.append(f"  Reinforcing Points: {info['reinforcing_points']}")
+
+    # Add voting details if available (shows OCR accuracy)
+    if '_undermining_votes' in info:
+        lines.append("")
+        lines.append("  OCR Voting Results (Undermining):")
+        lines.append(f"    Votes: {info['_undermining_votes']}")
+        lines.append(f"    Winner: {info['_undermining_winner']}")
+    if '_reinforcing_votes' in info:
+        lines.append("  OCR Voting Results (Reinforcing):")
+        lines.append(f"    Votes: {info['_reinforcing_votes']}")
+        lines.append(f"    Winner: {info['_reinforcing_winner']}")
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,180 @@
+"""
+Template-matching number reader for PowerplayParser
+Control point and score fields use one fixed game font, so their digits can be
+classified against a learned template bank instead of running Tesseract
+"""
+
+# Standard library imports
+import re
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Local imports
+from template_matching import TemplateBank, binarize_text
+
+NUMERIC_CHARS = set('0123456789,')
+NUMBER_PATTERN = re.compile(r'^(\d{1,3}(?:,\d{3})+|\d+)$')
+
+
+class DigitRecognizer:
+    """
+    Reads numbers from a field crop by segmenting glyphs with a column projection
+    and matching each glyph against a TemplateBank of the game font
+
+    read_numbers() returns None whenever it is not confident, so callers can
+    fall back to Tesseract.
+    """
+
+    GLYPH_SIZE = (12, 16)  # (width, height) every glyph is normalized to
+
+    def __init__(self, bank=None, min_confidence=0.85):
+        """
+        Args:
+            bank: TemplateBank of glyphs (a new empty bank if None)
+            min_confidence: Minimum NCC score for every glyph of a number
+        """
+        self.bank = bank if bank is not None else TemplateBank(self.GLYPH_SIZE)
+        self.min_confidence = min_confidence
+
+    @classmethod
+    def load(cls, path, min_confidence=0.85):
+        """
+        Load a recognizer from a template file built by tests/build_digit_templates.py
+
+        Args:
+            path: .npz template file
+            min_confidence: Minimum NCC score for every glyph of a number
+
+        Returns:
+            DigitRecognizer, or None if the template file does not exist
+        """
+        bank = TemplateBank.load(path)
+        if bank is None:
+            return None
+        return cls(bank, min_confidence)
+
+    def save(self, path):
+        """
+        Save the template bank
+
+        Args:
+            path: Output .npz file
+        """
+        self.bank.save(path)
+
+    @staticmethod
+    def binarize(section_img):
+        """
+        Convert a field crop to a binary image with text = 1
+
+        Args:
+            section_img: NumPy array (BGR or grayscale)
+
+        Returns:
+            2D uint8 array of 0/1
+        """
+        return binarize_text(section_img)
+
+    def segment(self, section_img):
+        """
+        Split a field crop into words of glyph patches
+
+        Glyphs are runs of non-empty columns; a gap more than twice the typical
+        inter-glyph gap starts a new word.
+
+        Args:
+            section_img: NumPy array (BGR or grayscale)
+
+        Returns:
+            List of words, each a list of 2D glyph patches (uint8 0/1)
+        """
+        binary = self.binarize(section_img)
+
+        rows = np.flatnonzero(binary.any(axis=1))
+        if rows.size == 0:
+            return []
+        top, bottom = rows[0], rows[-1] + 1
+
+        # Column runs of text pixels = glyph candidates
+        columns = binary[top:bottom].any(axis=0).astype(np.int8)
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], columns, [0]])))
+        runs = list(zip(edges[::2], edges[1::2]))
+
+        # Spaces are much wider than the gaps inside a word
+        gaps = [x0 - end for (_, end), (x0, _) in zip(runs, runs[1:])]
+        word_gap = max(3, 2 * int(np.median(gaps))) if gaps else 0
+
+        words = []
+        previous_end = None
+        for x0, x1 in runs:
+            if previous_end is None or x0 - previous_end > word_gap:
+                words.append([])
+            # Glyphs keep the full line height so commas stay distinguishable by position
+            words[-1].append(self._square(binary[top:bottom, x0:x1]))
+            previous_end = x1
+
+        return words
+
+    @staticmethod
+    def _square(glyph):
+        """Pad a glyph horizontally to at least a square so narrow glyphs keep their shape"""
+        height, width = glyph.shape
+        if width >= height:
+            return glyph
+        pad = height - width
+        return cv2.copyMakeBorder(glyph, 0, 0, pad // 2, pad - pad // 2, cv2.BORDER_CONSTANT, value=0)
+
+    def read_numbers(self, section_img):
+        """
+        Read all numbers in a field crop
+
+        Words containing non-numeric glyphs (e.g. "CONTROL POINTS") are skipped.
+
+        Args:
+            section_img: NumPy array (BGR or grayscale)
+
+        Returns:
+            List of ints in left-to-right order, or None if the bank is empty or
+            any numeric glyph is below min_confidence
+        """
+        if not len(self.bank):
+            return None
+
+        words = self.segment(section_img)
+        matches = iter(self.bank.match_many([glyph for word in words for glyph in word]))
+
+        numbers = []
+        for word in words:
+            labels, scores = zip(*[next(matches) for _ in word])
+
+            if not all(label in NUMERIC_CHARS for label in labels):
+                continue
+
+            text = ''.join(labels)
+            if min(scores) < self.min_confidence or not NUMBER_PATTERN.match(text):
+                return None
+            numbers.append(int(text.replace(',', '')))
+
+        return numbers
+
+    def learn(self, section_img, text):
+        """
+        Add the glyphs of a field crop to the bank using its known text
+
+        Args:
+            section_img: NumPy array (BGR or grayscale)
+            text: Text shown in the crop (whitespace is ignored)
+
+        Returns:
+            True if the glyph count matched the text and the glyphs were added
+        """
+        chars = [c for c in text if not c.isspace()]
+        glyphs = [glyph for word in self.segment(section_img) for glyph in word]
+        if not chars or len(glyphs) != len(chars):
+            return False
+
+        for char, glyph in zip(chars, glyphs):
+            self.bank.add(char, glyph)
+        return True
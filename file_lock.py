@@ -0,0 +1,73 @@
+"""
+Cross-process file lock for PowerplayParser
+Guards the read-merge-replace of files several processes save to (OCR cache,
+system lexicon), using only an exclusively created lock file so it works the
+same on Windows and POSIX
+"""
+
+# Standard library imports
+import os
+import time
+
+
+class FileLock:
+    """
+    Lock held by whoever created the lock file; released by deleting it
+
+    A lock file older than stale_after seconds is assumed to be left over from a
+    crashed process and is taken over.
+    """
+
+    def __init__(self, path, timeout=10.0, stale_after=30.0, poll_interval=0.02):
+        """
+        Args:
+            path: Lock file path (e.g. the guarded file plus '.lock')
+            timeout: Seconds to wait for the lock before acquire() raises TimeoutError
+            stale_after: Age in seconds after which an existing lock file is ignored
+            poll_interval: Seconds between attempts while another process holds the lock
+        """
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+
+    def acquire(self):
+        """
+        Wait for the lock
+
+        Raises:
+            TimeoutError: If the lock is still held by another process after timeout seconds
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except (FileExistsError, PermissionError):
+                # PermissionError: Windows reports a lock file that is being deleted this way
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue  # Released meanwhile - try again right away
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Could not lock {self.path} within {self.timeout}s")
+                time.sleep(self.poll_interval)
+            else:
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return
+
+    def release(self):
+        """Release the lock"""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
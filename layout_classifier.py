@@ -0,0 +1,162 @@
+"""
+Pixel-signature layout classifier for PowerplayParser
+Decides between the standard panel (tug-of-war bar) and the competitive panel
+(ranked power rows) from cheap pixel statistics instead of OCR'ing the status text
+"""
+
+# Standard library imports
+import json
+import os
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Probe regions on the extended panel (742×840) - the standard panel shares its origin
+LAYOUT_PROBES = {
+    'bar': (16, 568, 735, 609),                 # Standard: tug-of-war bar
+    'control_points': (70, 446, 672, 474),      # Standard: control point numbers
+    'controlling_power': (528, 360, 714, 410),  # Standard: controlling power name
+    'row_1st': (106, 330, 412, 360),            # Competitive: 1st power row
+    'row_2nd': (106, 464, 412, 494),            # Competitive: 2nd power row
+    'row_your': (106, 692, 412, 722),           # Competitive: your power row
+}
+
+LAYOUTS = ('standard', 'competitive')
+
+
+def layout_features(extended_panel):
+    """
+    Compute the pixel signature of an extended panel crop
+
+    For every probe region: mean and standard deviation of brightness, mean
+    saturation and the fraction of bright pixels (all scaled to 0..1).
+
+    Args:
+        extended_panel: Extended panel crop as NumPy array (BGR)
+
+    Returns:
+        1D float32 feature vector, or None if the crop is too small to hold all probes
+    """
+    height, width = extended_panel.shape[:2]
+    width_scale = width / 742
+    height_scale = height / 840
+    if height_scale < 0.95:
+        # Standard-height crop - the competitive rows are not part of the image
+        return None
+
+    features = []
+    for left, top, right, bottom in LAYOUT_PROBES.values():
+        # Every second pixel is plenty for region statistics
+        region = extended_panel[int(top * height_scale):int(bottom * height_scale):2,
+                                int(left * width_scale):int(right * width_scale):2]
+        hsv = cv2.cvtColor(np.ascontiguousarray(region), cv2.COLOR_BGR2HSV)
+        value = hsv[:, :, 2]
+        mean, std = cv2.meanStdDev(value)
+        features.extend([
+            mean[0, 0] / 255,
+            std[0, 0] / 255,
+            cv2.mean(hsv[:, :, 1])[0] / 255,
+            np.count_nonzero(value > 200) / value.size,
+        ])
+    return np.array(features, dtype=np.float32)
+
+
+class LayoutClassifier:
+    """
+    Nearest-centroid classifier over layout_features() signatures
+
+    Each layout keeps running sums of its labelled signatures. Distances are
+    measured in units of the pooled per-feature standard deviation.
+    """
+
+    def __init__(self, min_std=0.02, max_distance=4.0):
+        """
+        Args:
+            min_std: Floor for the per-feature standard deviation
+            max_distance: Frames farther than this from the nearest layout get confidence 0
+        """
+        self.min_std = min_std
+        self.max_distance = max_distance
+        self._stats = {}  # layout -> [count, sum, sum of squares]
+
+    def learn(self, features, layout):
+        """
+        Add a labelled signature
+
+        Args:
+            features: Vector from layout_features()
+            layout: 'standard' or 'competitive'
+        """
+        features = np.asarray(features, dtype=np.float64)
+        stats = self._stats.setdefault(layout, [0, np.zeros_like(features), np.zeros_like(features)])
+        stats[0] += 1
+        stats[1] += features
+        stats[2] += features ** 2
+
+    @property
+    def trained(self):
+        """True once every layout has at least one signature"""
+        return all(layout in self._stats for layout in LAYOUTS)
+
+    def classify(self, features):
+        """
+        Classify a signature
+
+        Args:
+            features: Vector from layout_features()
+
+        Returns:
+            Tuple of (layout, confidence) where confidence is in 0..1, or (None, 0.0)
+            if the classifier is not trained
+        """
+        if features is None or not self.trained:
+            return None, 0.0
+
+        total = sum(stats[0] for stats in self._stats.values())
+        pooled_var = sum(stats[2] - stats[1] ** 2 / stats[0] for stats in self._stats.values()) / total
+        std = np.maximum(np.sqrt(np.maximum(pooled_var, 0)), self.min_std)
+
+        distances = {}
+        for layout, (count, total_sum, _) in self._stats.items():
+            distances[layout] = float(np.sqrt(np.mean(((features - total_sum / count) / std) ** 2)))
+
+        best, runner_up = sorted(distances, key=distances.get)[:2]
+        if distances[best] > self.max_distance:
+            return best, 0.0
+        # 1.0 when the frame sits on the best centroid, 0.0 when it is halfway between both
+        confidence = 1.0 - distances[best] / max(distances[runner_up], 1e-9)
+        return best, confidence
+
+    def save(self, path):
+        """
+        Save the layout statistics to a JSON file
+
+        Args:
+            path: Output file path
+        """
+        data = {layout: {'count': stats[0], 'sum': stats[1].tolist(), 'sum_sq': stats[2].tolist()}
+                for layout, stats in self._stats.items()}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """
+        Load layout statistics saved with save()
+
+        Args:
+            path: JSON file path
+            **kwargs: Passed to the constructor
+
+        Returns:
+            LayoutClassifier, or None if the file does not exist
+        """
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        classifier = cls(**kwargs)
+        for layout, stats in data.items():
+            classifier._stats[layout] = [stats['count'], np.array(stats['sum']), np.array(stats['sum_sq'])]
+        return classifier
@@ -6,7 +6,6 @@ Press ESC to exit
 """
 
 # Standard library imports
-import os
 import time
 
 # Third-party imports
@@ -14,6 +13,8 @@ import keyboard
 import winsound
 
 # Local imports
+import config
+from debug_writer import capture_artifacts, get_debug_writer
 from powerplay_ocr import PowerplayOCR
 
 def play_success_sound():
@@ -54,11 +55,6 @@ if __name__ == "__main__":
     collected_systems = {}
     capture_count = 0
 
-    # Create directories for debug output
-    os.makedirs('live_demo_debug/cropped', exist_ok=True)
-    os.makedirs('live_demo_debug/ocr_text', exist_ok=True)
-    os.makedirs('live_demo_debug/subsections', exist_ok=True)
-
     # Initialize output file with header
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write("System Name\tPower\tState\t\tUndermining\tReinforcement\n")
@@ -79,52 +75,28 @@ if __name__ == "__main__":
         print(f"\n[{time.strftime('%H:%M:%S')}] Capture #{capture_count} - Processing...")
 
         try:
-            # Take screenshot
-            screenshot_path = ocr.take_screenshot()
+            # Grab the frame into memory - it is only encoded and written if the capture fails
+            ocr.capture.next_frame()
+            screenshot = ocr.capture_screenshot(save=False, panel_only=config.CAPTURE_PANEL_ONLY)
 
             # Extract and parse using auto-detection (handles all state types)
-            info = ocr.extract_powerplay_auto(screenshot_path)
-
-            # Also get raw text for debug output
-            text = ocr.extract_text(screenshot_path, preprocess_method='upscale', crop_panel=False, use_subsections=False)
+            info = ocr.extract_powerplay_auto(screenshot)
 
             # Determine if this is a competitive state
             is_competitive = 'powers' in info and info['powers']
 
-            # Save cropped panel for verification
-            if is_competitive:
-                cropped_img = ocr.crop_powerplay_panel(screenshot_path, extended=True)
-            else:
-                cropped_img = ocr.crop_powerplay_panel(screenshot_path, extended=False)
-            cropped_path = f"live_demo_debug/cropped/capture_{capture_count:03d}.png"
-            cropped_img.save(cropped_path)
-
-            # Save subsections for debugging
-            if is_competitive:
-                subsections = ocr.crop_powerplay_subsections_competitive(screenshot_path)
-            else:
-                subsections = ocr.crop_powerplay_subsections(screenshot_path)
-            for section_name, section_img in subsections.items():
-                subsection_path = f"live_demo_debug/subsections/capture_{capture_count:03d}_{section_name}.png"
-                section_img.save(subsection_path)
-
-            # Save OCR text for verification
-            ocr_text_path = f"live_demo_debug/ocr_text/capture_{capture_count:03d}.txt"
-            with open(ocr_text_path, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write(f"CAPTURE #{capture_count}\n")
-                f.write("=" * 80 + "\n\n")
-                f.write("RAW OCR TEXT:\n")
-                f.write("-" * 80 + "\n")
-                f.write(text)
-                f.write("\n" + "-" * 80 + "\n\n")
-                f.write("PARSED DATA:\n")
-                f.write(f"  System Name: '{info['system_name']}'\n")
-                f.write(f"  Controlling Power: '{info['controlling_power']}'\n")
-                f.write(f"  Opposing Power: '{info['opposing_power']}'\n")
-                f.write(f"  System Status: '{info['system_status']}'\n")
-                f.write(f"  Undermining Points: {info['undermining_points']}\n")
-                f.write(f"  Reinforcing Points: {info['reinforcing_points']}\n")
+            # Queue debug output (cropped panel, subsections, OCR text) for the background writer
+            debug_writer = get_debug_writer()
+            if debug_writer:
+                artifacts, failed = capture_artifacts(ocr, screenshot, info, 'live_demo_debug', capture_count,
+                                                      f"CAPTURE #{capture_count}")
+                if failed:
+                    # Keep the frame of a failed capture for analysis
+                    screenshot.path = ocr.screenshot_path()
+                    artifacts.append((screenshot.path, screenshot.image))
+                debug_writer.submit(artifacts, failed=failed)
+            elif not ocr.is_valid_powerplay_data(info):
+                ocr.save_screenshot(screenshot)
 
             # Check if valid
             if ocr.is_valid_powerplay_data(info):
@@ -153,26 +125,17 @@ if __name__ == "__main__":
 
                     # Auto-accept valid data (no confirmation needed)
                     collected_systems[system_name] = info
+                    if ocr.system_lexicon is not None:
+                        ocr.system_lexicon.add(system_name)
                     print("\n  [OK] AUTO-ACCEPTED - Data saved!")
                     play_success_sound()
 
                     # Save to file immediately
                     save_to_file()
                     print(f"  Total systems: {len(collected_systems)}")
-
-                    # Delete original screenshot (keep cropped for debug)
-                    try:
-                        os.remove(screenshot_path)
-                    except:
-                        pass
                 else:
                     print(f"\n  [WARN] DUPLICATE: {system_name} (already captured)")
                     play_error_sound()
-                    # Delete screenshots for duplicates
-                    try:
-                        os.remove(screenshot_path)
-                    except:
-                        pass
             else:
                 # Invalid parse
                 missing = []
@@ -188,8 +151,9 @@ if __name__ == "__main__":
                     missing.append("Reinf")
 
                 print(f"\n  [X] INVALID: Missing {', '.join(missing)}")
-                print(f"  Debug saved: {cropped_path}, {ocr_text_path}")
-                print(f"  Screenshot: {screenshot_path}")
+                if debug_writer:
+                    print(f"  Debug saved: live_demo_debug/*/capture_{capture_count:03d}*")
+                print(f"  Screenshot: {screenshot.path}")
                 play_error_sound()
 
         except Exception as e:
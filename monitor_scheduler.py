@@ -0,0 +1,134 @@
+"""
+Event-driven scheduler for PowerplayParser continuous monitoring
+A timer thread grabs a frame every interval while monitoring is active and hands
+it to OCR worker threads through a single-frame slot. A frame still waiting when
+the next one arrives is replaced (latest frame wins), so a slow OCR never delays
+the next capture. While monitoring is stopped every thread blocks on a condition
+variable and uses no CPU.
+"""
+
+# Standard library imports
+import threading
+import time
+
+
+class MonitorScheduler:
+    """
+    Timer-driven capture with a latest-frame-wins hand-off to a pool of worker threads
+
+    capture() runs on the timer thread and returns the frame to process, or None if
+    there is nothing new to read. process(frame) runs on a worker thread.
+    """
+
+    def __init__(self, capture, process, interval, workers=1):
+        """
+        Args:
+            capture: Zero-argument callable returning a frame or None
+            process: Callable taking one frame
+            interval: Seconds between the starts of two captures
+            workers: Number of worker threads running process()
+        """
+        self.capture = capture
+        self.process = process
+        self.interval = interval
+        self.submitted = 0  # Frames handed to the workers
+        self.dropped = 0    # Frames replaced by a newer one before a worker picked them up
+        self._active = False
+        self._closed = False
+        self._generation = 0  # Bumped on every start/stop, wakes the timer early
+        self._pending = None
+        self._condition = threading.Condition()
+
+        self._threads = [threading.Thread(target=self._run_timer, name='monitor-timer', daemon=True)]
+        self._threads += [threading.Thread(target=self._run_worker, name=f'monitor-worker-{index}', daemon=True)
+                          for index in range(max(1, workers))]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def active(self):
+        """True while frames are being captured"""
+        return self._active
+
+    def start(self):
+        """Start capturing (the first frame is grabbed immediately)"""
+        self._set_active(True)
+
+    def stop(self):
+        """Stop capturing (a frame already handed over is still processed)"""
+        self._set_active(False)
+
+    def toggle(self):
+        """
+        Start or stop capturing
+
+        Returns:
+            True if capturing is now active
+        """
+        with self._condition:
+            self._set_active(not self._active)
+            return self._active
+
+    def _set_active(self, active):
+        with self._condition:
+            if self._closed or self._active == active:
+                return
+            self._active = active
+            self._generation += 1
+            self._condition.notify_all()
+
+    def close(self):
+        """Stop the timer, let the workers finish the pending frame and wait for all threads"""
+        with self._condition:
+            self._closed = True
+            self._active = False
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def _run_timer(self):
+        while True:
+            with self._condition:
+                # No timeout - an idle monitor sleeps until start() or close()
+                self._condition.wait_for(lambda: self._active or self._closed)
+                if self._closed:
+                    return
+                generation = self._generation
+
+            started = time.monotonic()
+            self._capture_frame()
+
+            with self._condition:
+                # Wait out the rest of the interval; stop(), start() and close() end the wait early
+                self._condition.wait_for(lambda: self._closed or self._generation != generation,
+                                         timeout=max(0.0, started + self.interval - time.monotonic()))
+
+    def _capture_frame(self):
+        try:
+            frame = self.capture()
+        except Exception as e:
+            print(f"Warning: Capture failed: {e}")
+            return
+        if frame is None:
+            return
+
+        with self._condition:
+            if self._closed:
+                return
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = frame
+            self.submitted += 1
+            self._condition.notify_all()
+
+    def _run_worker(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                frame, self._pending = self._pending, None
+            try:
+                self.process(frame)
+            except Exception as e:
+                print(f"Warning: Processing failed: {e}")
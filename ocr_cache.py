@@ -0,0 +1,182 @@
+"""
+Persistent OCR result cache for PowerplayParser
+Keyed by a hash of the subsection pixels plus the preprocessing/OCR settings,
+so pixel-identical fields (power names, status words, rank labels) skip Tesseract
+"""
+
+# Standard library imports
+import atexit
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+# Third-party imports
+import numpy as np
+
+# Local imports
+import config
+from file_lock import FileLock
+
+
+class OCRCache:
+    """
+    Size-bounded LRU cache of OCR results, optionally persisted to a JSON file
+
+    Several processes (e.g. Phase 2 workers) may share one cache file. Each
+    process keeps its own in-memory copy and merges it with the file on save,
+    under a lock file so concurrent saves don't lose each other's entries.
+    """
+
+    FILE_VERSION = 1
+
+    def __init__(self, path=None, max_entries=20000):
+        """
+        Args:
+            path: JSON file to load from and save to (None = in-memory only)
+            max_entries: Maximum number of cached results (least recently used are evicted)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self._entries.update(self._read_file())
+            self._trim()
+
+    @staticmethod
+    def make_key(image, *settings):
+        """
+        Build a cache key from image pixels and the settings used to OCR them
+
+        Args:
+            image: NumPy array (the raw subsection crop)
+            *settings: Anything else that affects the result (preprocess method, config string, engine)
+
+        Returns:
+            Hex digest string
+        """
+        image = np.ascontiguousarray(image)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{image.shape}|{image.dtype}|{settings!r}".encode('utf-8'))
+        digest.update(image.data)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Look up a cached result
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Store a result, evicting the least recently used entries beyond max_entries
+
+        Args:
+            key: Key from make_key()
+            value: JSON-serializable result
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._trim()
+            self._dirty = True
+
+    def _trim(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_file(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if data.get('version') != self.FILE_VERSION:
+            return []
+        return [(key, value) for key, value in data.get('entries', [])]
+
+    def save(self):
+        """Write the cache to disk (merged with entries other processes saved meanwhile)"""
+        if not self.path:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            try:
+                # Other processes must not save between our read and our replace
+                with FileLock(f"{self.path}.lock"):
+                    # Entries on disk first, so our (more recent) entries win and stay at the LRU tail
+                    merged = OrderedDict(self._read_file())
+                    for key, value in self._entries.items():
+                        merged.pop(key, None)
+                        merged[key] = value
+                    while len(merged) > self.max_entries:
+                        merged.popitem(last=False)
+
+                    tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump({'version': self.FILE_VERSION, 'entries': list(merged.items())}, f)
+                    os.replace(tmp_path, self.path)
+            except TimeoutError as e:
+                print(f"Warning: OCR cache not saved: {e}")
+                return
+            self._dirty = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups served from the cache (0.0 if nothing was looked up yet)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats_summary(self):
+        """One-line summary of cache effectiveness"""
+        return (f"OCR cache: {self.hits} hits / {self.misses} misses "
+                f"({self.hit_rate:.1%} hit rate), {len(self)} entries")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_ocr_cache():
+    """
+    Get the process-wide OCR cache, creating it on first use
+
+    Returns:
+        OCRCache instance, or None if config.OCR_CACHE_ENABLED is False
+    """
+    global _cache
+
+    if not config.OCR_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = OCRCache(config.OCR_CACHE_PATH, config.OCR_CACHE_MAX_ENTRIES)
+            atexit.register(_cache.save)
+
+    return _cache
@@ -0,0 +1,297 @@
+"""
+OCR engine abstraction for PowerplayParser
+Keeps one initialized Tesseract instance alive per process instead of
+launching a new tesseract subprocess for every field
+"""
+
+# Standard library imports
+import threading
+
+# Third-party imports
+import pytesseract
+from PIL import Image
+
+# Local imports
+import config
+
+
+def parse_tesseract_config(config_string):
+    """
+    Split a pytesseract-style config string into its components
+
+    Args:
+        config_string: e.g. '--oem 3 --psm 7 --dpi 300 -c tessedit_char_whitelist=0123456789, '
+
+    Returns:
+        Tuple of (oem, psm, dpi, variables) where variables is a dict of -c settings
+    """
+    oem = 3
+    psm = 3
+    dpi = None
+    variables = {}
+
+    tokens = config_string.split() if config_string else []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == '--oem' and i + 1 < len(tokens):
+            oem = int(tokens[i + 1])
+            i += 2
+        elif token == '--psm' and i + 1 < len(tokens):
+            psm = int(tokens[i + 1])
+            i += 2
+        elif token == '--dpi' and i + 1 < len(tokens):
+            dpi = int(tokens[i + 1])
+            i += 2
+        elif token == '-c' and i + 1 < len(tokens):
+            name, _, value = tokens[i + 1].partition('=')
+            variables[name] = value
+            i += 2
+        else:
+            i += 1
+
+    return oem, psm, dpi, variables
+
+
+TSV_COLUMNS = ['level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+               'left', 'top', 'width', 'height', 'conf', 'text']
+
+
+def parse_tsv(tsv):
+    """
+    Convert Tesseract TSV output into pytesseract's image_to_data dict layout
+
+    Args:
+        tsv: TSV text (with or without the header row)
+
+    Returns:
+        Dict mapping column name to a list of values
+    """
+    data = {column: [] for column in TSV_COLUMNS}
+
+    for row in tsv.splitlines():
+        fields = row.split('\t')
+        if len(fields) < len(TSV_COLUMNS) - 1 or fields[0] == 'level':
+            continue
+        fields += [''] * (len(TSV_COLUMNS) - len(fields))
+        for column, value in zip(TSV_COLUMNS, fields):
+            if column == 'text':
+                data[column].append(value)
+            elif column == 'conf':
+                data[column].append(float(value))
+            else:
+                data[column].append(int(value))
+
+    return data
+
+
+def data_to_text(data, indices=None):
+    """
+    Rebuild text and an overall confidence from image_to_data output
+
+    Args:
+        data: Dict returned by an engine's image_to_data()
+        indices: Word indices to use (None = all)
+
+    Returns:
+        Tuple of (text, confidence) where confidence is the mean word confidence
+        (0-100, 0.0 if no words were recognized)
+    """
+    if indices is None:
+        indices = range(len(data['text']))
+
+    # Tesseract returns words in reading order - group them into lines
+    lines = {}
+    confidences = []
+    for i in indices:
+        word = data['text'][i].strip()
+        if not word:
+            continue
+        lines.setdefault((data['block_num'][i], data['par_num'][i], data['line_num'][i]), []).append(word)
+        confidence = float(data['conf'][i])
+        if confidence >= 0:
+            confidences.append(confidence)
+
+    text = '\n'.join(' '.join(words) for words in lines.values())
+    return text, (sum(confidences) / len(confidences) if confidences else 0.0)
+
+
+class PytesseractEngine:
+    """
+    Fallback engine that shells out to the tesseract executable via pytesseract
+    Every call starts a new process, so this is only used when tesserocr is not installed
+    """
+
+    name = 'pytesseract'
+
+    def __init__(self, tesseract_path=None):
+        if tesseract_path:
+            pytesseract.pytesseract.tesseract_cmd = tesseract_path
+
+    def image_to_string(self, image, config=''):
+        """
+        Run OCR on an image
+
+        Args:
+            image: PIL Image or NumPy array
+            config: Tesseract config string (same format as pytesseract)
+
+        Returns:
+            Recognized text
+        """
+        return pytesseract.image_to_string(image, config=config)
+
+    def image_to_data(self, image, config=''):
+        """
+        Run OCR on an image and return word-level boxes
+
+        Args:
+            image: PIL Image or NumPy array
+            config: Tesseract config string (same format as pytesseract)
+
+        Returns:
+            Dict of parallel lists (same keys as pytesseract.Output.DICT)
+        """
+        return pytesseract.image_to_data(image, config=config, output_type=pytesseract.Output.DICT)
+
+    def warm_up(self):
+        """Nothing to preload - every call starts a fresh tesseract process"""
+        pass
+
+
+class TesserocrEngine:
+    """
+    In-process engine backed by tesserocr (Tesseract C++ API bindings)
+
+    One PyTessBaseAPI is created per (thread, OEM) and reused for every call.
+    Page segmentation mode, DPI and -c variables are applied per call and
+    variables are restored afterwards so they don't leak into the next field.
+    """
+
+    name = 'tesserocr'
+
+    def __init__(self, tessdata_path=None, lang='eng'):
+        import tesserocr
+        self._tesserocr = tesserocr
+        self.tessdata_path = tessdata_path
+        self.lang = lang
+        # PyTessBaseAPI is not thread-safe - keep one set of instances per thread
+        self._local = threading.local()
+
+    def _get_api(self, oem):
+        apis = getattr(self._local, 'apis', None)
+        if apis is None:
+            apis = {}
+            self._local.apis = apis
+
+        api = apis.get(oem)
+        if api is None:
+            kwargs = {'lang': self.lang, 'oem': oem}
+            if self.tessdata_path:
+                kwargs['path'] = self.tessdata_path
+            api = self._tesserocr.PyTessBaseAPI(**kwargs)
+            apis[oem] = api
+        return api
+
+    def warm_up(self, oem=3):
+        """
+        Load the Tesseract model for the calling thread ahead of the first real call
+
+        Args:
+            oem: OCR engine mode to initialize (the extractors use --oem 3)
+        """
+        self._get_api(oem)
+
+    def image_to_string(self, image, config=''):
+        """
+        Run OCR on an image using the persistent Tesseract instance
+
+        Args:
+            image: PIL Image or NumPy array
+            config: Tesseract config string (same format as pytesseract)
+
+        Returns:
+            Recognized text
+        """
+        return self._recognize(image, config, lambda api: api.GetUTF8Text())
+
+    def image_to_data(self, image, config=''):
+        """
+        Run OCR on an image and return word-level boxes
+
+        Args:
+            image: PIL Image or NumPy array
+            config: Tesseract config string (same format as pytesseract)
+
+        Returns:
+            Dict of parallel lists (same keys as pytesseract.Output.DICT)
+        """
+        return parse_tsv(self._recognize(image, config, lambda api: api.GetTSVText(0)))
+
+    def _recognize(self, image, config, read):
+        oem, psm, dpi, variables = parse_tesseract_config(config)
+        api = self._get_api(oem)
+
+        api.SetPageSegMode(psm)
+        if dpi:
+            variables = dict(variables, user_defined_dpi=str(dpi))
+        previous = {}
+        for name, value in variables.items():
+            previous[name] = api.GetVariableAsString(name)
+            api.SetVariable(name, value)
+
+        try:
+            if not isinstance(image, Image.Image):
+                image = Image.fromarray(image)
+            api.SetImage(image)
+            return read(api)
+        finally:
+            # Restore per-call variables (e.g. digit whitelist) so they don't affect the next field
+            for name, value in previous.items():
+                api.SetVariable(name, value if value is not None else '')
+            api.Clear()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine(tesseract_path=None):
+    """
+    Get the process-wide OCR engine, creating it on first use
+
+    Uses tesserocr when it is installed (and config.OCR_ENGINE allows it),
+    otherwise falls back to pytesseract.
+
+    Args:
+        tesseract_path: Path to tesseract executable (only used by the pytesseract fallback)
+
+    Returns:
+        OCR engine instance with image_to_string(image, config) and image_to_data(image, config) methods
+    """
+    global _engine
+
+    if _engine is not None:
+        if tesseract_path and isinstance(_engine, PytesseractEngine):
+            pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            preferred = getattr(config, 'OCR_ENGINE', 'auto')
+            engine = None
+
+            if preferred in ('auto', 'tesserocr'):
+                try:
+                    engine = TesserocrEngine(tessdata_path=getattr(config, 'TESSDATA_PATH', None))
+                except ImportError:
+                    if preferred == 'tesserocr':
+                        print("tesserocr not installed. Install with: pip install tesserocr")
+                    engine = None
+
+            if engine is None:
+                engine = PytesseractEngine(tesseract_path or config.TESSERACT_PATH)
+
+            _engine = engine
+
+    return _engine
@@ -0,0 +1,175 @@
+"""
+Panel presence detection for PowerplayParser
+Checks the "POWERPLAY INFORMATION" header area of a frame before any OCR is run,
+so monitoring can drop galaxy map and other UI frames in microseconds
+"""
+
+# Standard library imports
+import os
+import threading
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Local imports
+import config
+from screenshot_context import ScreenshotContext
+from template_matching import normalize_patch
+
+# Header title area as (left, top, right, bottom) in standard panel pixels (740×646).
+# Both layouts start with the same "POWERPLAY INFORMATION" title above the system name.
+HEADER_REGION = (14, 6, 424, 46)
+HEADER_SIZE = (96, 10)  # Downsampled width × height of the header patch
+
+
+def header_gray(image_path):
+    """
+    Grayscale crop of the panel header area
+
+    Only the header is converted to grayscale, so the check stays cheap on full frames.
+
+    Args:
+        image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+    Returns:
+        2D uint8 NumPy array
+    """
+    panel = ScreenshotContext.wrap(image_path).panel()
+    height, width = panel.shape[:2]
+    width_scale = width / config.PANEL_WIDTH_STANDARD
+    height_scale = height / config.PANEL_HEIGHT_STANDARD
+
+    left, top, right, bottom = HEADER_REGION
+    region = panel[int(top * height_scale):int(bottom * height_scale),
+                   int(left * width_scale):int(right * width_scale)]
+    return cv2.cvtColor(np.ascontiguousarray(region), cv2.COLOR_BGR2GRAY)
+
+
+class PanelDetector:
+    """
+    Decides whether a frame shows the Powerplay panel from its header area
+
+    A header without contrast (blank or uniformly lit UI) never holds the title. Once a
+    header template is known - loaded from a file or learned from frames that parsed as
+    valid - the header must also correlate with it. Without a template every frame with
+    enough contrast counts as present. learn() and present() may be called from different
+    threads.
+    """
+
+    def __init__(self, min_correlation=0.8, min_contrast=10.0, max_samples=8):
+        """
+        Args:
+            min_correlation: Minimum normalized cross-correlation with the header template (> 0)
+            min_contrast: Minimum standard deviation (gray levels) of the header area
+            max_samples: Headers averaged into the template before learn() stops adding more
+        """
+        self.min_correlation = min_correlation
+        self.min_contrast = min_contrast
+        self.max_samples = max_samples
+        self.samples = 0
+        self._sum = None
+        self._template = None
+        self._lock = threading.Lock()
+
+    @property
+    def trained(self):
+        """True once a header template is available"""
+        return self._template is not None
+
+    def learn(self, image_path):
+        """
+        Add the header of a frame known to show the panel to the template
+
+        Args:
+            image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+        Returns:
+            True if the header was added, False if the template is already complete
+        """
+        if self.samples >= self.max_samples:
+            return False
+
+        patch = normalize_patch(header_gray(image_path), HEADER_SIZE)
+        with self._lock:
+            if self.samples >= self.max_samples:
+                return False
+            self._sum = patch if self._sum is None else self._sum + patch
+            self.samples += 1
+            self._set_template(self._sum)
+        return True
+
+    def _set_template(self, vector):
+        norm = np.linalg.norm(vector)
+        self._template = (vector / norm).astype(np.float32) if norm > 0 else None
+
+    def score(self, image_path):
+        """
+        Correlation of a frame's header with the template
+
+        Args:
+            image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+        Returns:
+            Score in -1..1 (0.0 for a header without contrast), or None if no template is known
+        """
+        gray = header_gray(image_path)
+        if float(gray.std()) < self.min_contrast:
+            return 0.0
+        with self._lock:
+            template = self._template
+        if template is None:
+            return None
+        return float(np.dot(normalize_patch(gray, HEADER_SIZE), template))
+
+    def present(self, image_path):
+        """
+        Check whether a frame shows the Powerplay panel
+
+        Args:
+            image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+        Returns:
+            True if the header looks like the panel title
+        """
+        score = self.score(image_path)
+        if score is None:
+            return True
+        return score >= self.min_correlation
+
+    def save(self, path):
+        """
+        Save the header template
+
+        Args:
+            path: Output .npz file
+        """
+        with self._lock:
+            template, samples = self._template, self.samples
+        if template is None:
+            raise ValueError("No header template learned")
+        np.savez_compressed(path, size=np.array(HEADER_SIZE), template=template, samples=np.array(samples))
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """
+        Load a header template saved with save()
+
+        Args:
+            path: .npz file path
+            **kwargs: Passed to the constructor
+
+        Returns:
+            PanelDetector, or None if the file does not exist or was built for another patch size
+        """
+        if not path or not os.path.exists(path):
+            return None
+        data = np.load(path)
+        if tuple(int(v) for v in data['size']) != HEADER_SIZE:
+            print(f"Warning: Ignoring header template {path} (built for a different patch size)")
+            return None
+        detector = cls(**kwargs)
+        detector._set_template(data['template'].astype(np.float32))
+        # A loaded template is complete - frames seen while monitoring don't change it
+        detector.samples = max(int(data['samples']), detector.max_samples)
+        return detector
@@ -0,0 +1,105 @@
+"""
+Image-based power identification for PowerplayParser
+Power names are a closed set rendered in a fixed game font, so a power name crop
+can be matched against stored reference renders instead of OCR + fuzzy matching
+"""
+
+# Local imports
+from template_matching import TemplateBank, binarize_text, crop_to_content
+
+
+class PowerClassifier:
+    """
+    Identifies the power shown in a power name crop
+
+    The crop is binarized and trimmed to its text before matching, so the
+    result does not depend on where the name sits inside the ROI. Reference
+    renders for the standard and competitive layouts can share one bank.
+    """
+
+    PATCH_SIZE = (96, 16)  # (width, height) every name is normalized to
+
+    def __init__(self, bank=None, min_confidence=0.8, min_margin=0.05):
+        """
+        Args:
+            bank: TemplateBank of name renders (a new empty bank if None)
+            min_confidence: Minimum NCC score of the best power
+            min_margin: Minimum lead of the best power over the runner-up
+        """
+        self.bank = bank if bank is not None else TemplateBank(self.PATCH_SIZE)
+        self.min_confidence = min_confidence
+        self.min_margin = min_margin
+
+    @classmethod
+    def load(cls, path, min_confidence=0.8, min_margin=0.05):
+        """
+        Load a classifier from a template file built by tests/build_power_templates.py
+
+        Args:
+            path: .npz template file
+            min_confidence: Minimum NCC score of the best power
+            min_margin: Minimum lead of the best power over the runner-up
+
+        Returns:
+            PowerClassifier, or None if the template file does not exist
+        """
+        bank = TemplateBank.load(path)
+        if bank is None:
+            return None
+        return cls(bank, min_confidence, min_margin)
+
+    def save(self, path):
+        """
+        Save the reference renders
+
+        Args:
+            path: Output .npz file
+        """
+        self.bank.save(path)
+
+    @staticmethod
+    def _name_patch(section_img):
+        return crop_to_content(binarize_text(section_img))
+
+    def classify(self, section_img):
+        """
+        Identify the power in a name crop
+
+        Args:
+            section_img: NumPy array (BGR or grayscale)
+
+        Returns:
+            Tuple of (power name in upper case, score), or (None, score) if the
+            match is not confident enough
+        """
+        patch = self._name_patch(section_img)
+        if patch is None:
+            return None, 0.0
+
+        scores = self.bank.label_scores(patch)
+        if not scores:
+            return None, 0.0
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        power, score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else -1.0
+        if score < self.min_confidence or score - runner_up < self.min_margin:
+            return None, score
+        return power, score
+
+    def learn(self, section_img, power_name):
+        """
+        Store a reference render of a power name
+
+        Args:
+            section_img: NumPy array (BGR or grayscale)
+            power_name: Name of the power shown in the crop
+
+        Returns:
+            True if the crop contained text and was added
+        """
+        patch = self._name_patch(section_img)
+        if patch is None:
+            return False
+        self.bank.add(power_name.upper(), patch)
+        return True
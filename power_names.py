@@ -0,0 +1,212 @@
+"""
+Power name matching for PowerplayParser
+One shared index of the Powerplay leaders: an Aho-Corasick automaton for exact
+name hits and a trie walked with a bounded edit distance for OCR-garbled names
+"""
+
+# Standard library imports
+import re
+from collections import deque
+
+# Known Powerplay leaders (first name, last name)
+POWER_NAMES = [
+    'ARISSA LAVIGNY-DUVAL', 'AISLING DUVAL', 'ZEMINA TORVAL',
+    'DENTON PATREUS', 'ZACHARY HUDSON', 'FELICIA WINTERS',
+    'EDMUND MAHON', 'LI YONG-RUI', 'PRANAV ANTAL',
+    'ARCHON DELAINE', 'YURI GROM', 'NAKATO KAINE', 'JEROME ARCHER'
+]
+
+
+def _is_word_char(char):
+    # Same definition of a word character as re's \b for str patterns
+    return char.isalnum() or char == '_'
+
+
+def _at_word_boundary(text, position):
+    before = position > 0 and _is_word_char(text[position - 1])
+    after = position < len(text) and _is_word_char(text[position])
+    return before != after
+
+
+class _Automaton:
+    """Aho-Corasick automaton reporting every (overlapping) keyword occurrence in one pass"""
+
+    def __init__(self, keywords):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for keyword in keywords:
+            node = 0
+            for char in keyword:
+                if char not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[node][char] = len(self._goto) - 1
+                node = self._goto[node][char]
+            self._output[node].append(keyword)
+
+        # Breadth-first failure links; each node also reports the keywords of its failure node
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find_all(self, text):
+        """
+        Args:
+            text: String to scan
+
+        Returns:
+            List of (start index, keyword) for every occurrence
+        """
+        matches = []
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for end, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for keyword in output[node]:
+                matches.append((end - len(keyword) + 1, keyword))
+        return matches
+
+
+class _TrieNode:
+    __slots__ = ('children', 'name')
+
+    def __init__(self):
+        self.children = {}
+        self.name = None
+
+
+class PowerNameMatcher:
+    """
+    Matches OCR text against the known power names
+
+    match() identifies the power in a power name field (exact hit, otherwise the
+    name closest to some part of the text, within an edit distance bound).
+    mentioned_power() finds a power referred to anywhere in a line of panel text by
+    last name, abbreviated name ("A.LAVIGNY-DUVAL") or first name. Both are built
+    once and shared by every extraction path.
+    """
+
+    def __init__(self, names=None, max_error_rate=0.3):
+        """
+        Args:
+            names: Power names in upper case (defaults to POWER_NAMES)
+            max_error_rate: Maximum edit distance of a fuzzy match as a fraction of the name length
+        """
+        self.names = list(names or POWER_NAMES)
+        self.max_error_rate = max_error_rate
+        self._max_distance = {name: int(len(name) * max_error_rate) for name in self.names}
+        self._bound = max(self._max_distance.values())
+
+        # Name fragments for mentioned_power(): (priority, needs word boundaries) per keyword.
+        # Longest last name first so LAVIGNY-DUVAL wins over DUVAL.
+        self._by_priority = sorted(self.names, key=lambda name: len(name.split(' ', 1)[1]), reverse=True)
+        self._fragments = {}
+        for priority, name in enumerate(self._by_priority):
+            first_name, last_name = name.split(' ', 1)
+            for keyword, bounded in ((last_name, True),
+                                     (f"{first_name[0]}.{last_name}", False),  # OCR may miss the period
+                                     (f"{first_name[0]}{last_name}", False),
+                                     (first_name, True)):  # Bounded so "LI" doesn't match "FRONTLINE"
+                self._fragments.setdefault(keyword, []).append((priority, bounded))
+
+        self._automaton = _Automaton(list(self._fragments) + [name for name in self.names if name not in self._fragments])
+        # Every fragment contains a first or last name - lets lines without one skip the automaton scan
+        self._hint = re.compile('|'.join(re.escape(part) for name in self.names for part in name.split(' ', 1)))
+
+        self._trie = _TrieNode()
+        for name in self.names:
+            node = self._trie
+            for char in name:
+                node = node.children.setdefault(char, _TrieNode())
+            node.name = name
+
+    def match(self, text):
+        """
+        Identify the power in OCR text of a power name field
+
+        Args:
+            text: OCR text (any case, may span several lines)
+
+        Returns:
+            Tuple of (power name in upper case, edit distance to the closest part of the
+            text), or (None, None) if no name is within the distance bound
+        """
+        normalized = ' '.join(text.upper().split())
+        if not normalized:
+            return None, None
+
+        found = {keyword for _, keyword in self._automaton.find_all(normalized)}
+        for name in self.names:
+            if name in found:
+                return name, 0
+
+        # Noise OCR picked up around the name (other lines, borders) isn't counted
+        best_name, best_distance = None, None
+        for name, distance in self._search(normalized):
+            if distance > self._max_distance[name]:
+                continue
+            if best_distance is None or distance < best_distance or \
+               (distance == best_distance and self.names.index(name) < self.names.index(best_name)):
+                best_name, best_distance = name, distance
+        return best_name, best_distance
+
+    def _search(self, text):
+        """
+        Edit distance from every name to its closest substring of text, pruning the trie
+
+        The alignment is semi-global: the name may start and end anywhere in the text, so
+        OCR noise around the name ("| YURI GR0M |") costs nothing.
+        """
+        results = []
+        first_row = [0] * (len(text) + 1)
+        stack = [(child, char, first_row) for char, child in self._trie.children.items()]
+        while stack:
+            node, char, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, len(text) + 1):
+                row.append(min(row[column - 1] + 1,
+                               previous_row[column] + 1,
+                               previous_row[column - 1] + (text[column - 1] != char)))
+
+            distance = min(row)
+            if node.name is not None and distance <= self._bound:
+                results.append((node.name, distance))
+            # No completion of this prefix can get back under the bound
+            if min(row) <= self._bound:
+                stack.extend((child, next_char, row) for next_char, child in node.children.items())
+        return results
+
+    def mentioned_power(self, line):
+        """
+        Find the power referred to in a line of panel text
+
+        Args:
+            line: Line of OCR text in upper case
+
+        Returns:
+            Power name in upper case, or None
+        """
+        if not self._hint.search(line):
+            return None
+
+        best = None
+        for start, keyword in self._automaton.find_all(line):
+            end = start + len(keyword)
+            for priority, bounded in self._fragments.get(keyword, ()):
+                if bounded and not (_at_word_boundary(line, start) and _at_word_boundary(line, end)):
+                    continue
+                if best is None or priority < best:
+                    best = priority
+        return self._by_priority[best] if best is not None else None
@@ -4,8 +4,10 @@ Extracts system information from screenshots
 """
 
 # Standard library imports
+import bisect
 import os
 import re
+import threading
 import time
 from datetime import datetime
 
@@ -13,15 +15,30 @@ from datetime import datetime
 import cv2
 import keyboard
 import numpy as np
-import pyautogui
-import pytesseract
 from PIL import Image
 
 # Local imports
 import config
-
-# Uncomment and set if tesseract is not in PATH
-# pytesseract.pytesseract.tesseract_cmd = r'C:\Tools\Tesseract-OCR\tesseract.exe'
+import tracing
+from capture import get_capture_backend
+from change_detector import PanelChangeDetector
+from panel_detector import PanelDetector
+from digit_recognizer import DigitRecognizer
+from layout_classifier import LayoutClassifier, layout_features
+from monitor_scheduler import MonitorScheduler
+from ocr_cache import OCRCache, get_ocr_cache
+from ocr_engine import data_to_text, get_engine
+from power_classifier import PowerClassifier
+from power_names import PowerNameMatcher
+from screenshot_context import FRAME_EXTENDED_PANEL, ScreenshotContext, panel_capture_region
+from system_lexicon import edit_distance, get_system_lexicon, is_misread
+from text_parser import PowerplayTextParser
+
+# Set config.TESSERACT_PATH if tesseract is not in PATH
+
+# Patterns, keyword tables and the power name index are built once per process
+_power_matcher = PowerNameMatcher(max_error_rate=config.POWER_NAME_MAX_ERROR_RATE)
+_text_parser = PowerplayTextParser(_power_matcher)
 
 
 class PowerplayOCR:
@@ -33,8 +50,22 @@ class PowerplayOCR:
             tesseract_path: Path to tesseract executable (optional)
             use_easyocr: Whether to enable EasyOCR as fallback (default: True)
         """
-        if tesseract_path:
-            pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        # Shared OCR engine - one Tesseract instance per process, reused across fields and screenshots
+        self.engine = get_engine(tesseract_path)
+        # Content-hash cache of field OCR results (None when disabled)
+        self.ocr_cache = get_ocr_cache()
+        # Results of a batched OCR pass, consumed by _ocr_section (see prefetch_fields)
+        self._prefetched = {}
+        # Template-matching reader for numeric fields (None until templates have been built)
+        self.digit_recognizer = DigitRecognizer.load(config.DIGIT_TEMPLATES_PATH, config.DIGIT_MIN_CONFIDENCE)
+        # Image-based power name classifier (None until reference renders have been built)
+        self.power_classifier = PowerClassifier.load(config.POWER_TEMPLATES_PATH, config.POWER_MIN_CONFIDENCE)
+        # Pixel-signature layout router (None until signatures have been built)
+        self.layout_classifier = LayoutClassifier.load(config.LAYOUT_SIGNATURES_PATH)
+        # Known system names OCR'd names are snapped to (None when disabled)
+        self.system_lexicon = get_system_lexicon()
+        # Screen grabber (created on first capture, so offline processing needs no display)
+        self._capture = None
 
         # Initialize EasyOCR if enabled (lazy loading to save memory)
         self.use_easyocr = use_easyocr
@@ -47,135 +78,100 @@ class PowerplayOCR:
         os.makedirs(self.screenshots_dir, exist_ok=True)
         os.makedirs(self.output_dir, exist_ok=True)
 
-    def crop_powerplay_panel(self, image_path, extended=False):
+    @tracing.traced()
+    def crop_powerplay_panel(self, image_path, extended=False, as_array=False):
         """
         Crop the Powerplay Information panel from the screenshot using exact coordinates
         For 5120x1440 resolution screenshots
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, NumPy array (BGR), PIL Image or ScreenshotContext
             extended: If True, crop larger panel for EXPANSION/CONTESTED states (742×840)
                      If False, crop standard panel for other states (740×646)
+            as_array: If True, return the crop as a NumPy BGR array instead of a PIL Image
 
         Returns:
-            Cropped PIL Image containing just the Powerplay panel
+            Cropped PIL Image (or NumPy array) containing just the Powerplay panel
         """
-        # Load image
-        img = cv2.imread(image_path)
-        if img is None:
-            raise ValueError(f"Could not load image: {image_path}")
-        height, width = img.shape[:2]
-
-        # Use coordinates from config
-        # All values based on 5120x1440 resolution with automatic scaling
-        expected_width = config.EXPECTED_SCREEN_WIDTH
-        expected_height = config.EXPECTED_SCREEN_HEIGHT
+        # Crop from the shared decoded screenshot (cached per ScreenshotContext)
+        # Coordinates come from config, scaled from 5120x1440 resolution
+        cropped = ScreenshotContext.wrap(image_path).panel(extended)
 
-        # Calculate scaling factors
-        width_scale = width / expected_width
-        height_scale = height / expected_height
-
-        # Apply scaling to coordinates
-        left = int(config.PANEL_LEFT * width_scale)
-        top = int(config.PANEL_TOP * height_scale)
-
-        if extended:
-            # Extended panel for EXPANSION/CONTESTED (742×840)
-            right = int(config.PANEL_RIGHT_EXTENDED * width_scale)
-            bottom = int(config.PANEL_BOTTOM_EXTENDED * height_scale)
-        else:
-            # Standard panel (740×646)
-            right = int(config.PANEL_RIGHT_STANDARD * width_scale)
-            bottom = int(config.PANEL_BOTTOM_STANDARD * height_scale)
-
-        # Crop the image
-        cropped = img[top:bottom, left:right]
+        if as_array:
+            return cropped
 
         # Convert to PIL Image
         return Image.fromarray(cv2.cvtColor(cropped, cv2.COLOR_BGR2RGB))
 
-    def detect_initial_control_points_from_bar(self, image_path):
+    @staticmethod
+    def _status_bar_bounds(width, height):
         """
-        Calculate initial control points from the white marker position on the status bar.
-
-        The status bar (relative to cropped panel) is at:
-        - Position: (16, 568) to (735, 609)
-        - Contains 4 sections with CP ranges:
-          * Unoccupied (grey): 0 CP (fixed)
-          * Exploited (red): 0 - 350,000 CP
-          * Fortified (green): 350,000 - 1,000,000 CP
-          * Stronghold (purple): 1,000,000 - 2,000,000 CP
-        - White vertical line indicates initial CP position
+        Status bar rectangle inside a standard panel crop, scaled to the crop size
 
         Args:
-            image_path: Path to screenshot (full or cropped panel)
+            width: Panel crop width in pixels
+            height: Panel crop height in pixels
 
         Returns:
-            Integer representing initial control points
-            Returns None if white line cannot be detected
+            Tuple of (left, top, right, bottom)
         """
-        import cv2
-        import numpy as np
-
-        # Load image
-        img = cv2.imread(image_path)
-        if img is None:
-            raise ValueError(f"Could not load image: {image_path}")
-
-        height, width = img.shape[:2]
-
-        # If full screenshot, crop to panel first
-        if width > 2000:
-            pil_panel = self.crop_powerplay_panel(image_path)
-            img = cv2.cvtColor(np.array(pil_panel), cv2.COLOR_RGB2BGR)
-            height, width = img.shape[:2]
-
-        # Expected panel dimensions from config
-        expected_panel_width = config.PANEL_WIDTH_STANDARD
-        expected_panel_height = config.PANEL_HEIGHT_STANDARD
-
-        # Calculate scaling factors
-        width_scale = width / expected_panel_width
-        height_scale = height / expected_panel_height
+        # Calculate scaling factors from the expected panel dimensions
+        width_scale = width / config.PANEL_WIDTH_STANDARD
+        height_scale = height / config.PANEL_HEIGHT_STANDARD
 
         # Status bar coordinates (relative to cropped panel)
-        bar_left = int(16 * width_scale)
-        bar_top = int(568 * height_scale)
-        bar_right = int(735 * width_scale)
-        bar_bottom = int(609 * height_scale)
+        return (int(16 * width_scale), int(568 * height_scale),
+                int(735 * width_scale), int(609 * height_scale))
 
-        # Crop the status bar
-        status_bar = img[bar_top:bar_bottom, bar_left:bar_right]
+    @staticmethod
+    def _marker_positions(bars):
+        """
+        Locate the white marker line in a stack of grayscale status bar crops
 
-        # The white line is 3 pixels wide with:
-        # - Center pixel: pure white (255, 255, 255)
-        # - Left/right pixels: slightly blurred due to antialiasing
+        The white line is 3 pixels wide with a pure white center column and
+        antialiased neighbours. The center is the column with the most pure white
+        pixels; its position is refined to sub-pixel precision with the centroid of
+        the bright pixels in the center column and its two neighbours.
 
-        # Convert to grayscale for brightness detection
-        gray = cv2.cvtColor(status_bar, cv2.COLOR_BGR2GRAY)
-        bar_width = bar_right - bar_left
-        bar_height = bar_bottom - bar_top
+        Args:
+            bars: NumPy array of shape (N, bar_height, bar_width), grayscale
 
-        # Find the center of the 3-pixel white line by looking for pure white pixels
-        # Pure white pixel should have value = 255 (or very close)
+        Returns:
+            Float array of N marker x positions (NaN where no marker was found)
+        """
         pure_white_threshold = 250  # Allow slight JPEG compression artifacts
+        bright_threshold = 200      # Antialiased edge pixels of the marker
 
-        # Scan each column and look for the one with the most pure white pixels
-        column_pure_white_counts = []
-        for x in range(bar_width):
-            pure_white_count = np.sum(gray[:, x] >= pure_white_threshold)
-            column_pure_white_counts.append(pure_white_count)
+        # One reduction per threshold for the whole stack instead of a loop over columns
+        pure_white_counts = (bars >= pure_white_threshold).sum(axis=1)
+        bright_counts = (bars >= bright_threshold).sum(axis=1).astype(np.float64)
 
-        # Find column with most pure white pixels (the center of the 3-pixel line)
-        if max(column_pure_white_counts) < 5:  # Need at least 5 pure white pixels to be the center line
-            return None
+        rows = np.arange(len(bars))
+        center = pure_white_counts.argmax(axis=1)
+        found = pure_white_counts[rows, center] >= 5  # Need at least 5 pure white pixels to be the center line
 
-        # The center pixel column is where we have the most pure white pixels
-        white_line_x = np.argmax(column_pure_white_counts)
+        # Centroid over [center - 1, center + 1] weighted by bright pixel counts
+        bar_width = bars.shape[2]
+        left = np.clip(center - 1, 0, bar_width - 1)
+        right = np.clip(center + 1, 0, bar_width - 1)
+        w_left = np.where(left < center, bright_counts[rows, left], 0.0)
+        w_center = bright_counts[rows, center]
+        w_right = np.where(right > center, bright_counts[rows, right], 0.0)
+        offset = (w_right - w_left) / np.maximum(w_left + w_center + w_right, 1.0)
 
-        # Calculate position ratio (0.0 to 1.0) across entire bar
-        position_ratio = white_line_x / bar_width
+        return np.where(found, center + offset, np.nan)
 
+    @staticmethod
+    def _initial_cp_from_ratio(position_ratio):
+        """
+        Convert the marker position (0.0 to 1.0 across the bar) to initial control points
+
+        Args:
+            position_ratio: Marker x position divided by the bar width
+
+        Returns:
+            Integer control points, rounded to the nearest thousand
+        """
         # The bar is divided into 4 equal sections
         # Each section represents 25% of the bar width
         section_width_ratio = 0.25
@@ -207,7 +203,85 @@ class PowerplayOCR:
             # Round to nearest thousand
             return round(cp / 1000) * 1000
 
-    def crop_powerplay_subsections(self, image_path):
+    @tracing.traced()
+    def detect_initial_control_points_from_bar(self, image_path):
+        """
+        Calculate initial control points from the white marker position on the status bar.
+
+        The status bar (relative to cropped panel) is at:
+        - Position: (16, 568) to (735, 609)
+        - Contains 4 sections with CP ranges:
+          * Unoccupied (grey): 0 CP (fixed)
+          * Exploited (red): 0 - 350,000 CP
+          * Fortified (green): 350,000 - 1,000,000 CP
+          * Stronghold (purple): 1,000,000 - 2,000,000 CP
+        - White vertical line indicates initial CP position
+
+        Args:
+            image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+        Returns:
+            Integer representing initial control points
+            Returns None if white line cannot be detected
+        """
+        # Grayscale panel from the shared decoded screenshot (crops full screenshots to the panel)
+        gray_panel = ScreenshotContext.wrap(image_path).panel_gray()
+
+        height, width = gray_panel.shape[:2]
+        bar_left, bar_top, bar_right, bar_bottom = self._status_bar_bounds(width, height)
+
+        # Crop the status bar (grayscale for brightness detection)
+        gray = gray_panel[bar_top:bar_bottom, bar_left:bar_right]
+
+        white_line_x = self._marker_positions(gray[np.newaxis])[0]
+        if np.isnan(white_line_x):
+            return None
+
+        # Calculate position ratio (0.0 to 1.0) across entire bar
+        return self._initial_cp_from_ratio(white_line_x / (bar_right - bar_left))
+
+    @tracing.traced()
+    def detect_initial_control_points_batch(self, panels):
+        """
+        Calculate initial control points for many screenshots in one pass
+
+        Every input is cropped to its standard panel first (full screenshots, extended
+        panel crops and standard panel crops may be mixed). Panels of the same size are
+        stacked and their status bars are searched with a single vectorized reduction.
+
+        Args:
+            panels: List of screenshots or panel crops (NumPy BGR or grayscale arrays, paths
+                    or ScreenshotContexts), or an array of shape (N, height, width[, 3])
+
+        Returns:
+            List of initial control points (None where no marker was found), in input order
+        """
+        images = [ScreenshotContext.wrap(panel).panel() for panel in panels]
+
+        # Group equally sized panels so each group is one stacked array
+        groups = {}
+        for index, image in enumerate(images):
+            groups.setdefault(image.shape, []).append(index)
+
+        results = [None] * len(images)
+        for shape, indices in groups.items():
+            bar_left, bar_top, bar_right, bar_bottom = self._status_bar_bounds(shape[1], shape[0])
+            bars = np.stack([images[i][bar_top:bar_bottom, bar_left:bar_right] for i in indices])
+            if bars.ndim == 4:
+                # Convert only the bar crops - all of them as one tall image
+                count, bar_height, bar_width = bars.shape[:3]
+                bars = cv2.cvtColor(bars.reshape(count * bar_height, bar_width, 3),
+                                    cv2.COLOR_BGR2GRAY).reshape(count, bar_height, bar_width)
+
+            positions = self._marker_positions(bars)
+            for i, position in zip(indices, positions):
+                if not np.isnan(position):
+                    results[i] = self._initial_cp_from_ratio(position / (bar_right - bar_left))
+
+        return results
+
+    @tracing.traced()
+    def crop_powerplay_subsections(self, image_path, as_array=False):
         """
         Crop the Powerplay panel into subsections using exact pixel coordinates
         Based on the cropped panel coordinates (740x646 pixels from full 5120x1440 screenshot)
@@ -220,23 +294,37 @@ class PowerplayOCR:
         - reinforcing: (480, 446) - (672, 474)
 
         Args:
-            image_path: Path to the image file (can be full screenshot or cropped panel)
+            image_path: Path to the image file (can be full screenshot or cropped panel),
+                        NumPy array (BGR), PIL Image or ScreenshotContext
+            as_array: If True, return NumPy BGR views instead of PIL Images
 
         Returns:
-            Dictionary of cropped PIL Images for each section
+            Dictionary of cropped PIL Images (or NumPy arrays) for each section
         """
-        # First, get the cropped panel (or use it directly if already cropped)
-        img = cv2.imread(image_path)
-        if img is None:
-            raise ValueError(f"Could not load image: {image_path}")
+        # Crop once per screenshot - views are cached on the ScreenshotContext
+        ctx = ScreenshotContext.wrap(image_path)
+        sections = ctx.memo(('subsections', 'standard'), lambda: self._crop_subsection_views(ctx.panel()))
 
-        height, width = img.shape[:2]
+        if as_array:
+            return dict(sections)
 
-        # If this looks like a full screenshot (width > 2000), crop to panel first
-        if width > 2000:
-            pil_panel = self.crop_powerplay_panel(image_path)
-            img = cv2.cvtColor(np.array(pil_panel), cv2.COLOR_RGB2BGR)
-            height, width = img.shape[:2]
+        # Convert to PIL Images
+        return {
+            section_name: Image.fromarray(cv2.cvtColor(section_img, cv2.COLOR_BGR2RGB))
+            for section_name, section_img in sections.items()
+        }
+
+    def _crop_subsection_views(self, img):
+        """
+        Slice the standard subsections out of a panel crop
+
+        Args:
+            img: Panel crop as NumPy array (BGR)
+
+        Returns:
+            Dictionary of NumPy array views for each section
+        """
+        height, width = img.shape[:2]
 
         # Expected panel dimensions from config
         expected_panel_width = config.PANEL_WIDTH_STANDARD
@@ -288,14 +376,12 @@ class PowerplayOCR:
             # Crop this section
             section_img = img[top:bottom, left:right]
 
-            # Convert to PIL Image
-            cropped_sections[section_name] = Image.fromarray(
-                cv2.cvtColor(section_img, cv2.COLOR_BGR2RGB)
-            )
+            cropped_sections[section_name] = section_img
 
         return cropped_sections
 
-    def crop_powerplay_subsections_competitive(self, image_path):
+    @tracing.traced()
+    def crop_powerplay_subsections_competitive(self, image_path, as_array=False):
         """
         Crop the Powerplay panel into subsections for EXPANSION/CONTESTED states
         Based on the extended cropped panel (742x840 pixels from full 5120x1440 screenshot)
@@ -312,23 +398,37 @@ class PowerplayOCR:
         - power_your_rank: (108, 646) - (170, 674)
 
         Args:
-            image_path: Path to the image file (can be full screenshot or extended cropped panel)
+            image_path: Path to the image file (can be full screenshot or extended cropped panel),
+                        NumPy array (BGR), PIL Image or ScreenshotContext
+            as_array: If True, return NumPy BGR views instead of PIL Images
 
         Returns:
-            Dictionary of cropped PIL Images for each section
+            Dictionary of cropped PIL Images (or NumPy arrays) for each section
         """
-        # First, get the extended cropped panel (or use it directly if already cropped)
-        img = cv2.imread(image_path)
-        if img is None:
-            raise ValueError(f"Could not load image: {image_path}")
+        # Crop once per screenshot - views are cached on the ScreenshotContext
+        ctx = ScreenshotContext.wrap(image_path)
+        sections = ctx.memo(('subsections', 'competitive'), lambda: self._crop_subsection_views_competitive(ctx.panel(extended=True)))
 
-        height, width = img.shape[:2]
+        if as_array:
+            return dict(sections)
 
-        # If this looks like a full screenshot (width > 2000), crop to extended panel first
-        if width > 2000:
-            pil_panel = self.crop_powerplay_panel(image_path, extended=True)
-            img = cv2.cvtColor(np.array(pil_panel), cv2.COLOR_RGB2BGR)
-            height, width = img.shape[:2]
+        # Convert to PIL Images
+        return {
+            section_name: Image.fromarray(cv2.cvtColor(section_img, cv2.COLOR_BGR2RGB))
+            for section_name, section_img in sections.items()
+        }
+
+    def _crop_subsection_views_competitive(self, img):
+        """
+        Slice the competitive subsections out of a extended panel crop
+
+        Args:
+            img: Extended panel crop as NumPy array (BGR)
+
+        Returns:
+            Dictionary of NumPy array views for each section
+        """
+        height, width = img.shape[:2]
 
         # Expected extended panel dimensions
         # Panel size: 742 width, 840 height
@@ -416,40 +516,39 @@ class PowerplayOCR:
             # Crop this section
             section_img = img[top:bottom, left:right]
 
-            # Convert to PIL Image
-            cropped_sections[section_name] = Image.fromarray(
-                cv2.cvtColor(section_img, cv2.COLOR_BGR2RGB)
-            )
+            cropped_sections[section_name] = section_img
 
         return cropped_sections
 
-    def preprocess_image(self, image_path, method='enhanced', crop_panel=True):
+    @tracing.traced()
+    def preprocess_image(self, image_path, method='enhanced', crop_panel=True, as_array=False):
         """
         Preprocess image for better OCR accuracy
         Optimized for Elite Dangerous UI (dark background, light text)
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, NumPy array (BGR), PIL Image or ScreenshotContext
             method: Preprocessing method ('enhanced', 'upscale', 'threshold', 'clahe', 'none')
             crop_panel: Whether to crop to just the Powerplay panel first (default: True)
+            as_array: If True, return a NumPy array (RGB or grayscale) that can be passed
+                      straight to the OCR engine instead of a PIL Image
 
         Returns:
-            Preprocessed PIL Image
+            Preprocessed PIL Image (or NumPy array)
         """
-        # Load image with OpenCV
-        img = cv2.imread(image_path)
+        # Use the shared decoded image (no-op for arrays), cropped to the Powerplay panel if requested
+        ctx = ScreenshotContext.wrap(image_path)
+        img = ctx.panel() if crop_panel else ctx.image
 
-        # Crop to Powerplay panel if requested
-        if crop_panel:
-            pil_cropped = self.crop_powerplay_panel(image_path)
-            # Convert back to OpenCV format for processing
-            img = cv2.cvtColor(np.array(pil_cropped), cv2.COLOR_RGB2BGR)
+        to_output = (lambda arr: arr) if as_array else Image.fromarray
 
         if method == 'none':
-            return Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+            if img.ndim == 2:
+                return to_output(img)
+            return to_output(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
 
         # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        gray = img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
         if method == 'enhanced':
             # Enhanced preprocessing for Elite Dangerous UI
@@ -477,7 +576,7 @@ class PowerplayOCR:
             kernel = np.ones((2, 2), np.uint8)
             dilated = cv2.dilate(thresh, kernel, iterations=1)
 
-            return Image.fromarray(dilated)
+            return to_output(dilated)
 
         elif method == 'upscale':
             # Upscale image for better OCR (helps with small text)
@@ -487,7 +586,7 @@ class PowerplayOCR:
             height = int(gray.shape[0] * scale_factor)
             upscaled = cv2.resize(gray, (width, height), interpolation=cv2.INTER_CUBIC)
 
-            return Image.fromarray(upscaled)
+            return to_output(upscaled)
 
         elif method == 'threshold':
             # Simple thresholding approach
@@ -497,7 +596,7 @@ class PowerplayOCR:
             # Apply binary threshold
             _, thresh = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
-            return Image.fromarray(thresh)
+            return to_output(thresh)
 
         elif method == 'clahe':
             # CLAHE for contrast enhancement
@@ -507,10 +606,386 @@ class PowerplayOCR:
             # Denoise
             denoised = cv2.fastNlMeansDenoising(enhanced, h=7)
 
-            return Image.fromarray(denoised)
+            return to_output(denoised)
+
+        return to_output(gray)
 
-        return Image.fromarray(gray)
+    @tracing.traced()
+    def _ocr_section(self, section_img, method, config):
+        """
+        Preprocess a subsection crop in memory and run it through the OCR engine
+
+        Results are cached by a hash of the raw crop pixels plus the preprocessing
+        and Tesseract settings, so pixel-identical fields are only OCR'd once.
+        Results queued by prefetch_fields() are used (once) before either.
+
+        Args:
+            section_img: Subsection as NumPy array (BGR)
+            method: Preprocessing method passed to preprocess_image
+            config: Tesseract config string
+
+        Returns:
+            Raw OCR text
+        """
+        key = None
+        if self.ocr_cache is not None or self._prefetched:
+            key = OCRCache.make_key(section_img, method, config, self.engine.name)
+            if key in self._prefetched:
+                return self._prefetched.pop(key)
+
+        if self.ocr_cache is not None:
+            text = self.ocr_cache.get(key)
+            if text is not None:
+                return text
+
+        processed = self.preprocess_image(section_img, method=method, crop_panel=False, as_array=True)
+        text = self.engine.image_to_string(processed, config=config)
+
+        if self.ocr_cache is not None:
+            self.ocr_cache.put(key, text)
+        return text
+
+    @tracing.traced()
+    def _ocr_section_with_confidence(self, section_img, method, config):
+        """
+        Like _ocr_section, but also return Tesseract's mean word confidence
+
+        Args:
+            section_img: Subsection as NumPy array (BGR)
+            method: Preprocessing method passed to preprocess_image
+            config: Tesseract config string
+
+        Returns:
+            Tuple of (text, confidence) with confidence 0-100, or None for results
+            taken from a batched prefetch (which has no per-field confidence)
+        """
+        key = OCRCache.make_key(section_img, method, config, self.engine.name)
+        if key in self._prefetched:
+            return self._prefetched.pop(key), None
+
+        data_key = OCRCache.make_key(section_img, method, 'data', config, self.engine.name)
+        if self.ocr_cache is not None:
+            cached = self.ocr_cache.get(data_key)
+            if cached is not None:
+                return cached[0], cached[1]
+
+        processed = self.preprocess_image(section_img, method=method, crop_panel=False, as_array=True)
+        text, confidence = data_to_text(self.engine.image_to_data(processed, config=config))
+
+        if self.ocr_cache is not None:
+            self.ocr_cache.put(data_key, [text, confidence])
+        return text, confidence
+
+    def _ocr_cascade(self, field, section_img, parse, first_attempt=None):
+        """
+        Run a field's OCR attempts in the configured order and stop at the first confident one
+
+        The attempts are listed in config.OCR_CASCADES[field] and the threshold in
+        config.OCR_CONFIDENCE_THRESHOLDS[field].
+
+        Args:
+            field: Cascade name (e.g. 'system_name', 'power_score', 'your_rank')
+            section_img: Subsection as NumPy array (BGR)
+            parse: Callable turning OCR text into a value, or None if the text is not usable
+            first_attempt: (text, confidence) already read with the first attempt, so it
+                isn't run again (optional)
+
+        Returns:
+            Value of the first attempt that parses and clears the threshold, otherwise
+            the parsed value with the highest confidence, or None if no attempt parsed
+        """
+        threshold = config.OCR_CONFIDENCE_THRESHOLDS.get(field, 0)
+        best_value = None
+        best_confidence = -1.0
+
+        for attempt, (method, ocr_config) in enumerate(config.OCR_CASCADES[field]):
+            if attempt == 0 and first_attempt is not None:
+                text, confidence = first_attempt
+            else:
+                text, confidence = self._ocr_section_with_confidence(section_img, method, ocr_config)
+            value = parse(text)
+            if value is None:
+                continue
+            if confidence is None or confidence >= threshold:
+                return value
+            if confidence > best_confidence:
+                best_value = value
+                best_confidence = confidence
+
+        return best_value
+
+    @staticmethod
+    def _clean_system_name(text):
+        """
+        Turn system name OCR text into a system name
+
+        Args:
+            text: Raw OCR text of the system name line
+
+        Returns:
+            Cleaned upper-case system name, or None if it is too short to be valid
+        """
+        text = text.strip().upper()
+
+        # Extract just the system name (before LAST UPDATED)
+        if 'LAST UPDATED' in text:
+            name = text.split('LAST UPDATED')[0].strip()
+        else:
+            name = text
+
+        # Clean up common OCR prefix noise
+        for prefix in ['= ', '_ ', 'A ', 'V ', '> ', '- ', '| ']:
+            if name.startswith(prefix):
+                name = name[len(prefix):].strip()
+
+        # Apply OCR error corrections
+        # Fix common OCR misreads: DE -> D2, DE- -> D2-, GE -> CE
+        name = re.sub(r'([A-Z])E-(\d)', r'\g<1>2-\2', name)  # DE-20 -> D2-20
+        name = re.sub(r'([A-Z])E(\d)', r'\1\2', name)  # DE2 -> D2
+        name = re.sub(r'\bGE-', 'CE-', name)  # GE-N -> CE-N
+        name = re.sub(r'\bGOL\b', 'COL', name)  # GOL -> COL
+
+        # Valid system name should be at least 3 characters
+        # Can have "SECTOR" or be a simple name like "LTT 970"
+        return name if len(name) >= 3 else None
+
+    @tracing.traced()
+    def _read_system_name(self, section_img, expected_name=None):
+        """
+        Read the system name field, snapping the result to a known system name
+
+        With an expected name (e.g. the name that was searched for) a single OCR pass
+        is enough to confirm it; the full cascade only runs if that pass disagrees.
+
+        Args:
+            section_img: System name subsection as NumPy array (BGR)
+            expected_name: System name the screenshot should show (optional)
+
+        Returns:
+            Tuple of (system name or None, edit distance to the known name it was
+            snapped to, or None if it matched no known name)
+        """
+        first_attempt = None
+        if expected_name:
+            expected = ' '.join(expected_name.split()).upper()
+            method, ocr_config = config.OCR_CASCADES['system_name'][0]
+            # Read with confidence so the cascade below can reuse this pass if the name disagrees
+            first_attempt = self._ocr_section_with_confidence(section_img, method, ocr_config)
+            name = self._clean_system_name(first_attempt[0])
+            if name:
+                max_distance = int(len(expected) * config.SYSTEM_NAME_MAX_ERROR_RATE)
+                distance = edit_distance(name, expected, max_distance)
+                if distance <= max_distance and (distance == 0 or is_misread(name, expected)):
+                    return expected, distance
+
+        name = self._ocr_cascade('system_name', section_img, self._clean_system_name, first_attempt)
+        if name and self.system_lexicon is not None:
+            known_name, distance = self.system_lexicon.lookup(name)
+            if known_name:
+                return known_name, distance
+        return name, None
+
+    @staticmethod
+    def _parse_score(text):
+        """
+        Extract a control score (with or without commas) from OCR text
+
+        Args:
+            text: Raw OCR text of a score field
+
+        Returns:
+            Integer score, or None if no number was found
+        """
+        number_match = re.search(r'(\d{1,}(?:,\d{3})*)', text.strip())
+        if number_match:
+            return int(number_match.group(1).replace(',', ''))
+        return None
+
+    @staticmethod
+    def _parse_rank(text):
+        """
+        Extract the "your power" rank from OCR text
+
+        Args:
+            text: Raw OCR text of the rank field
+
+        Returns:
+            Rank string such as '1st' or '5th', or None if no rank was found
+        """
+        text = text.strip().upper()
+
+        # Look for rank indicators: 1ST, 2ND, 3RD, 4TH, 5TH, etc.
+        rank_match = re.search(r'(\d+)(ST|ND|RD|TH)', text)
+        if rank_match:
+            rank_num = rank_match.group(1)
+            rank_suffix = rank_match.group(2).lower()
+            return f"{rank_num}{rank_suffix}"
+
+        # Check for common OCR errors: "Sth" or "oth" for "5th"
+        if text in ['STH', 'OTH', 'STI']:
+            return '5th'
+        elif text in ['1ST', 'IST']:
+            return '1st'
+        elif text in ['2ND']:
+            return '2nd'
+        elif text in ['3RD']:
+            return '3rd'
+        elif text in ['4TH']:
+            return '4th'
+
+        # Fallback: just a digit
+        digit_match = re.search(r'\b([1-9])\b', text)
+        if digit_match:
+            digit = digit_match.group(1)
+            if digit == '1':
+                return '1st'
+            elif digit == '2':
+                return '2nd'
+            elif digit == '3':
+                return '3rd'
+            return f"{digit}th"
+
+        return None
+
+    @tracing.traced()
+    def _read_numbers(self, section_img, count):
+        """
+        Read a numeric field with the template-matching digit recognizer
+
+        Args:
+            section_img: Subsection as NumPy array (BGR)
+            count: Number of numbers the field is expected to contain
+
+        Returns:
+            List of ints, or None if no templates are loaded or the read is not
+            confident (callers then fall back to Tesseract)
+        """
+        if self.digit_recognizer is None:
+            return None
+        numbers = self.digit_recognizer.read_numbers(section_img)
+        if numbers is None or len(numbers) != count:
+            return None
+        return numbers
+
+    @tracing.traced()
+    def _classify_power(self, section_img):
+        """
+        Identify a power name crop by template matching
+
+        Args:
+            section_img: Subsection as NumPy array (BGR)
+
+        Returns:
+            Power name in upper case, or None if no reference renders are loaded or
+            the match is not confident (callers then fall back to OCR)
+        """
+        if self.power_classifier is None:
+            return None
+        power, _ = self.power_classifier.classify(section_img)
+        return power
+
+    @tracing.traced()
+    def ocr_fields_batch(self, fields, sheet_config='--oem 3 --psm 6 --dpi 300'):
+        """
+        OCR many field crops with a single Tesseract call
 
+        Every crop is preprocessed, normalized to dark text on a light background and
+        stacked into one tall sheet with blank separator bands. The words returned by
+        image_to_data are assigned back to fields by their vertical position.
+        Fields can come from one screenshot or from many (use tuple keys).
+
+        Args:
+            fields: Dict mapping a field key to (section_img, method)
+            sheet_config: Tesseract config string for the whole sheet
+
+        Returns:
+            Dict mapping each field key to its recognized text
+        """
+        results = {}
+        pending = []
+
+        for name, (section_img, method) in fields.items():
+            key = None
+            if self.ocr_cache is not None:
+                key = OCRCache.make_key(section_img, method, 'batch', sheet_config, self.engine.name)
+                text = self.ocr_cache.get(key)
+                if text is not None:
+                    results[name] = text
+                    continue
+
+            processed = self.preprocess_image(section_img, method=method, crop_panel=False, as_array=True)
+            if processed.ndim == 3:
+                processed = cv2.cvtColor(processed, cv2.COLOR_RGB2GRAY)
+            # Use one polarity for the whole sheet - invert crops with a dark background
+            border = np.concatenate([processed[0], processed[-1], processed[:, 0], processed[:, -1]])
+            if np.median(border) < 128:
+                processed = 255 - processed
+            pending.append((name, key, processed))
+
+        if not pending:
+            return results
+
+        # Stack crops vertically, separated by blank bands so Tesseract keeps them on separate lines
+        gap = config.OCR_BATCH_GAP
+        sheet_width = max(img.shape[1] for _, _, img in pending) + 2 * gap
+        sheet_height = sum(img.shape[0] for _, _, img in pending) + gap * (len(pending) + 1)
+        sheet = np.full((sheet_height, sheet_width), 255, dtype=np.uint8)
+
+        band_tops = []
+        y = gap
+        for _, _, img in pending:
+            sheet[y:y + img.shape[0], gap:gap + img.shape[1]] = img
+            band_tops.append(y)
+            y += img.shape[0] + gap
+
+        data = self.engine.image_to_data(sheet, config=sheet_config)
+
+        # Assign every word to the field band its vertical center falls into
+        band_words = [[] for _ in pending]
+        for i in range(len(data['text'])):
+            center = data['top'][i] + data['height'][i] / 2
+            band_words[max(0, bisect.bisect_right(band_tops, center) - 1)].append(i)
+
+        for (name, key, _), indices in zip(pending, band_words):
+            text, _ = data_to_text(data, indices)
+            results[name] = text
+            if key is not None:
+                self.ocr_cache.put(key, text)
+
+        return {name: results[name] for name in fields}
+
+    def prefetch_fields(self, fields, sheet_config='--oem 3 --psm 6 --dpi 300'):
+        """
+        OCR several fields in one batched pass ahead of the per-field _ocr_section calls
+
+        Each result is used once by the matching _ocr_section(section_img, method, field_config)
+        call; retries with other methods or settings still run individually.
+
+        Args:
+            fields: List of (section_img, method, field_config) tuples
+            sheet_config: Tesseract config string for the batched sheet
+        """
+        self._prefetched.clear()
+        texts = self.ocr_fields_batch({i: (img, method) for i, (img, method, _) in enumerate(fields)},
+                                      sheet_config)
+        for i, (section_img, method, field_config) in enumerate(fields):
+            key = OCRCache.make_key(section_img, method, field_config, self.engine.name)
+            self._prefetched[key] = texts[i]
+
+    def _prefetch_subsections(self, subsections, plan):
+        """
+        Batch-OCR the first attempt of each field when config.OCR_BATCH_FIELDS is enabled
+
+        Args:
+            subsections: Dict of subsection arrays
+            plan: List of (section_name, method, field_config) matching the extractor's first calls
+        """
+        if not config.OCR_BATCH_FIELDS:
+            return
+        self.prefetch_fields([(subsections[name], method, field_config)
+                              for name, method, field_config in plan if name in subsections])
+
+    @tracing.traced()
     def extract_text(self, image_path, preprocess_method='upscale', crop_panel=True, use_subsections=False):
         """
         Extract text from image using OCR
@@ -528,9 +1003,9 @@ class PowerplayOCR:
             return self.extract_text_subsections(image_path, preprocess_method=preprocess_method)
 
         if preprocess_method != 'none':
-            image = self.preprocess_image(image_path, method=preprocess_method, crop_panel=crop_panel)
+            image = self.preprocess_image(image_path, method=preprocess_method, crop_panel=crop_panel, as_array=True)
         else:
-            image = Image.open(image_path)
+            image = self.preprocess_image(image_path, method='none', crop_panel=False, as_array=True)
 
         # Configure tesseract for better accuracy
         # --oem 1: Use LSTM OCR engine (best for modern text)
@@ -540,10 +1015,27 @@ class PowerplayOCR:
         # Additional options for better accuracy:
         # --dpi 300: Tell Tesseract this is high DPI (we upscaled to 3x)
         custom_config = r'--oem 1 --psm 6 --dpi 300'
-        text = pytesseract.image_to_string(image, config=custom_config)
+        text = self.engine.image_to_string(image, config=custom_config)
 
         return text
 
+    def raw_text(self, image_path):
+        """
+        OCR text of the whole panel in one pass, for debug output
+
+        The extractors never need it (the text each field read is in info['_ocr_fields']),
+        so it is only computed when asked for, at most once per ScreenshotContext.
+
+        Args:
+            image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+        Returns:
+            Extracted text string
+        """
+        ctx = ScreenshotContext.wrap(image_path)
+        return ctx.memo('raw_text', lambda: self.extract_text(ctx, preprocess_method='upscale', crop_panel=False,
+                                                              use_subsections=False))
+
     def extract_text_subsections(self, image_path, preprocess_method='upscale'):
         """
         Extract text by processing subsections independently
@@ -557,22 +1049,23 @@ class PowerplayOCR:
             Combined extracted text string with subsection markers
         """
         # Get subsections
-        subsections = self.crop_powerplay_subsections(image_path)
+        subsections = self.crop_powerplay_subsections(image_path, as_array=True)
 
         combined_text = []
 
+        # Batched mode: one Tesseract pass over all subsections instead of one per section
+        if config.OCR_BATCH_FIELDS:
+            texts = self.ocr_fields_batch({name: (img, preprocess_method) for name, img in subsections.items()},
+                                          sheet_config='--oem 1 --psm 6 --dpi 300')
+            for section_name, section_text in texts.items():
+                combined_text.append(f"[{section_name.upper()}]")
+                combined_text.append(section_text.strip())
+            return '\n'.join(combined_text)
+
         for section_name, section_image in subsections.items():
-            # Save section to temp file for preprocessing
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                section_image.save(tmp.name)
-                temp_path = tmp.name
-
-            # Preprocess the subsection
-            if preprocess_method != 'none':
-                processed_img = self.preprocess_image(temp_path, method=preprocess_method, crop_panel=False)
-            else:
-                processed_img = section_image
+            # Preprocess the subsection in memory
+            processed_img = self.preprocess_image(section_image, method=preprocess_method, crop_panel=False,
+                                                  as_array=True)
 
             # Choose PSM mode based on section
             if section_name == 'header':
@@ -589,19 +1082,12 @@ class PowerplayOCR:
                 psm = 6  # Single uniform block
 
             custom_config = f'--oem 1 --psm {psm} --dpi 300'
-            section_text = pytesseract.image_to_string(processed_img, config=custom_config)
+            section_text = self.engine.image_to_string(processed_img, config=custom_config)
 
             # Add section marker
             combined_text.append(f"[{section_name.upper()}]")
             combined_text.append(section_text.strip())
 
-            # Clean up temp file
-            import os
-            try:
-                os.remove(temp_path)
-            except:
-                pass
-
         return '\n'.join(combined_text)
 
     def extract_text_easyocr(self, image_path, preprocess_method='upscale'):
@@ -628,56 +1114,38 @@ class PowerplayOCR:
                 print("EasyOCR not installed. Install with: pip install easyocr")
                 return ""
 
-        # Preprocess image
-        if preprocess_method != 'none':
-            image = self.preprocess_image(image_path, method=preprocess_method, crop_panel=False)
-
-            # Save preprocessed image to temp file
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                image.save(tmp.name)
-                temp_path = tmp.name
-        else:
-            temp_path = image_path
+        # Preprocess image in memory (EasyOCR accepts NumPy arrays directly)
+        image = self.preprocess_image(image_path, method=preprocess_method, crop_panel=False, as_array=True)
 
         # Run EasyOCR
         try:
-            result = self._easyocr_reader.readtext(temp_path)
+            result = self._easyocr_reader.readtext(image)
 
             # Extract text from results
             # EasyOCR returns list of (bbox, text, confidence)
             texts = [text for (bbox, text, conf) in result]
             combined_text = '\n'.join(texts)
 
-            # Clean up temp file
-            if temp_path != image_path:
-                try:
-                    import os
-                    os.remove(temp_path)
-                except:
-                    pass
-
             return combined_text
         except Exception as e:
             print(f"EasyOCR error: {e}")
             return ""
 
-    def extract_powerplay_subsections_optimized(self, image_path):
+    @tracing.traced()
+    def extract_powerplay_subsections_optimized(self, image_path, expected_name=None):
         """
         Extract powerplay data using exact subsection coordinates with optimized OCR per section
         This is the most accurate method - processes each UI element independently
 
         Args:
-            image_path: Path to screenshot (full or already cropped panel)
+            image_path: Path to screenshot (full or already cropped panel) or ScreenshotContext
+            expected_name: System name the screenshot should show (optional, see _read_system_name)
 
         Returns:
             Dictionary with extracted powerplay information
         """
-        import tempfile
-        import os
-
         # Get the exact subsections
-        subsections = self.crop_powerplay_subsections(image_path)
+        subsections = self.crop_powerplay_subsections(image_path, as_array=True)
 
         info = {
             'system_name': '',
@@ -687,250 +1155,182 @@ class PowerplayOCR:
             'undermining_points': -1,
             'reinforcing_points': -1
         }
-
-        # Process system name section - PSM 7 (single line), threshold for text clarity
+        # What each field read (OCR text, or the template match), for debug output
+        ocr_fields = {}
+
+        self._prefetch_subsections(subsections, [
+            ('system_name', 'none', '--oem 3 --psm 7 --dpi 300'),
+            ('system_status', 'upscale', '--oem 3 --psm 6 --dpi 300'),
+            ('controlling_power', 'upscale', '--oem 3 --psm 6 --dpi 300'),
+            ('control_points', 'upscale', '--oem 3 --psm 7 --dpi 300'),
+        ])
+
+        # Process system name section - PSM 7 (single line), cascade of preprocessing methods,
+        # snapped to a known system name
         if 'system_name' in subsections:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                subsections['system_name'].save(tmp_path)
-
-            try:
-                # Try multiple methods to get best OCR result
-                candidates = []
-
-                for method in ['none', 'upscale', 'threshold']:
-                    text = pytesseract.image_to_string(
-                        self.preprocess_image(tmp_path, method=method, crop_panel=False),
-                        config='--oem 3 --psm 7 --dpi 300'
-                    ).strip().upper()
-
-                    # Extract just the system name (before LAST UPDATED)
-                    if 'LAST UPDATED' in text:
-                        name = text.split('LAST UPDATED')[0].strip()
-                    else:
-                        name = text
-
-                    # Clean up common OCR prefix noise
-                    for prefix in ['= ', '_ ', 'A ', 'V ', '> ', '- ', '| ']:
-                        if name.startswith(prefix):
-                            name = name[len(prefix):].strip()
-
-                    # Apply OCR error corrections
-                    # Fix common OCR misreads: DE -> D2, DE- -> D2-, GE -> CE
-                    name = re.sub(r'([A-Z])E-(\d)', r'\g<1>2-\2', name)  # DE-20 -> D2-20
-                    name = re.sub(r'([A-Z])E(\d)', r'\1\2', name)  # DE2 -> D2
-                    name = re.sub(r'\bGE-', 'CE-', name)  # GE-N -> CE-N
-                    name = re.sub(r'\bGOL\b', 'COL', name)  # GOL -> COL
-
-                    # Valid system name should be at least 3 characters
-                    # Can have "SECTOR" or be a simple name like "LTT 970"
-                    if len(name) >= 3:
-                        candidates.append(name)
-
-                # Pick the most common result, or the first valid one
-                if candidates:
-                    # Use the first candidate from 'none' or 'upscale' if available
-                    info['system_name'] = candidates[0]
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            system_name, distance = self._read_system_name(subsections['system_name'], expected_name)
+            ocr_fields['system_name'] = system_name or ''
+            if system_name:
+                info['system_name'] = system_name
+                info['_system_name_distance'] = distance
 
         # Process status section - look for status keyword in clean text
         if 'system_status' in subsections:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                subsections['system_status'].save(tmp_path)
+            section_img = subsections['system_status']
+            text = self._ocr_section(section_img, 'upscale', '--oem 3 --psm 6 --dpi 300').strip()
+            ocr_fields['system_status'] = text
 
-            try:
-                text = pytesseract.image_to_string(
-                    self.preprocess_image(tmp_path, method='upscale', crop_panel=False),
-                    config='--oem 3 --psm 6 --dpi 300'
-                ).strip()
-
-                # Extract first word from description text
-                # "Exploited systems have..." -> "EXPLOITED"
-                first_word = text.split()[0].upper() if text else ''
+            # Extract first word from description text
+            # "Exploited systems have..." -> "EXPLOITED"
+            first_word = text.split()[0].upper() if text else ''
 
-                status_keywords = ['STRONGHOLD', 'FORTIFIED', 'EXPLOITED', 'UNOCCUPIED']
-                if first_word in status_keywords:
-                    info['system_status'] = first_word
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            status_keywords = ['STRONGHOLD', 'FORTIFIED', 'EXPLOITED', 'UNOCCUPIED']
+            if first_word in status_keywords:
+                info['system_status'] = first_word
 
-        # Process controlling power section - PSM 6, upscale for text
+        # Process controlling power section - reference renders first, then OCR (PSM 6, upscale)
         if 'controlling_power' in subsections:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                subsections['controlling_power'].save(tmp_path)
+            section_img = subsections['controlling_power']
+            best_match = self._classify_power(section_img)
 
-            try:
-                text = pytesseract.image_to_string(
-                    self.preprocess_image(tmp_path, method='upscale', crop_panel=False),
-                    config='--oem 3 --psm 6 --dpi 300'
-                ).upper()
-
-                # Known power names
-                power_names = [
-                    'ARISSA LAVIGNY-DUVAL', 'AISLING DUVAL', 'ZEMINA TORVAL',
-                    'DENTON PATREUS', 'ZACHARY HUDSON', 'FELICIA WINTERS',
-                    'EDMUND MAHON', 'LI YONG-RUI', 'PRANAV ANTAL',
-                    'ARCHON DELAINE', 'YURI GROM', 'NAKATO KAINE', 'JEROME ARCHER'
-                ]
-
-                # Match against known powers with fuzzy matching
-                from difflib import SequenceMatcher
-                best_match = None
-                best_ratio = 0.7
-
-                for power in power_names:
-                    if power in text:
-                        best_match = power
-                        break
-                    # Fuzzy match
-                    ratio = SequenceMatcher(None, text.replace('\n', ' '), power).ratio()
-                    if ratio > best_ratio:
-                        best_ratio = ratio
-                        best_match = power
+            if best_match is None:
+                text = self._ocr_section(section_img, 'upscale', '--oem 3 --psm 6 --dpi 300')
+                ocr_fields['controlling_power'] = text
 
-                if best_match:
-                    info['controlling_power'] = best_match.title()
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+                # Fallback: match OCR text against known powers (exact, then bounded edit distance)
+                best_match, _ = _power_matcher.match(text)
+            else:
+                ocr_fields['controlling_power'] = f"[template] {best_match}"
+
+            if best_match:
+                info['controlling_power'] = best_match.title()
 
         # Process control points section - both undermining and reinforcing
-        # Use majority voting across multiple OCR methods for better accuracy
+        # Template-matched digits first; Tesseract only when they are not confident
+        template_numbers = None
         if 'control_points' in subsections:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                subsections['control_points'].save(tmp_path)
+            template_numbers = self._read_numbers(subsections['control_points'], count=2)
 
-            try:
-                # Use Tesseract with 3x upscaling - achieves 100% accuracy
-                undermining_votes = []
-                reinforcing_votes = []
-
-                for method in ['upscale']:
-                    text_full = pytesseract.image_to_string(
-                        self.preprocess_image(tmp_path, method=method, crop_panel=False),
-                        config='--oem 3 --psm 7 --dpi 300'
-                    ).strip()
-
-                    # Try to split by "CONTROL POINTS" to separate the two numbers
-                    if 'CONTROL POINTS' in text_full.upper():
-                        parts = re.split(r'CONTROL\s+POINTS', text_full, flags=re.IGNORECASE)
-                        if len(parts) == 2:
-                            # Extract undermining number
-                            undermining_match = re.search(r'(\d{1,}(?:,\d{3})*)', parts[0])
-                            if undermining_match:
-                                try:
-                                    value = int(undermining_match.group(1).replace(',', ''))
-                                    undermining_votes.append(value)
-                                except ValueError:
-                                    pass
-                            else:
-                                # Check if it's 0
-                                text_cleaned = parts[0].strip()
-                                if re.match(r'^[0O]\s*$', text_cleaned) or len(text_cleaned) < 3:
-                                    undermining_votes.append(0)
-
-                            # Extract reinforcing number
-                            reinforcing_match = re.search(r'(\d{1,}(?:,\d{3})*)', parts[1])
-                            if reinforcing_match:
-                                try:
-                                    value = int(reinforcing_match.group(1).replace(',', ''))
-                                    reinforcing_votes.append(value)
-                                except ValueError:
-                                    pass
-                            else:
-                                # Check if it's 0
-                                text_cleaned = parts[1].strip()
-                                if re.match(r'^[0O]\s*$', text_cleaned) or len(text_cleaned) < 3:
-                                    reinforcing_votes.append(0)
-                    else:
-                        # Fallback: if "CONTROL POINTS" not found, try to extract any two numbers
-                        numbers = re.findall(r'(\d{1,}(?:,\d{3})*)', text_full)
-                        if len(numbers) >= 2:
+        if template_numbers:
+            info['undermining_points'], info['reinforcing_points'] = template_numbers
+            ocr_fields['control_points'] = "[template] {:,} CONTROL POINTS {:,}".format(*template_numbers)
+
+        # Use majority voting across multiple OCR methods for better accuracy
+        elif 'control_points' in subsections:
+            section_img = subsections['control_points']
+            # Use Tesseract with 3x upscaling - achieves 100% accuracy
+            undermining_votes = []
+            reinforcing_votes = []
+
+            for method in ['upscale']:
+                text_full = self._ocr_section(section_img, method, '--oem 3 --psm 7 --dpi 300').strip()
+                ocr_fields['control_points'] = text_full
+
+                # Try to split by "CONTROL POINTS" to separate the two numbers
+                if 'CONTROL POINTS' in text_full.upper():
+                    parts = re.split(r'CONTROL\s+POINTS', text_full, flags=re.IGNORECASE)
+                    if len(parts) == 2:
+                        # Extract undermining number
+                        undermining_match = re.search(r'(\d{1,}(?:,\d{3})*)', parts[0])
+                        if undermining_match:
                             try:
-                                undermining_votes.append(int(numbers[0].replace(',', '')))
-                                reinforcing_votes.append(int(numbers[1].replace(',', '')))
+                                value = int(undermining_match.group(1).replace(',', ''))
+                                undermining_votes.append(value)
                             except ValueError:
                                 pass
-
-                # With single method (upscale), just use the value directly
-                if undermining_votes:
-                    info['undermining_points'] = undermining_votes[0]
-                    info['_undermining_votes'] = undermining_votes
-                    info['_undermining_winner'] = undermining_votes[0]
-
-                if reinforcing_votes:
-                    info['reinforcing_points'] = reinforcing_votes[0]
-                    info['_reinforcing_votes'] = reinforcing_votes
-                    info['_reinforcing_winner'] = reinforcing_votes[0]
-
-                # If still no results after voting, try the fallback method with digit whitelist
-                if info['undermining_points'] == -1 or info['reinforcing_points'] == -1:
-                    text = pytesseract.image_to_string(
-                        self.preprocess_image(tmp_path, method='upscale', crop_panel=False),
-                        config='--oem 3 --psm 7 --dpi 300 -c tessedit_char_whitelist=0123456789, '
-                    ).strip()
-
-                    numbers = re.findall(r'(\d{1,}(?:,\d{3})*)', text)
+                        else:
+                            # Check if it's 0
+                            text_cleaned = parts[0].strip()
+                            if re.match(r'^[0O]\s*$', text_cleaned) or len(text_cleaned) < 3:
+                                undermining_votes.append(0)
+
+                        # Extract reinforcing number
+                        reinforcing_match = re.search(r'(\d{1,}(?:,\d{3})*)', parts[1])
+                        if reinforcing_match:
+                            try:
+                                value = int(reinforcing_match.group(1).replace(',', ''))
+                                reinforcing_votes.append(value)
+                            except ValueError:
+                                pass
+                        else:
+                            # Check if it's 0
+                            text_cleaned = parts[1].strip()
+                            if re.match(r'^[0O]\s*$', text_cleaned) or len(text_cleaned) < 3:
+                                reinforcing_votes.append(0)
+                else:
+                    # Fallback: if "CONTROL POINTS" not found, try to extract any two numbers
+                    numbers = re.findall(r'(\d{1,}(?:,\d{3})*)', text_full)
                     if len(numbers) >= 2:
                         try:
-                            if info['undermining_points'] == -1:
-                                info['undermining_points'] = int(numbers[0].replace(',', ''))
-                            if info['reinforcing_points'] == -1:
-                                info['reinforcing_points'] = int(numbers[1].replace(',', ''))
-                        except ValueError:
-                            pass
-                    elif len(numbers) == 1:
-                        try:
-                            if info['undermining_points'] == -1:
-                                info['undermining_points'] = int(numbers[0].replace(',', ''))
-                            # Check if reinforcing might be 0
-                            if info['reinforcing_points'] == -1 and ('0' in text or len(text) < 5):
-                                info['reinforcing_points'] = 0
+                            undermining_votes.append(int(numbers[0].replace(',', '')))
+                            reinforcing_votes.append(int(numbers[1].replace(',', '')))
                         except ValueError:
                             pass
-                    elif len(numbers) == 0:
-                        # No numbers found at all - might be 0 0
-                        if len(text) < 5 or re.match(r'^[0O\s,]*$', text):
-                            if info['undermining_points'] == -1:
-                                info['undermining_points'] = 0
-                            if info['reinforcing_points'] == -1:
-                                info['reinforcing_points'] = 0
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
 
+            # With single method (upscale), just use the value directly
+            if undermining_votes:
+                info['undermining_points'] = undermining_votes[0]
+                info['_undermining_votes'] = undermining_votes
+                info['_undermining_winner'] = undermining_votes[0]
+
+            if reinforcing_votes:
+                info['reinforcing_points'] = reinforcing_votes[0]
+                info['_reinforcing_votes'] = reinforcing_votes
+                info['_reinforcing_winner'] = reinforcing_votes[0]
+
+            # If still no results after voting, try the fallback method with digit whitelist
+            if info['undermining_points'] == -1 or info['reinforcing_points'] == -1:
+                text = self._ocr_section(
+                    section_img, 'upscale',
+                    '--oem 3 --psm 7 --dpi 300 -c tessedit_char_whitelist=0123456789, '
+                ).strip()
+                ocr_fields['control_points_digits'] = text
+
+                numbers = re.findall(r'(\d{1,}(?:,\d{3})*)', text)
+                if len(numbers) >= 2:
+                    try:
+                        if info['undermining_points'] == -1:
+                            info['undermining_points'] = int(numbers[0].replace(',', ''))
+                        if info['reinforcing_points'] == -1:
+                            info['reinforcing_points'] = int(numbers[1].replace(',', ''))
+                    except ValueError:
+                        pass
+                elif len(numbers) == 1:
+                    try:
+                        if info['undermining_points'] == -1:
+                            info['undermining_points'] = int(numbers[0].replace(',', ''))
+                        # Check if reinforcing might be 0
+                        if info['reinforcing_points'] == -1 and ('0' in text or len(text) < 5):
+                            info['reinforcing_points'] = 0
+                    except ValueError:
+                        pass
+                elif len(numbers) == 0:
+                    # No numbers found at all - might be 0 0
+                    if len(text) < 5 or re.match(r'^[0O\s,]*$', text):
+                        if info['undermining_points'] == -1:
+                            info['undermining_points'] = 0
+                        if info['reinforcing_points'] == -1:
+                            info['reinforcing_points'] = 0
+
+        info['_ocr_fields'] = ocr_fields
+        self._prefetched.clear()
         return info
 
-    def extract_powerplay_competitive(self, image_path):
+    @tracing.traced()
+    def extract_powerplay_competitive(self, image_path, expected_name=None):
         """
         Extract powerplay data for EXPANSION/CONTESTED states using subsection coordinates
         These states have a different layout with multiple competing powers
 
         Args:
-            image_path: Path to screenshot (full or already cropped extended panel)
+            image_path: Path to screenshot (full or already cropped extended panel) or ScreenshotContext
+            expected_name: System name the screenshot should show (optional, see _read_system_name)
 
         Returns:
             Dictionary with extracted powerplay information including multiple powers
         """
-        import tempfile
-        import os
-
         # Get the exact subsections for competitive states
-        subsections = self.crop_powerplay_subsections_competitive(image_path)
+        subsections = self.crop_powerplay_subsections_competitive(image_path, as_array=True)
 
         info = {
             'system_name': '',
@@ -943,75 +1343,45 @@ class PowerplayOCR:
             'undermining_points': -1,  # Not applicable for competitive states
             'reinforcing_points': -1   # Not applicable for competitive states
         }
+        # What each field read (OCR text, or the template match), for debug output
+        ocr_fields = {}
+
+        self._prefetch_subsections(subsections, [
+            ('system_name', 'none', '--oem 3 --psm 7 --dpi 300'),
+            ('system_status', 'upscale', '--oem 3 --psm 6 --dpi 300'),
+            ('power_1st_name', 'upscale', '--oem 3 --psm 6 --dpi 300'),
+            ('power_2nd_name', 'upscale', '--oem 3 --psm 6 --dpi 300'),
+            ('power_your_name', 'upscale', '--oem 3 --psm 6 --dpi 300'),
+            ('power_1st_score', 'none', '--oem 3 --psm 7 --dpi 300'),
+            ('power_2nd_score', 'none', '--oem 3 --psm 7 --dpi 300'),
+            ('power_your_score', 'none', '--oem 3 --psm 7 --dpi 300'),
+            ('power_your_rank', 'none', '--oem 3 --psm 8 --dpi 300'),
+        ])
 
         # Process system name section - same as standard states
         if 'system_name' in subsections:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                subsections['system_name'].save(tmp_path)
-
-            try:
-                # Try multiple methods to get best OCR result
-                for method in ['none', 'upscale', 'threshold']:
-                    text = pytesseract.image_to_string(
-                        self.preprocess_image(tmp_path, method=method, crop_panel=False),
-                        config='--oem 3 --psm 7 --dpi 300'
-                    ).strip().upper()
-
-                    # Extract just the system name (before LAST UPDATED)
-                    if 'LAST UPDATED' in text:
-                        name = text.split('LAST UPDATED')[0].strip()
-                    else:
-                        name = text
-
-                    # Clean up common OCR prefix noise
-                    for prefix in ['= ', '_ ', 'A ', 'V ', '> ', '- ', '| ']:
-                        if name.startswith(prefix):
-                            name = name[len(prefix):].strip()
-
-                    # Apply OCR error corrections
-                    name = re.sub(r'([A-Z])E-(\d)', r'\g<1>2-\2', name)
-                    name = re.sub(r'([A-Z])E(\d)', r'\1\2', name)
-                    name = re.sub(r'\bGE-', 'CE-', name)
-                    name = re.sub(r'\bGOL\b', 'COL', name)
-
-                    # Valid system name should be at least 3 characters
-                    if len(name) >= 3:
-                        info['system_name'] = name
-                        break
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            system_name, distance = self._read_system_name(subsections['system_name'], expected_name)
+            ocr_fields['system_name'] = system_name or ''
+            if system_name:
+                info['system_name'] = system_name
+                info['_system_name_distance'] = distance
 
         # Process status section - look for EXPANSION or CONTESTED
         if 'system_status' in subsections:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                subsections['system_status'].save(tmp_path)
-
-            try:
-                text = pytesseract.image_to_string(
-                    self.preprocess_image(tmp_path, method='upscale', crop_panel=False),
-                    config='--oem 3 --psm 6 --dpi 300'
-                ).strip().upper()
-
-                # Check for competitive state keywords
-                # CONTESTED: "Contested systems have multiple Powers actively competing"
-                # EXPANSION: Systems being expanded into (may show in description)
-                # UNOCCUPIED: "Unoccupied systems have not been expanded into by any Power"
-                if 'CONTESTED' in text:
-                    info['system_status'] = 'CONTESTED'
-                elif 'EXPANSION' in text:
-                    info['system_status'] = 'EXPANSION'
-                elif 'UNOCCUPIED' in text:
-                    info['system_status'] = 'UNOCCUPIED'
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            section_img = subsections['system_status']
+            text = self._ocr_section(section_img, 'upscale', '--oem 3 --psm 6 --dpi 300').strip().upper()
+            ocr_fields['system_status'] = text
+
+            # Check for competitive state keywords
+            # CONTESTED: "Contested systems have multiple Powers actively competing"
+            # EXPANSION: Systems being expanded into (may show in description)
+            # UNOCCUPIED: "Unoccupied systems have not been expanded into by any Power"
+            if 'CONTESTED' in text:
+                info['system_status'] = 'CONTESTED'
+            elif 'EXPANSION' in text:
+                info['system_status'] = 'EXPANSION'
+            elif 'UNOCCUPIED' in text:
+                info['system_status'] = 'UNOCCUPIED'
 
         # Process power sections - 1st, 2nd, and Your power
         power_sections = [
@@ -1020,77 +1390,38 @@ class PowerplayOCR:
             ('power_your_name', 'power_your_score', None)  # Rank determined separately
         ]
 
-        # Known power names for fuzzy matching
-        power_names = [
-            'ARISSA LAVIGNY-DUVAL', 'AISLING DUVAL', 'ZEMINA TORVAL',
-            'DENTON PATREUS', 'ZACHARY HUDSON', 'FELICIA WINTERS',
-            'EDMUND MAHON', 'LI YONG-RUI', 'PRANAV ANTAL',
-            'ARCHON DELAINE', 'YURI GROM', 'NAKATO KAINE', 'JEROME ARCHER'
-        ]
-
         for name_key, score_key, rank in power_sections:
             if name_key in subsections and score_key in subsections:
-                # Extract power name
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp_path = tmp.name
-                    subsections[name_key].save(tmp_path)
-
+                # Extract power name - reference renders first, OCR + fuzzy matching as fallback
+                section_img = subsections[name_key]
                 power_name = ''
-                try:
-                    text = pytesseract.image_to_string(
-                        self.preprocess_image(tmp_path, method='upscale', crop_panel=False),
-                        config='--oem 3 --psm 6 --dpi 300'
-                    ).upper()
-
-                    # Match against known powers with fuzzy matching
-                    from difflib import SequenceMatcher
-                    best_match = None
-                    best_ratio = 0.7
-
-                    for power in power_names:
-                        if power in text:
-                            best_match = power
-                            break
-                        ratio = SequenceMatcher(None, text.replace('\n', ' '), power).ratio()
-                        if ratio > best_ratio:
-                            best_ratio = ratio
-                            best_match = power
-
-                    if best_match:
-                        power_name = best_match.title()
-                finally:
-                    try:
-                        os.unlink(tmp_path)
-                    except:
-                        pass
+                best_match = self._classify_power(section_img)
 
-                # Extract control score
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp_path = tmp.name
-                    subsections[score_key].save(tmp_path)
+                if best_match is None:
+                    text = self._ocr_section(section_img, 'upscale', '--oem 3 --psm 6 --dpi 300')
+                    ocr_fields[name_key] = text
 
+                    # Match against known powers (exact, then bounded edit distance)
+                    best_match, _ = _power_matcher.match(text)
+                else:
+                    ocr_fields[name_key] = f"[template] {best_match}"
+
+                if best_match:
+                    power_name = best_match.title()
+
+                # Extract control score
+                section_img = subsections[score_key]
                 control_score = -1
-                try:
+                template_numbers = self._read_numbers(section_img, count=1)
+                if template_numbers:
+                    control_score = template_numbers[0]
+                    ocr_fields[score_key] = f"[template] {control_score:,}"
+                else:
                     # Try multiple methods for best accuracy on numbers
-                    for method in ['none', 'threshold', 'upscale']:
-                        text = pytesseract.image_to_string(
-                            self.preprocess_image(tmp_path, method=method, crop_panel=False),
-                            config='--oem 3 --psm 7 --dpi 300'
-                        ).strip()
-
-                        # Extract number (with or without commas)
-                        number_match = re.search(r'(\d{1,}(?:,\d{3})*)', text)
-                        if number_match:
-                            try:
-                                control_score = int(number_match.group(1).replace(',', ''))
-                                break
-                            except ValueError:
-                                pass
-                finally:
-                    try:
-                        os.unlink(tmp_path)
-                    except:
-                        pass
+                    score = self._ocr_cascade('power_score', section_img, self._parse_score)
+                    ocr_fields[score_key] = f"{score:,}" if score is not None else ''
+                    if score is not None:
+                        control_score = score
 
                 # Store power info
                 if power_name and control_score >= 0:
@@ -1108,75 +1439,82 @@ class PowerplayOCR:
                         'rank': rank
                     })
 
-        # Process your power rank
+        # Process your power rank - cascade over PSM modes and preprocessing methods
         if 'power_your_rank' in subsections:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                subsections['power_your_rank'].save(tmp_path)
-
-            try:
-                # Try multiple PSM modes and preprocessing methods
-                best_rank = ''
-
-                for psm in [8, 7, 13]:  # PSM 8=single word, 7=single line, 13=raw line
-                    for method in ['none', 'threshold', 'upscale']:
-                        text = pytesseract.image_to_string(
-                            self.preprocess_image(tmp_path, method=method, crop_panel=False),
-                            config=f'--oem 3 --psm {psm} --dpi 300'
-                        ).strip().upper()
-
-                        # Look for rank indicators: 1ST, 2ND, 3RD, 4TH, 5TH, etc.
-                        rank_match = re.search(r'(\d+)(ST|ND|RD|TH)', text)
-                        if rank_match:
-                            rank_num = rank_match.group(1)
-                            rank_suffix = rank_match.group(2).lower()
-                            best_rank = f"{rank_num}{rank_suffix}"
-                            break
-
-                        # Check for common OCR errors: "Sth" or "oth" for "5th"
-                        if text in ['STH', 'OTH', 'STI']:
-                            best_rank = '5th'
-                            break
-                        elif text in ['1ST', 'IST']:
-                            best_rank = '1st'
-                            break
-                        elif text in ['2ND']:
-                            best_rank = '2nd'
-                            break
-                        elif text in ['3RD']:
-                            best_rank = '3rd'
-                            break
-                        elif text in ['4TH']:
-                            best_rank = '4th'
-                            break
-
-                        # Fallback: just a digit
-                        digit_match = re.search(r'\b([1-9])\b', text)
-                        if digit_match:
-                            digit = digit_match.group(1)
-                            if digit == '1':
-                                best_rank = '1st'
-                            elif digit == '2':
-                                best_rank = '2nd'
-                            elif digit == '3':
-                                best_rank = '3rd'
-                            else:
-                                best_rank = f"{digit}th"
-                            break
-
-                    if best_rank:
-                        break
-
-                info['your_rank'] = best_rank
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            info['your_rank'] = self._ocr_cascade('your_rank', subsections['power_your_rank'], self._parse_rank) or ''
+            ocr_fields['power_your_rank'] = info['your_rank']
 
+        info['_ocr_fields'] = ocr_fields
+        self._prefetched.clear()
         return info
 
-    def extract_powerplay_auto(self, image_path):
+    @tracing.traced()
+    def classify_layout(self, image_path):
+        """
+        Decide between the standard and competitive layouts from pixel statistics (no OCR)
+
+        Args:
+            image_path: Path to screenshot (full or extended panel crop), NumPy array or ScreenshotContext
+
+        Returns:
+            Tuple of (layout, confidence) with layout 'standard' or 'competitive' and
+            confidence in 0..1, or (None, 0.0) if no signatures are loaded or the
+            image does not contain the extended panel
+        """
+        if self.layout_classifier is None:
+            return None, 0.0
+        ctx = ScreenshotContext.wrap(image_path)
+        features = ctx.memo('layout_features', lambda: layout_features(ctx.panel(extended=True)))
+        return self.layout_classifier.classify(features)
+
+    @tracing.traced()
+    def detect_layout_ocr(self, image_path):
+        """
+        Decide between the standard and competitive layouts by OCR'ing the status text
+
+        Args:
+            image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+
+        Returns:
+            'competitive' for CONTESTED/EXPANSION/UNOCCUPIED, otherwise 'standard'
+        """
+        ctx = ScreenshotContext.wrap(image_path)
+        img = ctx.image
+
+        height, width = img.shape[:2]
+
+        # Crop status description region to check for keywords
+        if width > 2000:
+            # Full screenshot - crop to status region
+            # Status is at roughly (PANEL_LEFT+14, PANEL_TOP+212) to (PANEL_LEFT+734, PANEL_TOP+280)
+            width_scale = width / config.EXPECTED_SCREEN_WIDTH
+            height_scale = height / config.EXPECTED_SCREEN_HEIGHT
+
+            left = int((config.PANEL_LEFT + 14) * width_scale)
+            top = int((config.PANEL_TOP + 212) * height_scale)
+            right = int((config.PANEL_LEFT + 734) * width_scale)
+            bottom = int((config.PANEL_TOP + 280) * height_scale)
+
+            status_region = img[top:bottom, left:right]
+        else:
+            # Already cropped panel - get status region
+            if height < 700:
+                # Standard panel dimensions
+                status_region = img[212:280, 14:424]
+            else:
+                # Extended panel dimensions
+                status_region = img[212:272, 14:734]
+
+        # Quick OCR of status region
+        status_text = self._ocr_section(status_region, 'upscale', '--oem 3 --psm 6 --dpi 300').upper()
+
+        # Detect competitive state keywords
+        if any(kw in status_text for kw in ['CONTESTED', 'EXPANSION', 'UNOCCUPIED']):
+            return 'competitive'
+        return 'standard'
+
+    @tracing.traced()
+    def extract_powerplay_auto(self, image_path, expected_name=None):
         """
         Automatically detect state type and extract powerplay data using the appropriate parser
 
@@ -1187,82 +1525,40 @@ class PowerplayOCR:
         3. Returns unified data structure
 
         Args:
-            image_path: Path to screenshot (full or cropped panel)
+            image_path: Path to screenshot (full or cropped panel), NumPy array or ScreenshotContext
+            expected_name: System name the screenshot should show, e.g. the name searched for (optional)
 
         Returns:
             Dictionary with extracted powerplay information
         """
-        import tempfile
-        import os
-
-        # Strategy: Peek at status text to detect state type
+        # Strategy: Classify the layout from pixel signatures; if that is not confident,
+        # peek at the status text instead
         # Competitive states: CONTESTED, EXPANSION, UNOCCUPIED
         # Standard states: EXPLOITED, FORTIFIED, STRONGHOLD
 
-        img = cv2.imread(image_path)
-        if img is None:
-            raise ValueError(f"Could not load image: {image_path}")
-
-        height, width = img.shape[:2]
+        # Decode once and share the context with the chosen extractor
+        ctx = ScreenshotContext.wrap(image_path)
 
         try:
-            # Crop status description region to check for keywords
-            if width > 2000:
-                # Full screenshot - crop to status region
-                # Status is at roughly (PANEL_LEFT+14, PANEL_TOP+212) to (PANEL_LEFT+734, PANEL_TOP+280)
-                width_scale = width / config.EXPECTED_SCREEN_WIDTH
-                height_scale = height / config.EXPECTED_SCREEN_HEIGHT
-
-                left = int((config.PANEL_LEFT + 14) * width_scale)
-                top = int((config.PANEL_TOP + 212) * height_scale)
-                right = int((config.PANEL_LEFT + 734) * width_scale)
-                bottom = int((config.PANEL_TOP + 280) * height_scale)
-
-                status_region = img[top:bottom, left:right]
-            else:
-                # Already cropped panel - get status region
-                if height < 700:
-                    # Standard panel dimensions
-                    status_region = img[212:280, 14:424]
-                else:
-                    # Extended panel dimensions
-                    status_region = img[212:272, 14:734]
-
-            # Quick OCR of status region
-            status_pil = Image.fromarray(cv2.cvtColor(status_region, cv2.COLOR_BGR2RGB))
-
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                status_pil.save(tmp_path)
-
-            status_text = pytesseract.image_to_string(
-                self.preprocess_image(tmp_path, method='upscale', crop_panel=False),
-                config='--oem 3 --psm 6 --dpi 300'
-            ).upper()
+            layout, confidence = self.classify_layout(ctx)
+            if layout is None or confidence < config.LAYOUT_MIN_CONFIDENCE:
+                layout = self.detect_layout_ocr(ctx)
 
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
-
-            # Detect competitive state keywords
-            is_competitive = any(kw in status_text for kw in ['CONTESTED', 'EXPANSION', 'UNOCCUPIED'])
-
-            if is_competitive:
-                return self.extract_powerplay_competitive(image_path)
+            if layout == 'competitive':
+                return self.extract_powerplay_competitive(ctx, expected_name)
             else:
-                return self.extract_powerplay_subsections_optimized(image_path)
+                return self.extract_powerplay_subsections_optimized(ctx, expected_name)
 
         except Exception as e:
             # Fallback: Try standard first, then competitive
             try:
-                standard_info = self.extract_powerplay_subsections_optimized(image_path)
+                standard_info = self.extract_powerplay_subsections_optimized(ctx, expected_name)
                 if self.is_valid_powerplay_data(standard_info):
                     return standard_info
             except:
                 pass
 
-            return self.extract_powerplay_competitive(image_path)
+            return self.extract_powerplay_competitive(ctx, expected_name)
 
     def extract_text_hybrid(self, image_path, preprocess_method='upscale'):
         """
@@ -1298,44 +1594,28 @@ class PowerplayOCR:
 
         # Step 1b: If system name is still missing, try header subsection
         if not info['system_name']:
-            subsections = self.crop_powerplay_subsections(image_path)
+            subsections = self.crop_powerplay_subsections(image_path, as_array=True)
             header_section = subsections['header']
 
-            import tempfile
-            import os
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                header_section.save(tmp.name)
-                temp_path = tmp.name
-
-            processed = self.preprocess_image(temp_path, method=preprocess_method, crop_panel=False)
+            processed = self.preprocess_image(header_section, method=preprocess_method, crop_panel=False,
+                                              as_array=True)
             custom_config = r'--oem 1 --psm 6 --dpi 300'
-            header_text = pytesseract.image_to_string(processed, config=custom_config)
+            header_text = self.engine.image_to_string(processed, config=custom_config)
             header_info = self.parse_powerplay_info(header_text)
 
             if header_info['system_name']:
                 info['system_name'] = header_info['system_name']
 
-            try:
-                os.remove(temp_path)
-            except:
-                pass
-
         # Step 2: If power name is missing, use subsection OCR for power_section
         if not (info['controlling_power'] or info['opposing_power']):
-            subsections = self.crop_powerplay_subsections(image_path)
+            subsections = self.crop_powerplay_subsections(image_path, as_array=True)
             power_section = subsections['power_section']
 
-            # Save to temp file for preprocessing
-            import tempfile
-            import os
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                power_section.save(tmp.name)
-                temp_path = tmp.name
-
             # Preprocess and OCR with PSM 3 (best for power section)
-            processed = self.preprocess_image(temp_path, method=preprocess_method, crop_panel=False)
+            processed = self.preprocess_image(power_section, method=preprocess_method, crop_panel=False,
+                                              as_array=True)
             custom_config = r'--oem 1 --psm 3 --dpi 300'
-            power_text = pytesseract.image_to_string(processed, config=custom_config)
+            power_text = self.engine.image_to_string(processed, config=custom_config)
             power_info = self.parse_powerplay_info(power_text)
 
             # Use power names from subsection
@@ -1343,35 +1623,20 @@ class PowerplayOCR:
                 info['controlling_power'] = power_info['controlling_power']
                 info['opposing_power'] = power_info['opposing_power']
 
-            try:
-                os.remove(temp_path)
-            except:
-                pass
-
         # Step 3: If status is missing, try subsection OCR for status section
         if not info['system_status']:
-            subsections = self.crop_powerplay_subsections(image_path)
+            subsections = self.crop_powerplay_subsections(image_path, as_array=True)
             status_section = subsections['status']
 
-            import tempfile
-            import os
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                status_section.save(tmp.name)
-                temp_path = tmp.name
-
-            processed = self.preprocess_image(temp_path, method=preprocess_method, crop_panel=False)
+            processed = self.preprocess_image(status_section, method=preprocess_method, crop_panel=False,
+                                              as_array=True)
             custom_config = r'--oem 1 --psm 6 --dpi 300'
-            status_text = pytesseract.image_to_string(processed, config=custom_config)
+            status_text = self.engine.image_to_string(processed, config=custom_config)
             status_info = self.parse_powerplay_info(status_text)
 
             if status_info['system_status']:
                 info['system_status'] = status_info['system_status']
 
-            try:
-                os.remove(temp_path)
-            except:
-                pass
-
         # Step 4: EasyOCR fallback for severe failures
         # If critical fields still missing, try EasyOCR on the whole panel
         if not info['system_name'] or not (info['controlling_power'] or info['opposing_power']):
@@ -1393,6 +1658,7 @@ class PowerplayOCR:
 
         return info
 
+    @tracing.traced()
     def parse_powerplay_info(self, text):
         """
         Parse Powerplay information panel from extracted text
@@ -1417,425 +1683,45 @@ class PowerplayOCR:
         Returns:
             Dictionary with parsed Powerplay information
         """
-        info = {
-            'system_name': '',
-            'last_updated': '',
-            'distance_ly': 0.0,
-            'time_ago': '',
-            'system_status': '',
-            'status_description': '',
-            'opposing_power': '',
-            'controlling_power': '',
-            'undermining_points': -1,  # -1 means not parsed, 0 is valid
-            'reinforcing_points': -1,  # -1 means not parsed, 0 is valid
-            'control_points': -1,      # -1 means not parsed, 0 is valid
-            'system_strength_penalty': '',
-            'beyond_frontline_penalty': ''
-        }
-
-        lines = text.strip().split('\n')
-
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-
-            # System name - typically follows "POWERPLAY INFORMATION"
-            # Elite Dangerous system names: Letters, numbers, hyphens, spaces
-            # Examples: "COL 359 SECTOR EK-L B10-4", "FLOARPH MJ-O D7-19"
-
-            # Check if we recently passed "POWERPLAY INFORMATION" (within last 3 lines)
-            # Allow for OCR variations like "POVWERPLAY", "POWERPIAY", etc.
-            if not info['system_name']:
-                powerplay_found = False
-                for j in range(max(0, i-3), i):
-                    line_check = lines[j].upper()
-                    if 'POWERPLAY INFORMATION' in line_check or 'POVWERPLAY INFORMATION' in line_check or ('POWER' in line_check and 'INFORMATION' in line_check):
-                        powerplay_found = True
-                        break
-
-                if powerplay_found:
-                    # This line might be the system name
-                    # Remove common prefix characters like "_ ", "A ", "= ", etc.
-                    cleaned_line = line
-                    for prefix in ['= ', '_ ', 'A ', 'V ', '> ', '- ', '| ']:
-                        if cleaned_line.startswith(prefix):
-                            cleaned_line = cleaned_line[len(prefix):].strip()
-
-                    # Extract system name (stops at LAST UPDATED or special chars)
-                    # Allow lowercase letters for OCR errors like "De2-16" instead of "DE2-16"
-                    system_match = re.match(r'^([A-Za-z0-9][A-Za-z0-9\s\-]+?)(?:\s+LAST\s+UPDATED|[\s=,._]*$)', cleaned_line, re.IGNORECASE)
-                    if system_match and len(system_match.group(1).strip()) > 5:
-                        # Make sure it's not just other text
-                        name = system_match.group(1).strip().upper()  # Convert to uppercase
-                        if not any(x in name for x in ['DISTANCE', 'MINUTES', 'EXPLOITED', 'FORTIFIED']):
-                            # Fix common OCR errors in Elite Dangerous system names
-                            # Pattern: Letters followed by digits should not have extra letters inserted
-                            # e.g., "DE2-16" should be "D2-16" (remove E before digit)
-                            #       "CB-1" should be "C5-1" (B looks like 5)
-
-                            # Fix pattern like "DE2" -> "D2", "CE5" -> "C5" (extra E before digit)
-                            name = re.sub(r'([A-Z])E(\d)', r'\1\2', name)
-
-                            # Fix common character confusions
-                            # In system codes, B is often misread 5, O is 0, etc.
-                            # But only fix in the suffix portion (after the last space/hyphen)
-                            parts = re.split(r'(\s+|-)', name)
-                            if len(parts) > 0:
-                                last_part = parts[-1]
-                                # Fix CB-X -> C5-X pattern (B after letter before hyphen)
-                                if re.match(r'^[A-Z]B-\d', last_part):
-                                    last_part = last_part.replace('B-', '5-', 1)
-                                    parts[-1] = last_part
-                                name = ''.join(parts)
-
-                            info['system_name'] = name
-
-            # Distance in light years
-            # Handle various formats: "19,812.17LY", "19,839.2 1LY" (with space before last digit)
-            distance_match = re.search(r'DISTANCE[:\s]+(\d+[,.\s]*\d*\.?\d*)\s*LY', line, re.IGNORECASE)
-            if distance_match:
-                # Remove commas and spaces from number
-                dist_str = distance_match.group(1).replace(',', '').replace(' ', '')
-                try:
-                    info['distance_ly'] = float(dist_str)
-                except ValueError:
-                    pass
-
-            # Time since last update
-            time_match = re.search(r'(\d+)\s+(SECOND|MINUTE|HOUR|DAY)S?\s+AGO', line, re.IGNORECASE)
-            if time_match:
-                info['time_ago'] = f"{time_match.group(1)} {time_match.group(2).lower()}s ago"
-
-            # System status (FORTIFIED, UNDERMINED, etc.)
-            # Look for standalone status keywords (not in "EXPLOITED systems" context)
-            status_keywords = ['STRONGHOLD', 'FORTIFIED', 'EXPLOITED', 'UNOCCUPIED']  # Order matters - check STRONGHOLD before FORTIFIED
-            line_stripped = line.strip()
-            line_upper = line_stripped.upper()
-
-            # Skip if already found a status
-            # Also skip if we've reached the legend or TUG OF WAR section
-            if not info['system_status'] and not any(x in line_upper for x in ['TUG OF WAR', 'OPPOSING POWERS', 'UNOCCUPIED EXPLOITED FORTIFIED STRONGHOLD']):
-                for status in status_keywords:
-                    # Fuzzy match for OCR errors like "=XPLOITED" for "EXPLOITED" or "VEXPLOTED" for "EXPLOITED"
-                    # Use difflib similarity for better matching
-                    fuzzy_match = False
-                    if status in line_upper:
-                        fuzzy_match = True
-                    else:
-                        # Try fuzzy match using sequence similarity
-                        # Remove special characters first (handles "=XPLOITED" → "XPLOITED")
-                        from difflib import SequenceMatcher
-                        cleaned_line = re.sub(r'[^A-Z\s]', '', line_upper)
-                        for word in cleaned_line.split():
-                            if len(word) >= len(status) - 2 and len(word) <= len(status) + 2:
-                                # Use similarity ratio (handles "VEXPLOTED" → "EXPLOITED")
-                                similarity = SequenceMatcher(None, word, status).ratio()
-                                if similarity > 0.75:
-                                    fuzzy_match = True
-                                    break
-
-                    if fuzzy_match and not any(x in line_upper for x in ['PENALTY', 'POINTS']):
-                        # For fuzzy matches, check if the status keyword appears in the line
-                        # after removing special characters
-                        cleaned_line = re.sub(r'[^A-Z\s]', '', line_upper)
-
-                        # Skip description lines (e.g., "Exploited systems have a low control score and need a Fortified")
-                        # These have multiple lowercase words forming sentences
-                        # But allow lines like "Bm + STRONGHOLD |" which just have lowercase prefixes
-                        words_in_line = line_stripped.split()
-                        lowercase_words = [w for w in words_in_line if any(c.islower() for c in w) and len(w) > 3]
-                        if len(lowercase_words) >= 2:  # If 2+ substantial lowercase words, it's a description
-                            continue
-
-                        # Check each word in the cleaned line
-                        found_status = False
-                        for word in cleaned_line.split():
-                            # Check if this word matches the status (exact or fuzzy)
-                            if word == status:
-                                found_status = True
-                                break
-                            # Fuzzy check using sequence similarity
-                            if len(word) >= len(status) - 2 and len(word) <= len(status) + 2:
-                                # Use difflib to calculate similarity ratio
-                                from difflib import SequenceMatcher
-                                similarity = SequenceMatcher(None, word, status).ratio()
-                                # Allow matches with >75% similarity (handles "VEXPLOTED" → "EXPLOITED")
-                                if similarity > 0.75:
-                                    found_status = True
-                                    break
-
-                        if found_status:
-                            info['system_status'] = status
-                            # Next line might be the description
-                            if i + 1 < len(lines):
-                                next_line = lines[i + 1].strip()
-                                if next_line and len(next_line) > 20 and not any(kw in next_line.upper() for kw in ['TUG', 'WAR', 'OPPOSING', 'CONTROL', 'POWERPLAY']):
-                                    info['status_description'] = next_line
-                            break
-
-            # Fallback: If no status found yet, check description text patterns
-            # These descriptions are standardized and often more reliably OCR'd
-            if not info['system_status']:
-                line_lower = line.lower()
-                # EXPLOITED: "Exploited systems have a low control score and need a Fortified"
-                if 'exploited systems have a low control score' in line_lower or \
-                   ('exploited' in line_lower and 'low control score' in line_lower and 'fortified' in line_lower):
-                    info['system_status'] = 'EXPLOITED'
-                    info['status_description'] = line.strip()
-                # FORTIFIED: "Fortified systems have a high level of reinforcement and maintain control over nearby Exploited systems"
-                elif 'fortified systems have a high level of reinforcement' in line_lower or \
-                     ('fortified' in line_lower and 'high level of reinforcement' in line_lower and 'exploited' in line_lower):
-                    info['system_status'] = 'FORTIFIED'
-                    info['status_description'] = line.strip()
-                # STRONGHOLD: "Stronghold systems have a very high level of reinforcement"
-                elif 'stronghold systems have a very high' in line_lower or \
-                     ('stronghold' in line_lower and 'very high' in line_lower and 'reinforcement' in line_lower):
-                    info['system_status'] = 'STRONGHOLD'
-                    info['status_description'] = line.strip()
-
-            # Power names (known Powerplay leaders)
-            # Check for first and last names separately since they might be on different lines
-            # Also handle abbreviated first names like "A.LAVIGNY-DUVAL"
-            power_first_names = ['ARISSA', 'AISLING', 'ZEMINA', 'DENTON', 'ZACHARY', 'FELICIA',
-                                'EDMUND', 'LI', 'PRANAV', 'ARCHON', 'YURI', 'NAKATO', 'JEROME']
-            power_last_names = ['LAVIGNY-DUVAL', 'DUVAL', 'TORVAL', 'PATREUS', 'HUDSON',
-                               'WINTERS', 'MAHON', 'YONG-RUI', 'ANTAL', 'DELAINE', 'GROM', 'KAINE', 'ARCHER']
-
-            # Check if this line has a power first name or last name
-            line_upper = line.upper()
-
-            # Sort power pairs by last name length (longest first) to avoid substring matches
-            # e.g., LAVIGNY-DUVAL before DUVAL
-            power_pairs = list(zip(power_first_names, power_last_names))
-            power_pairs_sorted = sorted(power_pairs, key=lambda x: len(x[1]), reverse=True)
-
-            for first_name, last_name in power_pairs_sorted:
-                # Check for last name only (handles cases where OCR misses first name)
-                # Use word boundary to ensure we match complete last names
-                if re.search(r'\b' + re.escape(last_name) + r'\b', line_upper):
-                    power_name = f"{first_name} {last_name}".title()
-                    # Determine if opposing or controlling based on context
-                    # Look both before AND after (up to 5 lines in each direction)
-                    context_before = ' '.join(lines[max(0, i-5):i+1]).upper()
-                    context_after = ' '.join(lines[i:min(len(lines), i+6)]).upper()
-                    context_lines = context_before + ' ' + context_after
-
-                    # Check for "Controlling Power" first (more specific)
-                    if 'CONTROLLING POWER' in context_lines or 'CONTROLLING' in context_lines:
-                        info['controlling_power'] = power_name
-                    elif 'OPPOSING' in context_lines:
-                        info['opposing_power'] = power_name
-                    else:
-                        # Default to controlling if no clear context
-                        info['controlling_power'] = power_name
-                    break
-
-                # Check for abbreviated first name (e.g., "A.LAVIGNY-DUVAL", "Z.TORVAL")
-                # Also handle OCR errors like "ALAVIGNY-DUVAL" (missing period)
-                abbreviated_name = f"{first_name[0]}.{last_name}"
-                abbreviated_no_period = f"{first_name[0]}{last_name}"  # OCR might miss the period
-                if abbreviated_name in line_upper or abbreviated_no_period in line_upper:
-                    power_name = f"{first_name} {last_name}".title()
-                    # Determine if opposing or controlling based on context
-                    # Look both before AND after (up to 5 lines in each direction) to handle OCR inconsistencies
-                    context_before = ' '.join(lines[max(0, i-5):i+1]).upper()
-                    context_after = ' '.join(lines[i:min(len(lines), i+6)]).upper()
-                    context_lines = context_before + ' ' + context_after
-
-                    # Check for "Controlling Power" first (more specific)
-                    if 'CONTROLLING POWER' in context_lines or 'CONTROLLING' in context_lines:
-                        info['controlling_power'] = power_name
-                    elif 'OPPOSING' in context_lines:
-                        info['opposing_power'] = power_name
-                    else:
-                        # Default to controlling if no clear context
-                        info['controlling_power'] = power_name
-                    break
-
-                # Check if this line has a power first name (full name)
-                # Use word boundary check to avoid matching "LI" in "FRONTLINE", etc.
-                # Create a regex pattern that matches the first name as a whole word
-                if re.search(r'\b' + first_name + r'\b', line_upper):
-                    power_name = None
-                    # Check if last name is on same line
-                    if last_name in line_upper:
-                        power_name = f"{first_name} {last_name}".title()
-                    else:
-                        # Check next few lines for last name (up to 3 lines ahead)
-                        for k in range(1, 4):
-                            if i + k < len(lines) and last_name in lines[i + k].upper():
-                                power_name = f"{first_name} {last_name}".title()
-                                break
-                        # If we can't find the last name, use full name anyway as fallback
-                        # This handles cases where OCR fails on the last name
-                        if power_name is None:
-                            power_name = f"{first_name} {last_name}".title()
-
-                    # Determine if opposing or controlling based on context
-                    # Look both before AND after (up to 5 lines in each direction) to handle OCR inconsistencies
-                    context_before = ' '.join(lines[max(0, i-5):i+1]).upper()
-                    context_after = ' '.join(lines[i:min(len(lines), i+6)]).upper()
-                    context_lines = context_before + ' ' + context_after
-
-                    # Check for "Controlling Power" first (more specific)
-                    if 'CONTROLLING POWER' in context_lines or 'CONTROLLING' in context_lines:
-                        info['controlling_power'] = power_name
-                    elif 'OPPOSING' in context_lines:
-                        info['opposing_power'] = power_name
-                    else:
-                        # Default to controlling if no clear context
-                        info['controlling_power'] = power_name
-                    break
-
-            # Control points with undermining and reinforcing
-            # Format variations: "NUMBER < CONTROL POINTS > NUMBER", "NUMBER CONTROL POINTS » NUMBER", "NUMBER. CONTROL POINTS )) NUMBER"
-            # Also handles: "52317 ° CONTROL POINTS » 150642" with unusual separators
-            # Use word boundaries to avoid matching partial numbers from system names
-            # IMPORTANT: This is the authoritative source - always use it if found, even if we already have values
-            if 'CONTROL POINTS' in line.upper():
-                # Match: number (with optional commas), non-digit characters, CONTROL POINTS, non-digit characters, number
-                # More permissive - handles "ook 450051' CONTROL POINTS )) 587203" and other OCR noise
-                points_match = re.search(r'(\d{4,}(?:,\d{3})*)\D+CONTROL\s+POINTS\D+(\d{4,}(?:,\d{3})*)', line, re.IGNORECASE)
-                if points_match:
-                    try:
-                        info['undermining_points'] = int(points_match.group(1).replace(',', ''))
-                        info['reinforcing_points'] = int(points_match.group(2).replace(',', ''))
-                    except ValueError:
-                        pass
-                # If only one number found after CONTROL POINTS, it's the undermining value
-                # Reinforcement might be missing/garbled (e.g., "2098 CONTROL POINTS » 8)")
-                elif not info['undermining_points']:
-                    single_match = re.search(r'(\d{4,}(?:,\d{3})*)\s+\S*\s*CONTROL\s+POINTS', line, re.IGNORECASE)
-                    if single_match:
-                        try:
-                            info['undermining_points'] = int(single_match.group(1).replace(',', ''))
-                            # Check if there's a small number after (likely garbled 0)
-                            after_match = re.search(r'CONTROL\s+POINTS\s*[>»\)�]*\s*(\d{1,3})(?:\)|$)', line, re.IGNORECASE)
-                            if after_match:
-                                # Small numbers like "8)" are likely garbled zeros
-                                info['reinforcing_points'] = 0
-                        except ValueError:
-                            pass
-
-            # Also try to capture points that appear on separate lines
-            # Look for UNDERMINING followed by a number on next line (or within next few lines)
-            if 'UNDERMINING' in line.upper() and not info['undermining_points']:
-                # Check current line for number
-                under_match = re.search(r'UNDERMINING\s*[:\s_,]*(\d{4,}(?:,\d{3})*)', line, re.IGNORECASE)
-                if under_match:
-                    try:
-                        info['undermining_points'] = int(under_match.group(1).replace(',', ''))
-                    except ValueError:
-                        pass
-                # Check next few lines for a standalone number (with or without leading colon)
-                else:
-                    for j in range(1, 4):
-                        if i + j < len(lines):
-                            future_line = lines[i + j].strip()
-                            # Match standalone numbers (4+ digits to avoid noise), optionally prefixed with colon
-                            standalone_match = re.match(r'^:?\s*(\d{4,}(?:,\d{3})*)$', future_line)
-                            if standalone_match:
-                                try:
-                                    info['undermining_points'] = int(standalone_match.group(1).replace(',', ''))
-                                    break
-                                except ValueError:
-                                    pass
-
-            # Also look for standalone numbers after "Opposing Powers" section
-            # These are likely undermining values when no explicit UNDERMINING label is found
-            if 'OPPOSING POWERS' in line.upper() and not info['undermining_points']:
-                # Check next few lines for standalone number
-                for j in range(1, 6):
-                    if i + j < len(lines):
-                        future_line = lines[i + j].strip()
-                        # Match standalone numbers (4+ digits to avoid noise)
-                        standalone_match = re.match(r'^(\d{4,}(?:,\d{3})*)$', future_line)
-                        if standalone_match:
-                            # Make sure this isn't already captured as reinforcing
-                            potential_undermining = int(standalone_match.group(1).replace(',', ''))
-                            if potential_undermining != info['reinforcing_points']:
-                                try:
-                                    info['undermining_points'] = potential_undermining
-                                    break
-                                except ValueError:
-                                    pass
-                        # Stop if we hit another section
-                        if any(keyword in future_line.upper() for keyword in ['TUG OF WAR', 'CONTROLLING POWER', 'REINFORCING']):
-                            break
-
-            # Look for REINFORCING followed by a number
-            if 'REINFORCING' in line.upper() and not info['reinforcing_points']:
-                # Check current line for number
-                reinf_match = re.search(r'REINFORCING\s*[:\s]*(\d+)', line, re.IGNORECASE)
-                if reinf_match:
-                    try:
-                        info['reinforcing_points'] = int(reinf_match.group(1).replace(',', ''))
-                    except ValueError:
-                        pass
-                # Check next line
-                elif i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    # Look ahead a couple lines for the number
-                    for j in range(1, 4):
-                        if i + j < len(lines):
-                            future_line = lines[i + j].strip()
-                            if re.match(r'^\d+$', future_line):
-                                try:
-                                    info['reinforcing_points'] = int(future_line)
-                                    break
-                                except ValueError:
-                                    pass
-
-            # System strength penalty
-            if 'SYSTEM STRENGTH PENALTY' in line.upper():
-                penalty_match = re.search(r'PENALTY[:\s]+(\w+)', line, re.IGNORECASE)
-                if penalty_match:
-                    info['system_strength_penalty'] = penalty_match.group(1).upper()
-
-            # Beyond frontline penalty
-            if 'BEYOND FRONTLINE PENALTY' in line.upper():
-                penalty_match = re.search(r'PENALTY[:\s]+(\w+)', line, re.IGNORECASE)
-                if penalty_match:
-                    info['beyond_frontline_penalty'] = penalty_match.group(1).upper()
+        return _text_parser.parse(text)
 
-        return info
+    @property
+    def capture(self):
+        """Screen capture backend (see config.CAPTURE_BACKEND)"""
+        if self._capture is None:
+            self._capture = get_capture_backend()
+        return self._capture
 
-    def take_screenshot(self, region=None):
+    @tracing.traced()
+    def capture_screenshot(self, region=None, save=True, panel_only=False):
         """
-        Take a screenshot and save it with validation
+        Capture the screen into memory and optionally save it
 
         Args:
             region: Tuple of (x, y, width, height) for partial screenshot
+            save: If True, also write the frame to a timestamped PNG in screenshots_dir
+            panel_only: If True, grab only the extended Powerplay panel (~12x fewer pixels
+                        than the desktop); all crop and extraction methods accept the result
 
         Returns:
-            Path to saved screenshot
+            ScreenshotContext of the captured frame (path is set if it was saved)
         """
-        import time
+        frame_kind = None
+        if panel_only:
+            region = panel_capture_region()
+            frame_kind = FRAME_EXTENDED_PANEL
 
         max_retries = 3
         for attempt in range(max_retries):
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"powerplay_{timestamp}.png"
-            filepath = os.path.join(self.screenshots_dir, filename)
-
             try:
-                if region:
-                    screenshot = pyautogui.screenshot(region=region)
-                else:
-                    screenshot = pyautogui.screenshot()
-
-                # Save with error handling
-                screenshot.save(filepath, 'PNG')
-
-                # Validate the saved file
-                import cv2
-                test_img = cv2.imread(filepath)
-                if test_img is None:
+                frame = self.capture.grab(region)
+                if frame is None or frame.size == 0:
                     raise Exception("Screenshot validation failed - image is empty")
 
-                print(f"Screenshot saved: {filepath}")
-                return filepath
+                screenshot = ScreenshotContext(frame, frame=frame_kind)
+                if save:
+                    self.save_screenshot(screenshot)
+                return screenshot
 
             except Exception as e:
                 print(f"Screenshot attempt {attempt + 1}/{max_retries} failed: {e}")
@@ -1845,6 +1731,45 @@ class PowerplayOCR:
                 else:
                     raise Exception(f"Failed to capture valid screenshot after {max_retries} attempts")
 
+    def screenshot_path(self):
+        """
+        Timestamped PNG path in screenshots_dir for a new screenshot
+
+        Returns:
+            File path
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        return os.path.join(self.screenshots_dir, f"powerplay_{timestamp}.png")
+
+    def save_screenshot(self, screenshot):
+        """
+        Write a captured frame to a timestamped PNG in screenshots_dir
+
+        Args:
+            screenshot: ScreenshotContext from capture_screenshot(); its path is set to the new file
+
+        Returns:
+            Path to saved screenshot
+        """
+        filepath = self.screenshot_path()
+        if not cv2.imwrite(filepath, screenshot.image):
+            raise Exception(f"Could not write {filepath}")
+        print(f"Screenshot saved: {filepath}")
+        screenshot.path = filepath
+        return filepath
+
+    def take_screenshot(self, region=None):
+        """
+        Take a screenshot and save it
+
+        Args:
+            region: Tuple of (x, y, width, height) for partial screenshot
+
+        Returns:
+            Path to saved screenshot
+        """
+        return self.capture_screenshot(region).path
+
     def process_screenshot(self, screenshot_path):
         """
         Process a screenshot and extract Powerplay information
@@ -1987,6 +1912,19 @@ class PowerplayOCR:
 
             return f"{system_name}\t{power}\t{state}\t\t{undermining}\t{reinforcement}\t{initial_cp}"
 
+    def _create_panel_detector(self):
+        """
+        Create the panel presence check used by continuous monitoring
+
+        Returns:
+            PanelDetector with the saved header template, or an untrained one that
+            learns the header from the first valid frames
+        """
+        settings = dict(min_correlation=config.PANEL_HEADER_MIN_CORRELATION,
+                        min_contrast=config.PANEL_HEADER_MIN_CONTRAST)
+        detector = PanelDetector.load(config.PANEL_HEADER_TEMPLATE_PATH, **settings)
+        return detector if detector is not None else PanelDetector(**settings)
+
     def start_continuous_monitoring(self, hotkey='f9', check_interval=2.0, output_file='powerplay_data.txt'):
         """
         Start continuous monitoring mode that automatically captures and validates powerplay data
@@ -2007,10 +1945,16 @@ class PowerplayOCR:
         print("System Name\tPower\tState\t\tUndermining\tReinforcement\tInitial CP")
         print("-" * 80)
 
-        monitoring_active = False
-        last_capture_time = 0
         collected_systems = {}  # Track unique systems by name
         invalid_parses = []  # Store invalid parses for later analysis
+        # Skips OCR while the system name and status areas look the same as last time
+        change_detector = PanelChangeDetector(config.MONITOR_CHANGE_THRESHOLD) if config.MONITOR_CHANGE_DETECTION else None
+        unchanged_frames = 0
+        # Drops frames without the panel before OCR (they are only counted, not stored)
+        panel_detector = self._create_panel_detector() if config.MONITOR_PANEL_CHECK else None
+        no_panel_frames = 0
+        # OCR workers record their results under this lock
+        results_lock = threading.Lock()
 
         # Initialize output file with header
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -2050,65 +1994,87 @@ class PowerplayOCR:
                     f.write(raw_text)
                     f.write("\n" + "-" * 80 + "\n")
 
+        def capture_frame():
+            """Grab a frame on the timer thread; None if there is nothing new to OCR"""
+            nonlocal unchanged_frames, no_panel_frames
+            # Grab the frame into memory - it is only written to disk if it fails to parse
+            self.capture.next_frame()
+            screenshot = self.capture_screenshot(save=False, panel_only=config.CAPTURE_PANEL_ONLY)
+
+            if panel_detector is not None and not panel_detector.present(screenshot):
+                # Galaxy map or another UI - no Powerplay panel to read
+                no_panel_frames += 1
+                return None
+            if change_detector is not None and not change_detector.changed(screenshot):
+                # Same system still on screen - nothing new to read
+                unchanged_frames += 1
+                return None
+            return screenshot
+
+        def process_frame(screenshot):
+            """OCR, parse and record a frame on a worker thread"""
+            # Extract text and parse (from the captured frame, no re-decode)
+            text = self.extract_text(screenshot)
+            info = self.parse_powerplay_info(text)
+
+            # Snap the OCR'd name to a known system name
+            if info['system_name'] and self.system_lexicon is not None:
+                known_name, _ = self.system_lexicon.lookup(info['system_name'])
+                if known_name:
+                    info['system_name'] = known_name
+
+            with results_lock:
+                # Check if valid
+                if self.is_valid_powerplay_data(info):
+                    system_name = info['system_name']
+                    if panel_detector is not None:
+                        panel_detector.learn(screenshot)
+                    # Only add if not already collected
+                    if system_name not in collected_systems:
+                        collected_systems[system_name] = info
+                        if self.system_lexicon is not None:
+                            self.system_lexicon.add(system_name)
+                        # Print in Excel format
+                        excel_line = self.format_for_excel(info)
+                        print(f"VALID: {excel_line}")
+                        # Save to file immediately
+                        save_to_file()
+                    else:
+                        print(f"DUPLICATE: {system_name}")
+                else:
+                    # Store invalid parse with raw text and keep the screenshot for analysis
+                    screenshot_path = self.save_screenshot(screenshot)
+                    invalid_parses.append((info, text, screenshot_path))
+                    # Show what failed validation
+                    print(f"INVALID - Name:{info['system_name']}, Power:{info['controlling_power'] or info['opposing_power']}, State:{info['system_status']}, Under:{info['undermining_points']}, Reinf:{info['reinforcing_points']}")
+
+        # Captures run on a timer thread, OCR on worker threads; the newest frame replaces
+        # one still waiting for a worker, so a slow OCR never delays the next capture
+        scheduler = MonitorScheduler(capture_frame, process_frame, check_interval, config.MONITOR_OCR_WORKERS)
+
         def toggle_monitoring():
-            nonlocal monitoring_active
-            monitoring_active = not monitoring_active
-            if monitoring_active:
+            if not scheduler.active:
+                if change_detector is not None:
+                    change_detector.reset()
                 print(f"\n[MONITORING STARTED - Capturing every {check_interval}s]")
             else:
                 print("\n[MONITORING STOPPED]")
+            scheduler.toggle()
 
         keyboard.add_hotkey(hotkey, toggle_monitoring)
 
         try:
-            while True:
-                if keyboard.is_pressed('esc'):
-                    break
-
-                if monitoring_active:
-                    current_time = time.time()
-                    if current_time - last_capture_time >= check_interval:
-                        # Take screenshot
-                        screenshot_path = self.take_screenshot()
-
-                        # Extract text and parse immediately
-                        print(f"[Processing {screenshot_path}...]", end=' ')
-                        text = self.extract_text(screenshot_path)
-                        info = self.parse_powerplay_info(text)
-
-                        # Check if valid
-                        if self.is_valid_powerplay_data(info):
-                            system_name = info['system_name']
-                            # Only add if not already collected
-                            if system_name not in collected_systems:
-                                collected_systems[system_name] = info
-                                # Print in Excel format
-                                excel_line = self.format_for_excel(info)
-                                print(f"VALID: {excel_line}")
-                                # Save to file immediately
-                                save_to_file()
-                            else:
-                                print(f"DUPLICATE: {system_name}")
-
-                            # Delete valid screenshot
-                            try:
-                                os.remove(screenshot_path)
-                            except Exception as e:
-                                print(f"\nWarning: Could not delete {screenshot_path}: {e}")
-                        else:
-                            # Store invalid parse with raw text and keep screenshot
-                            invalid_parses.append((info, text, screenshot_path))
-                            # Show what failed validation
-                            print(f"INVALID - Name:{info['system_name']}, Power:{info['controlling_power'] or info['opposing_power']}, State:{info['system_status']}, Under:{info['undermining_points']}, Reinf:{info['reinforcing_points']}")
-
-                        last_capture_time = current_time
-
-                time.sleep(0.1)  # Small sleep to prevent CPU spinning
+            # Block until ESC - hotkeys arrive as callbacks, nothing is polled
+            keyboard.wait('esc')
 
         except KeyboardInterrupt:
             pass
 
         finally:
+            keyboard.remove_hotkey(toggle_monitoring)
+            # Let the workers finish the frame they are on
+            scheduler.close()
+
             # Save invalid parses for analysis
             if invalid_parses:
                 save_invalid_parses()
@@ -2126,6 +2092,12 @@ class PowerplayOCR:
                 print(excel_line)
             print("=" * 60)
             print(f"Data saved to: {output_file}")
+            if unchanged_frames:
+                print(f"Skipped OCR on {unchanged_frames} unchanged frame(s)")
+            if no_panel_frames:
+                print(f"Skipped OCR on {no_panel_frames} frame(s) without the Powerplay panel")
+            if scheduler.dropped:
+                print(f"Dropped {scheduler.dropped} frame(s) replaced by a newer one while OCR was busy")
             print("Exiting...")
 
     def start_hotkey_capture(self, hotkey='f9'):
@@ -2139,6 +2111,7 @@ class PowerplayOCR:
 
         def on_hotkey():
             print("Capturing screenshot...")
+            self.capture.next_frame()
             screenshot_path = self.take_screenshot()
             self.process_screenshot(screenshot_path)
             print("Ready for next capture...\n")
@@ -0,0 +1,206 @@
+"""
+Decode-once screenshot container for PowerplayParser
+Shares one decoded image (and the crops derived from it) between all
+cropping, detection and OCR stages
+"""
+
+# Third-party imports
+import cv2
+import numpy as np
+from PIL import Image
+
+# Local imports
+import config
+
+
+def panel_bounds(width, height, extended=False):
+    """
+    Calculate the Powerplay panel rectangle inside a full screenshot
+
+    Args:
+        width: Screenshot width in pixels
+        height: Screenshot height in pixels
+        extended: If True, use the extended panel for EXPANSION/CONTESTED states (742×840)
+                  If False, use the standard panel (740×646)
+
+    Returns:
+        Tuple of (left, top, right, bottom)
+    """
+    # All values based on 5120x1440 resolution with automatic scaling
+    width_scale = width / config.EXPECTED_SCREEN_WIDTH
+    height_scale = height / config.EXPECTED_SCREEN_HEIGHT
+
+    left = int(config.PANEL_LEFT * width_scale)
+    top = int(config.PANEL_TOP * height_scale)
+
+    if extended:
+        right = int(config.PANEL_RIGHT_EXTENDED * width_scale)
+        bottom = int(config.PANEL_BOTTOM_EXTENDED * height_scale)
+    else:
+        right = int(config.PANEL_RIGHT_STANDARD * width_scale)
+        bottom = int(config.PANEL_BOTTOM_STANDARD * height_scale)
+
+    return left, top, right, bottom
+
+
+def panel_capture_region(screen_width=None, screen_height=None):
+    """
+    Screen region holding the extended Powerplay panel (which contains the standard panel)
+
+    Args:
+        screen_width: Desktop width in pixels (default: config.EXPECTED_SCREEN_WIDTH)
+        screen_height: Desktop height in pixels (default: config.EXPECTED_SCREEN_HEIGHT)
+
+    Returns:
+        Tuple of (x, y, width, height) for a region capture
+    """
+    left, top, right, bottom = panel_bounds(screen_width or config.EXPECTED_SCREEN_WIDTH,
+                                            screen_height or config.EXPECTED_SCREEN_HEIGHT,
+                                            extended=True)
+    return left, top, right - left, bottom - top
+
+
+# Frame kinds (what the top-left pixel of an image corresponds to)
+FRAME_SCREEN = 'screen'                  # Full desktop screenshot
+FRAME_PANEL = 'panel'                    # Standard panel crop
+FRAME_EXTENDED_PANEL = 'extended_panel'  # Extended panel crop or panel-region capture
+
+
+class ScreenshotContext:
+    """
+    A screenshot that is decoded at most once
+
+    The panel crops, their grayscale versions and any other derived views
+    (e.g. subsection dictionaries) are computed lazily on first use and cached,
+    so every stage of the pipeline can share the same decoded pixels.
+    """
+
+    def __init__(self, source, path=None, frame=None):
+        """
+        Args:
+            source: Path to the image file, NumPy array (BGR) or PIL Image
+            path: File an in-memory source has been saved to (optional)
+            frame: FRAME_SCREEN, FRAME_PANEL or FRAME_EXTENDED_PANEL (None = detect from the size)
+        """
+        self.path = path
+        self._image = None
+        self._frame = frame
+        self._cache = {}
+
+        if isinstance(source, np.ndarray):
+            self._image = source
+        elif isinstance(source, Image.Image):
+            self._image = cv2.cvtColor(np.array(source.convert('RGB')), cv2.COLOR_RGB2BGR)
+        else:
+            self.path = source
+
+    @classmethod
+    def wrap(cls, source):
+        """
+        Return source unchanged if it already is a ScreenshotContext, otherwise wrap it
+
+        Args:
+            source: ScreenshotContext, path, NumPy array or PIL Image
+
+        Returns:
+            ScreenshotContext
+        """
+        if isinstance(source, cls):
+            return source
+        return cls(source)
+
+    @property
+    def image(self):
+        """Decoded BGR image (loaded from disk on first access)"""
+        if self._image is None:
+            img = cv2.imread(self.path)
+            if img is None:
+                raise ValueError(f"Could not load image: {self.path}")
+            self._image = img
+        return self._image
+
+    @property
+    def frame(self):
+        """
+        What the image shows: FRAME_SCREEN, FRAME_PANEL or FRAME_EXTENDED_PANEL
+
+        Images wider than 2000 pixels are full screenshots. Smaller images are panel
+        crops - extended if their aspect ratio is closer to the extended panel's (742×840)
+        than to the standard panel's (740×646).
+        """
+        if self._frame is None:
+            height, width = self.image.shape[:2]
+            if width > 2000:
+                self._frame = FRAME_SCREEN
+            else:
+                aspect = height / width
+                standard_aspect = config.PANEL_HEIGHT_STANDARD / config.PANEL_WIDTH_STANDARD
+                extended_aspect = config.PANEL_HEIGHT_EXTENDED / config.PANEL_WIDTH_EXTENDED
+                if abs(aspect - extended_aspect) < abs(aspect - standard_aspect):
+                    self._frame = FRAME_EXTENDED_PANEL
+                else:
+                    self._frame = FRAME_PANEL
+        return self._frame
+
+    @property
+    def is_full_screenshot(self):
+        """True if this is a full desktop screenshot rather than a panel crop"""
+        return self.frame == FRAME_SCREEN
+
+    def memo(self, key, factory):
+        """
+        Cache an arbitrary value derived from this screenshot
+
+        Args:
+            key: Hashable cache key
+            factory: Zero-argument callable producing the value on first use
+
+        Returns:
+            Cached value
+        """
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def panel(self, extended=False):
+        """
+        Powerplay panel as a BGR array view
+
+        Full screenshots are cropped to the panel. Extended panel frames (e.g. panel-region
+        captures) already start at the panel origin, so the standard panel is their top-left
+        part. Standard panel crops are returned unchanged.
+
+        Args:
+            extended: If True, return the extended panel (742×840)
+
+        Returns:
+            NumPy array (BGR)
+        """
+        def crop():
+            img = self.image
+            frame = self.frame
+            if frame == FRAME_SCREEN:
+                height, width = img.shape[:2]
+                left, top, right, bottom = panel_bounds(width, height, extended)
+                return img[top:bottom, left:right]
+            if frame == FRAME_EXTENDED_PANEL and not extended:
+                height, width = img.shape[:2]
+                right = round(width * config.PANEL_WIDTH_STANDARD / config.PANEL_WIDTH_EXTENDED)
+                bottom = round(height * config.PANEL_HEIGHT_STANDARD / config.PANEL_HEIGHT_EXTENDED)
+                return img[:bottom, :right]
+            return img
+
+        return self.memo(('panel', extended), crop)
+
+    def panel_gray(self, extended=False):
+        """
+        Grayscale version of the Powerplay panel
+
+        Args:
+            extended: If True, use the extended panel (742×840)
+
+        Returns:
+            NumPy array (grayscale)
+        """
+        return self.memo(('panel_gray', extended),
+                         lambda: cv2.cvtColor(self.panel(extended), cv2.COLOR_BGR2GRAY))
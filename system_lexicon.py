@@ -0,0 +1,291 @@
+"""
+Known system names for PowerplayParser
+A persistent lexicon of system names (from input.txt and earlier captures) in a
+BK-tree, so an OCR'd name can be snapped to the nearest known name
+"""
+
+# Standard library imports
+import atexit
+import json
+import os
+import threading
+
+# Local imports
+import config
+from file_lock import FileLock
+
+
+def edit_distance(a, b, max_distance=None):
+    """
+    Levenshtein distance between two strings
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Stop early and return max_distance + 1 once the distance is known to exceed it
+
+    Returns:
+        Number of single-character insertions, deletions and substitutions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+
+    previous_row = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        row = [i]
+        for j, char_b in enumerate(b, 1):
+            row.append(min(row[j - 1] + 1, previous_row[j] + 1, previous_row[j - 1] + (char_a != char_b)))
+        if max_distance is not None and min(row) > max_distance:
+            return max_distance + 1
+        previous_row = row
+    return previous_row[-1]
+
+
+# Characters the game font lets OCR mix up - a substitution within a group is a misread,
+# not a different name
+LOOKALIKE_GROUPS = ('0ODQ', '1IL', '2Z', '5S', '6G', '8B')
+_LOOKALIKES = {char: group for group in LOOKALIKE_GROUPS for char in group}
+
+
+def _alignment(a, b):
+    """
+    Edit operations turning b into a (one optimal Levenshtein alignment)
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        List of (char of a or None, char of b or None, index in b) for every differing position
+    """
+    rows = [list(range(len(b) + 1))]
+    for i, char_a in enumerate(a, 1):
+        row = [i]
+        for j, char_b in enumerate(b, 1):
+            row.append(min(row[j - 1] + 1, rows[-1][j] + 1, rows[-1][j - 1] + (char_a != char_b)))
+        rows.append(row)
+
+    operations = []
+    i, j = len(a), len(b)
+    while i or j:
+        if i and j and rows[i][j] == rows[i - 1][j - 1] + (a[i - 1] != b[j - 1]):
+            if a[i - 1] != b[j - 1]:
+                operations.append((a[i - 1], b[j - 1], j - 1))
+            i, j = i - 1, j - 1
+        elif i and rows[i][j] == rows[i - 1][j] + 1:
+            operations.append((a[i - 1], None, j))
+            i -= 1
+        else:
+            operations.append((None, b[j - 1], j - 1))
+            j -= 1
+    return operations
+
+
+def is_misread(name, known_name):
+    """
+    Check whether name can be an OCR misread of known_name rather than another system
+
+    Lookalike substitutions (0/O, 1/I, 5/S, ...) are allowed anywhere. Any other edit is
+    only allowed on a letter of a plain word ("SYNUEFE", "SECTOR"): changing a digit or a
+    designation token ("XR-H", "D11-102") names a different system.
+
+    Args:
+        name: OCR'd system name (upper case)
+        known_name: Known system name (upper case)
+
+    Returns:
+        True if every difference is a plausible misread
+    """
+    # Per character of known_name: part of a letters-only word?
+    in_word = []
+    for token in known_name.split(' '):
+        in_word.extend([token.isalpha()] * len(token))
+        in_word.append(False)  # The space after it
+    in_word.pop()
+
+    for read, known, index in _alignment(name, known_name):
+        if read and known and _LOOKALIKES.get(read, read) == _LOOKALIKES.get(known, known):
+            continue
+        if read is not None and not read.isalpha():
+            return False
+        if known is not None:
+            if not (known.isalpha() and in_word[index]):
+                return False
+        elif not any(in_word[k] for k in (index - 1, index) if 0 <= k < len(in_word)):
+            # Extra character - it must sit next to a word letter
+            return False
+    return True
+
+
+class SystemLexicon:
+    """
+    BK-tree of known system names (upper case), optionally persisted to a JSON file
+
+    Lookups only compare against names whose distance to each visited node is
+    within the query bound (triangle inequality), so they stay fast as the
+    lexicon grows. Only misreads are snapped (see is_misread). Several processes
+    may share one file; save() merges.
+    """
+
+    FILE_VERSION = 1
+
+    def __init__(self, path=None, max_error_rate=0.1):
+        """
+        Args:
+            path: JSON file to load from and save to (None = in-memory only)
+            max_error_rate: Maximum edit distance of a snap as a fraction of the name length
+        """
+        self.path = path
+        self.max_error_rate = max_error_rate
+        self._names = set()
+        self._root = None  # [name, {distance: child node}]
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            for name in self._read_file():
+                self._insert(name)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name.strip().upper() in self._names
+
+    def _insert(self, name):
+        if name in self._names:
+            return False
+        self._names.add(name)
+        if self._root is None:
+            self._root = [name, {}]
+            return True
+
+        node = self._root
+        while True:
+            distance = edit_distance(name, node[0])
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [name, {}]
+                return True
+            node = child
+
+    def add(self, name):
+        """
+        Add a known system name
+
+        Args:
+            name: System name (any case)
+
+        Returns:
+            True if the name was not known before
+        """
+        name = ' '.join(name.split()).upper()
+        if len(name) < 3:
+            return False
+        with self._lock:
+            added = self._insert(name)
+            self._dirty = self._dirty or added
+        return added
+
+    def max_distance(self, name):
+        """Largest edit distance at which name may be snapped to a known name"""
+        return int(len(name) * self.max_error_rate)
+
+    def lookup(self, name, max_distance=None):
+        """
+        Find the known name closest to an OCR'd name
+
+        Args:
+            name: OCR'd system name
+            max_distance: Distance bound (default: max_error_rate of the name length)
+
+        Returns:
+            Tuple of (known name, distance), or (None, None) if there is no known name
+            within the bound or the nearest one is ambiguous
+        """
+        name = ' '.join(name.split()).upper()
+        if max_distance is None:
+            max_distance = self.max_distance(name)
+        if name in self._names:
+            return name, 0
+        if self._root is None or max_distance <= 0:
+            return None, None
+
+        best = []
+        best_distance = max_distance + 1
+        with self._lock:
+            stack = [self._root]
+            while stack:
+                node_name, children = stack.pop()
+                distance = edit_distance(name, node_name)
+                if distance < best_distance:
+                    best, best_distance = [node_name], distance
+                elif distance == best_distance <= max_distance:
+                    best.append(node_name)
+                bound = min(best_distance, max_distance)
+                stack.extend(child for edge, child in children.items() if distance - bound <= edge <= distance + bound)
+
+        # Two known names equally close - the OCR'd name could be either (or a new system)
+        if len(best) != 1:
+            return None, None
+        # A changed digit or designation is a neighbouring system, not a misread of this one
+        if not is_misread(name, best[0]):
+            return None, None
+        return best[0], best_distance
+
+    def _read_file(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if data.get('version') != self.FILE_VERSION:
+            return []
+        return data.get('names', [])
+
+    def save(self):
+        """Write the lexicon to disk (merged with names other processes saved meanwhile)"""
+        if not self.path:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                # Other processes must not save between our read and our replace
+                with FileLock(f"{self.path}.lock"):
+                    merged = set(self._read_file()) | self._names
+                    tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump({'version': self.FILE_VERSION, 'names': sorted(merged)}, f, indent=0)
+                    os.replace(tmp_path, self.path)
+            except TimeoutError as e:
+                print(f"Warning: System lexicon not saved: {e}")
+                return
+            self._dirty = False
+
+
+_lexicon = None
+_lexicon_lock = threading.Lock()
+
+
+def get_system_lexicon():
+    """
+    Get the process-wide system name lexicon, creating it on first use
+
+    Returns:
+        SystemLexicon instance, or None if config.SYSTEM_LEXICON_ENABLED is False
+    """
+    global _lexicon
+
+    if not config.SYSTEM_LEXICON_ENABLED:
+        return None
+
+    with _lexicon_lock:
+        if _lexicon is None:
+            _lexicon = SystemLexicon(config.SYSTEM_LEXICON_PATH, config.SYSTEM_NAME_MAX_ERROR_RATE)
+            atexit.register(_lexicon.save)
+
+    return _lexicon
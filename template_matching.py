@@ -0,0 +1,195 @@
+"""
+Template matching helpers for PowerplayParser
+Normalized cross-correlation against a bank of labelled reference patches,
+used for UI elements rendered in a fixed game font
+"""
+
+# Standard library imports
+import os
+
+# Third-party imports
+import cv2
+import numpy as np
+
+
+def normalize_patch(patch, size):
+    """
+    Resize a grayscale patch and scale it to zero mean / unit length
+
+    The dot product of two normalized patches is their normalized cross-correlation.
+
+    Args:
+        patch: 2D NumPy array
+        size: Target (width, height)
+
+    Returns:
+        1D float32 vector (all zeros for a blank patch)
+    """
+    resized = cv2.resize(patch.astype(np.float32), size, interpolation=cv2.INTER_AREA).ravel()
+    resized -= resized.mean()
+    norm = np.linalg.norm(resized)
+    if norm > 0:
+        resized /= norm
+    return resized
+
+
+def binarize_text(image):
+    """
+    Convert a UI crop to a binary image with text = 1
+
+    Args:
+        image: NumPy array (BGR or grayscale)
+
+    Returns:
+        2D uint8 array of 0/1
+    """
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    _, binary = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+    # Game text is light on a dark background - flip if the crop is the other way round
+    border = np.concatenate([binary[0], binary[-1], binary[:, 0], binary[:, -1]])
+    if border.mean() > 0.5:
+        binary = 1 - binary
+    return binary
+
+
+def crop_to_content(binary):
+    """
+    Crop a binary image to the bounding box of its set pixels
+
+    Args:
+        binary: 2D array of 0/1
+
+    Returns:
+        Cropped view, or None if the image is blank
+    """
+    rows = np.flatnonzero(binary.any(axis=1))
+    if rows.size == 0:
+        return None
+    columns = np.flatnonzero(binary.any(axis=0))
+    return binary[rows[0]:rows[-1] + 1, columns[0]:columns[-1] + 1]
+
+
+class TemplateBank:
+    """
+    Labelled reference patches, all normalized to the same size
+
+    Several samples may share a label; a patch is classified by its best-matching sample.
+    """
+
+    def __init__(self, size, max_samples_per_label=20):
+        """
+        Args:
+            size: Patch size (width, height) every sample is normalized to
+            max_samples_per_label: Cap on stored samples per label (oldest are dropped)
+        """
+        self.size = tuple(size)
+        self.max_samples_per_label = max_samples_per_label
+        self.labels = []
+        self._vectors = np.zeros((0, self.size[0] * self.size[1]), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def add(self, label, patch):
+        """
+        Add a reference sample
+
+        Args:
+            label: Class label (e.g. '7' or ',')
+            patch: 2D NumPy array
+        """
+        vector = normalize_patch(patch, self.size)
+        if not vector.any():
+            return
+
+        indices = [i for i, existing in enumerate(self.labels) if existing == label]
+        if len(indices) >= self.max_samples_per_label:
+            drop = indices[0]
+            del self.labels[drop]
+            self._vectors = np.delete(self._vectors, drop, axis=0)
+
+        self.labels.append(label)
+        self._vectors = np.vstack([self._vectors, vector[np.newaxis]])
+
+    def match(self, patch):
+        """
+        Find the best-matching label for a patch
+
+        Args:
+            patch: 2D NumPy array
+
+        Returns:
+            Tuple of (label, score) with score in [-1, 1], or (None, 0.0) if the bank is empty
+        """
+        if not self.labels:
+            return None, 0.0
+        scores = self._vectors @ normalize_patch(patch, self.size)
+        best = int(np.argmax(scores))
+        return self.labels[best], float(scores[best])
+
+    def label_scores(self, patch):
+        """
+        Best score per label for a patch
+
+        Args:
+            patch: 2D NumPy array
+
+        Returns:
+            Dict mapping label to its best sample score (empty if the bank is empty)
+        """
+        if not self.labels:
+            return {}
+        scores = self._vectors @ normalize_patch(patch, self.size)
+        best = {}
+        for label, score in zip(self.labels, scores):
+            if score > best.get(label, -2.0):
+                best[label] = float(score)
+        return best
+
+    def match_many(self, patches):
+        """
+        Find the best-matching label for each of several patches in one matrix product
+
+        Args:
+            patches: List of 2D NumPy arrays
+
+        Returns:
+            List of (label, score) tuples (see match())
+        """
+        if not self.labels:
+            return [(None, 0.0)] * len(patches)
+        if not patches:
+            return []
+        scores = np.stack([normalize_patch(patch, self.size) for patch in patches]) @ self._vectors.T
+        best = scores.argmax(axis=1)
+        return [(self.labels[b], float(scores[i, b])) for i, b in enumerate(best)]
+
+    def save(self, path):
+        """
+        Save the bank to a .npz file
+
+        Args:
+            path: Output file path
+        """
+        np.savez_compressed(path, size=np.array(self.size), labels=np.array(self.labels),
+                            vectors=self._vectors)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a bank saved with save()
+
+        Args:
+            path: .npz file path
+
+        Returns:
+            TemplateBank, or None if the file does not exist
+        """
+        if not path or not os.path.exists(path):
+            return None
+        data = np.load(path)
+        bank = cls(tuple(int(v) for v in data['size']))
+        bank.labels = [str(label) for label in data['labels']]
+        bank._vectors = data['vectors'].astype(np.float32)
+        return bank
@@ -0,0 +1,389 @@
+"""
+Benchmark the extraction pipeline on the labelled screenshot corpus
+
+Times every stage (decode, crop, preprocess, OCR, parse, initial CP) per panel crop,
+and the checks continuous monitoring runs before any OCR (change fingerprint, panel
+presence), scores every labelled field, and compares both against the stored baseline. Exits
+with status 1 if any field that was read correctly in the baseline is now wrong, so
+a speedup can be shown to be accuracy-neutral before it is deployed.
+
+The corpus is a directory of panel crops (standard crops for standard systems,
+extended crops for competitive ones, as saved by auto_capture) plus manifest.json
+with the expected value of each field. Add screenshots or crops with --add, check
+the generated labels in manifest.json by hand, then save a baseline.
+
+Usage:
+    python benchmark_pipeline.py                  # Run and compare against the baseline
+    python benchmark_pipeline.py --save-baseline  # Run and store the result as the new baseline
+    python benchmark_pipeline.py --add DIR [DIR ...]
+    python benchmark_pipeline.py --repeat 5 --corpus path/to/corpus
+"""
+import argparse
+import functools
+import glob
+import hashlib
+import json
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+import cv2
+
+import config
+import powerplay_ocr
+from change_detector import panel_fingerprint
+from panel_detector import PanelDetector
+from powerplay_ocr import PowerplayOCR
+from screenshot_context import ScreenshotContext
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+MANIFEST_VERSION = 1
+
+STAGES = ['decode', 'crop', 'preprocess', 'ocr', 'parse', 'initial_cp', 'other']
+
+# Labelled fields per layout
+LABEL_FIELDS = {
+    'standard': ['system_name', 'system_status', 'controlling_power', 'opposing_power',
+                 'undermining_points', 'reinforcing_points', 'initial_control_points'],
+    'competitive': ['system_name', 'system_status', 'controlling_power', 'opposing_power',
+                    'your_power', 'your_rank', 'powers'],
+}
+
+# Per-frame checks of continuous monitoring, timed separately from the OCR pipeline
+MONITOR_CHECKS = ['fingerprint', 'panel_check']
+
+SLOWER_TOLERANCE = 0.2  # Stage latency more than 20% (and 0.5 ms) above the baseline is flagged
+
+
+class StageTimer:
+    """
+    Accumulates exclusive wall time per stage by wrapping pipeline methods
+
+    Time spent in a nested wrapped call is attributed to the inner stage only.
+    """
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self._stack = []
+
+    def wrap(self, owner, attribute, stage):
+        """Replace owner.attribute with a timed version (instance attribute, the class is untouched)"""
+        original = getattr(owner, attribute)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = self._stack.pop()
+                self.totals[stage] += elapsed - nested
+                if self._stack:
+                    self._stack[-1] += elapsed
+
+        setattr(owner, attribute, timed)
+
+    def reset(self):
+        """Return the accumulated stage times (seconds) and start over"""
+        totals = dict(self.totals)
+        self.totals.clear()
+        return totals
+
+
+def create_ocr(use_cache=False):
+    """PowerplayOCR instance with every pipeline stage instrumented"""
+    ocr = PowerplayOCR(use_easyocr=False)
+    if not use_cache:
+        ocr.ocr_cache = None
+    # Results must not depend on names collected by earlier runs
+    ocr.system_lexicon = None
+
+    timer = StageTimer()
+    for attribute in ['crop_powerplay_panel', 'crop_powerplay_subsections', 'crop_powerplay_subsections_competitive']:
+        timer.wrap(ocr, attribute, 'crop')
+    timer.wrap(ocr, 'preprocess_image', 'preprocess')
+    for attribute in ['image_to_string', 'image_to_data']:
+        timer.wrap(ocr.engine, attribute, 'ocr')
+    for attribute in ['_clean_system_name', '_parse_score', '_parse_rank', 'parse_powerplay_info']:
+        timer.wrap(ocr, attribute, 'parse')
+    timer.wrap(powerplay_ocr._power_matcher, 'match', 'parse')
+    timer.wrap(ocr, 'detect_initial_control_points_from_bar', 'initial_cp')
+    return ocr, timer
+
+
+def process_frame(ocr, timer, path):
+    """
+    Run the full pipeline on one corpus image
+
+    Returns:
+        Tuple of (info dict, stage times in milliseconds)
+    """
+    timer.reset()
+    start = time.perf_counter()
+
+    screenshot = ScreenshotContext(path)
+    screenshot.image
+    decode = time.perf_counter() - start
+
+    info = ocr.extract_powerplay_auto(screenshot)
+    if not info.get('powers'):
+        initial_cp = ocr.detect_initial_control_points_from_bar(screenshot)
+        info['initial_control_points'] = initial_cp if initial_cp is not None else -1
+
+    total = time.perf_counter() - start
+    stages = timer.reset()
+    stages['decode'] = decode
+    # Layout routing, template matching and bookkeeping
+    stages['other'] = total - sum(stages.values())
+    return info, {stage: stages.get(stage, 0.0) * 1000 for stage in STAGES}
+
+
+def time_monitor_checks(paths, repeat=1):
+    """
+    Time the checks continuous monitoring runs on every frame before any OCR
+
+    Args:
+        paths: Corpus image paths
+        repeat: Runs per frame; times are medians
+
+    Returns:
+        Dict of check name -> mean microseconds per frame
+    """
+    detector = PanelDetector.load(config.PANEL_HEADER_TEMPLATE_PATH) or PanelDetector()
+    checks = {'fingerprint': panel_fingerprint, 'panel_check': detector.present}
+    images = [cv2.imread(path) for path in paths]
+
+    result = {}
+    for name in MONITOR_CHECKS:
+        check = checks[name]
+        check(images[0])  # Warm-up
+        per_frame = []
+        for image in images:
+            runs = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                check(image)
+                runs.append(time.perf_counter() - start)
+            per_frame.append(statistics.median(runs) * 1e6)
+        result[name] = statistics.mean(per_frame)
+    return result
+
+
+def normalize(value):
+    """JSON round trip, so results compare equal to the labels loaded from the manifest"""
+    return json.loads(json.dumps(value))
+
+
+def load_manifest(corpus_dir):
+    path = os.path.join(corpus_dir, 'manifest.json')
+    if not os.path.exists(path):
+        return {'version': MANIFEST_VERSION, 'frames': []}, None
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return json.loads(raw), hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def save_manifest(corpus_dir, manifest):
+    with open(os.path.join(corpus_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+
+def add_to_corpus(corpus_dir, source_dirs):
+    """Crop, label (with the current pipeline) and add screenshots to the corpus"""
+    os.makedirs(corpus_dir, exist_ok=True)
+    manifest, _ = load_manifest(corpus_dir)
+    ocr, _ = create_ocr()
+    known = {frame['source'] for frame in manifest['frames']}
+
+    paths = []
+    for directory in source_dirs:
+        paths.extend(sorted(glob.glob(os.path.join(directory, '*.png'))))
+
+    added = 0
+    for path in paths:
+        if os.path.basename(path) in known:
+            continue
+        screenshot = ScreenshotContext(path)
+        try:
+            info = ocr.extract_powerplay_auto(screenshot)
+        except Exception as e:
+            print(f"  [SKIP] {os.path.basename(path)}: {e}")
+            continue
+
+        layout = 'competitive' if info.get('powers') else 'standard'
+        if layout == 'standard':
+            initial_cp = ocr.detect_initial_control_points_from_bar(screenshot)
+            info['initial_control_points'] = initial_cp if initial_cp is not None else -1
+
+        name = f"{layout}_{len(manifest['frames']) + 1:03d}.png"
+        cv2.imwrite(os.path.join(corpus_dir, name), screenshot.panel(extended=layout == 'competitive'))
+        manifest['frames'].append({
+            'file': name,
+            'source': os.path.basename(path),
+            'layout': layout,
+            'fields': {field: normalize(info.get(field)) for field in LABEL_FIELDS[layout]},
+        })
+        added += 1
+        print(f"  [OK] {os.path.basename(path)} -> {name} ({layout})")
+
+    save_manifest(corpus_dir, manifest)
+    print(f"\nAdded {added} frames ({len(manifest['frames'])} in corpus)")
+    if added:
+        print("Labels were produced by the current pipeline - check them in manifest.json before saving a baseline")
+
+
+def run_corpus(corpus_dir, repeat=1, use_cache=False):
+    """
+    Benchmark every corpus frame
+
+    Returns:
+        Result dict (see save format of --save-baseline), or None if the corpus is empty
+    """
+    manifest, manifest_hash = load_manifest(corpus_dir)
+    if not manifest['frames']:
+        return None
+
+    ocr, timer = create_ocr(use_cache)
+    frames = {}
+    for frame in manifest['frames']:
+        path = os.path.join(corpus_dir, frame['file'])
+        runs = [process_frame(ocr, timer, path) for _ in range(repeat)]
+        info = runs[0][0]
+
+        fields = {}
+        for field, expected in frame['fields'].items():
+            actual = normalize(info.get(field))
+            fields[field] = {'ok': actual == expected, 'actual': actual, 'expected': expected}
+
+        frames[frame['file']] = {
+            'layout': frame['layout'],
+            'stages_ms': {stage: statistics.median(run[1][stage] for run in runs) for stage in STAGES},
+            'fields': fields,
+        }
+
+    return {
+        'manifest': manifest_hash,
+        'repeat': repeat,
+        'stages_ms': {stage: statistics.mean(f['stages_ms'][stage] for f in frames.values()) for stage in STAGES},
+        'total_ms': statistics.mean(sum(f['stages_ms'].values()) for f in frames.values()),
+        'checks_us': time_monitor_checks([os.path.join(corpus_dir, name) for name in frames], repeat),
+        'accuracy': field_accuracy(frames),
+        'frames': frames,
+    }
+
+
+def field_accuracy(frames):
+    """Fraction of frames with a correct value, per field"""
+    counts = defaultdict(lambda: [0, 0])
+    for frame in frames.values():
+        for field, result in frame['fields'].items():
+            counts[field][0] += result['ok']
+            counts[field][1] += 1
+    return {field: correct / total for field, (correct, total) in sorted(counts.items())}
+
+
+def print_report(result, baseline):
+    print("\nStage latency (mean ms per frame):")
+    for stage in STAGES + ['total']:
+        current = result['total_ms'] if stage == 'total' else result['stages_ms'][stage]
+        line = f"  {stage:<12} {current:9.2f}"
+        if baseline:
+            previous = baseline['total_ms'] if stage == 'total' else baseline['stages_ms'].get(stage, 0.0)
+            line += f"   baseline {previous:9.2f}"
+            if current > previous * (1 + SLOWER_TOLERANCE) and current - previous > 0.5:
+                line += "   [SLOWER]"
+        print(line)
+
+    print("\nMonitoring checks (mean us per frame):")
+    for check in MONITOR_CHECKS:
+        current = result['checks_us'][check]
+        line = f"  {check:<12} {current:9.1f}"
+        if baseline and check in baseline.get('checks_us', {}):
+            previous = baseline['checks_us'][check]
+            line += f"   baseline {previous:9.1f}"
+            if current > previous * (1 + SLOWER_TOLERANCE) and current - previous > 50:
+                line += "   [SLOWER]"
+        print(line)
+
+    print("\nField accuracy:")
+    for field, accuracy in result['accuracy'].items():
+        line = f"  {field:<24} {accuracy:7.1%}"
+        if baseline and field in baseline['accuracy']:
+            line += f"   baseline {baseline['accuracy'][field]:7.1%}"
+        print(line)
+
+
+def find_regressions(result, baseline):
+    """Fields that were correct in the baseline and are wrong now"""
+    regressions = []
+    for name, frame in result['frames'].items():
+        previous = baseline['frames'].get(name)
+        if previous is None:
+            continue
+        for field, current in frame['fields'].items():
+            if previous['fields'].get(field, {}).get('ok') and not current['ok']:
+                regressions.append((name, field, current['expected'], current['actual']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='Corpus directory (default: tests/corpus)')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per frame; stage times are medians')
+    parser.add_argument('--cache', action='store_true', help='Keep the OCR result cache enabled')
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the baseline')
+    parser.add_argument('--add', nargs='+', metavar='DIR', help='Add screenshots or panel crops to the corpus')
+    args = parser.parse_args()
+
+    if args.add:
+        add_to_corpus(args.corpus, args.add)
+        return 0
+
+    print("=" * 80)
+    print("PIPELINE BENCHMARK")
+    print("=" * 80)
+
+    result = run_corpus(args.corpus, args.repeat, args.cache)
+    if result is None:
+        print(f"\nCorpus is empty ({args.corpus}) - add frames with --add DIR")
+        return 0
+    print(f"\n{len(result['frames'])} frames, {args.repeat} run(s) each")
+
+    baseline_path = os.path.join(args.corpus, 'baseline.json')
+    baseline = None
+    if os.path.exists(baseline_path) and not args.save_baseline:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('manifest') != result['manifest']:
+            print("[WARNING] Corpus changed since the baseline was saved - only shared frames are compared")
+
+    print_report(result, baseline)
+
+    if args.save_baseline:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"\nBaseline saved -> {baseline_path}")
+        return 0
+
+    if baseline is None:
+        print("\nNo baseline yet - save one with --save-baseline")
+        return 0
+
+    regressions = find_regressions(result, baseline)
+    if regressions:
+        print("\nAccuracy regressions:")
+        for name, field, expected, actual in regressions:
+            print(f"  [FAIL] {name} {field}: expected {expected!r}, got {actual!r}")
+        return 1
+
+    print("\n[OK] No field regressed against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Build the digit template bank used by the template-matching number reader
+
+Runs Tesseract on the control point and score fields of existing screenshots and
+stores every glyph whose field text segments cleanly (one glyph per character).
+
+Usage:
+    python build_digit_templates.py [screenshot_dir ...]
+"""
+import glob
+import os
+import sys
+
+import config
+from digit_recognizer import DigitRecognizer
+from powerplay_ocr import PowerplayOCR
+from screenshot_context import ScreenshotContext
+
+
+def build_templates(screenshot_dirs, output_path):
+    """Learn glyph templates from all screenshots in the given directories"""
+    ocr = PowerplayOCR(use_easyocr=False)
+    ocr.digit_recognizer = None  # Label fields with Tesseract only
+    recognizer = DigitRecognizer(min_confidence=config.DIGIT_MIN_CONFIDENCE)
+
+    paths = []
+    for directory in screenshot_dirs:
+        paths.extend(sorted(glob.glob(os.path.join(directory, '*.png'))))
+
+    learned = 0
+    for path in paths:
+        screenshot = ScreenshotContext(path)
+        try:
+            info = ocr.extract_powerplay_auto(screenshot)
+        except Exception as e:
+            print(f"  [SKIP] {os.path.basename(path)}: {e}")
+            continue
+
+        if info.get('powers'):
+            subsections = ocr.crop_powerplay_subsections_competitive(screenshot, as_array=True)
+            fields = ['power_1st_score', 'power_2nd_score', 'power_your_score']
+        else:
+            if info['undermining_points'] < 0 or info['reinforcing_points'] < 0:
+                continue
+            subsections = ocr.crop_powerplay_subsections(screenshot, as_array=True)
+            fields = ['control_points']
+
+        for field in fields:
+            if field not in subsections:
+                continue
+            text = ocr._ocr_section(subsections[field], 'upscale', '--oem 3 --psm 7 --dpi 300').strip().upper()
+            if recognizer.learn(subsections[field], text):
+                learned += 1
+                print(f"  [OK] {os.path.basename(path)} {field}: {text}")
+
+    if not learned:
+        print("No fields could be learned - templates not saved")
+        return
+
+    recognizer.save(output_path)
+    print(f"\nLearned {learned} fields ({len(recognizer.bank)} glyph samples) -> {output_path}")
+
+
+if __name__ == "__main__":
+    dirs = sys.argv[1:] or ['screenshots', 'auto_capture/screenshots']
+    build_templates(dirs, config.DIGIT_TEMPLATES_PATH)
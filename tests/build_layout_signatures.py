@@ -0,0 +1,55 @@
+"""
+Build the pixel signatures used to route screenshots to the standard or competitive parser
+
+Labels every full screenshot by OCR'ing its status text and stores the pixel statistics
+of the layout probe regions.
+
+Usage:
+    python build_layout_signatures.py [screenshot_dir ...]
+"""
+import glob
+import os
+import sys
+
+import config
+from layout_classifier import LayoutClassifier, layout_features
+from powerplay_ocr import PowerplayOCR
+from screenshot_context import ScreenshotContext
+
+
+def build_signatures(screenshot_dirs, output_path):
+    """Learn layout signatures from all full screenshots in the given directories"""
+    ocr = PowerplayOCR(use_easyocr=False)
+    classifier = LayoutClassifier()
+
+    paths = []
+    for directory in screenshot_dirs:
+        paths.extend(sorted(glob.glob(os.path.join(directory, '*.png'))))
+
+    counts = {}
+    for path in paths:
+        screenshot = ScreenshotContext(path)
+        try:
+            features = layout_features(screenshot.panel(extended=True))
+            if features is None:
+                continue
+            layout = ocr.detect_layout_ocr(screenshot)
+        except Exception as e:
+            print(f"  [SKIP] {os.path.basename(path)}: {e}")
+            continue
+
+        classifier.learn(features, layout)
+        counts[layout] = counts.get(layout, 0) + 1
+        print(f"  [OK] {os.path.basename(path)}: {layout}")
+
+    if not classifier.trained:
+        print(f"Need screenshots of both layouts (got {counts}) - signatures not saved")
+        return
+
+    classifier.save(output_path)
+    print(f"\nLearned {counts} -> {output_path}")
+
+
+if __name__ == "__main__":
+    dirs = sys.argv[1:] or ['screenshots', 'auto_capture/screenshots']
+    build_signatures(dirs, config.LAYOUT_SIGNATURES_PATH)
@@ -0,0 +1,53 @@
+"""
+Build the header template used to drop frames without the Powerplay panel in continuous monitoring
+
+Averages the "POWERPLAY INFORMATION" header area of every screenshot that parses
+as valid Powerplay data.
+
+Usage:
+    python build_panel_header.py [screenshot_dir ...]
+"""
+import glob
+import os
+import sys
+
+import config
+from panel_detector import PanelDetector
+from powerplay_ocr import PowerplayOCR
+from screenshot_context import ScreenshotContext
+
+
+def build_header(screenshot_dirs, output_path, max_samples=50):
+    """Learn the panel header from all valid screenshots in the given directories"""
+    ocr = PowerplayOCR(use_easyocr=False)
+    detector = PanelDetector(max_samples=max_samples)
+
+    paths = []
+    for directory in screenshot_dirs:
+        paths.extend(sorted(glob.glob(os.path.join(directory, '*.png'))))
+
+    for path in paths:
+        screenshot = ScreenshotContext(path)
+        try:
+            info = ocr.extract_powerplay_auto(screenshot)
+        except Exception as e:
+            print(f"  [SKIP] {os.path.basename(path)}: {e}")
+            continue
+
+        if not ocr.is_valid_powerplay_data(info):
+            continue
+        if not detector.learn(screenshot):
+            break
+        print(f"  [OK] {os.path.basename(path)}")
+
+    if not detector.trained:
+        print("No valid screenshots found - header template not saved")
+        return
+
+    detector.save(output_path)
+    print(f"\nLearned header from {detector.samples} screenshot(s) -> {output_path}")
+
+
+if __name__ == "__main__":
+    dirs = sys.argv[1:] or ['screenshots', 'auto_capture/screenshots']
+    build_header(dirs, config.PANEL_HEADER_TEMPLATE_PATH)
@@ -0,0 +1,70 @@
+"""
+Build the power name reference renders used by the image-based power classifier
+
+Runs Tesseract on the power name fields of existing screenshots and stores every
+crop whose OCR text contains a power name exactly (fuzzy matches are not trusted).
+
+Usage:
+    python build_power_templates.py [screenshot_dir ...]
+"""
+import glob
+import os
+import sys
+
+import config
+from power_classifier import PowerClassifier
+from power_names import POWER_NAMES
+from powerplay_ocr import PowerplayOCR
+from screenshot_context import ScreenshotContext
+
+
+def build_templates(screenshot_dirs, output_path):
+    """Learn power name renders from all screenshots in the given directories"""
+    ocr = PowerplayOCR(use_easyocr=False)
+    ocr.power_classifier = None  # Label fields with OCR only
+    classifier = PowerClassifier(min_confidence=config.POWER_MIN_CONFIDENCE)
+
+    paths = []
+    for directory in screenshot_dirs:
+        paths.extend(sorted(glob.glob(os.path.join(directory, '*.png'))))
+
+    learned = {}
+    for path in paths:
+        screenshot = ScreenshotContext(path)
+        try:
+            info = ocr.extract_powerplay_auto(screenshot)
+        except Exception as e:
+            print(f"  [SKIP] {os.path.basename(path)}: {e}")
+            continue
+
+        if info.get('powers'):
+            subsections = ocr.crop_powerplay_subsections_competitive(screenshot, as_array=True)
+            fields = ['power_1st_name', 'power_2nd_name', 'power_your_name']
+        else:
+            subsections = ocr.crop_powerplay_subsections(screenshot, as_array=True)
+            fields = ['controlling_power']
+
+        for field in fields:
+            if field not in subsections:
+                continue
+            text = ocr._ocr_section(subsections[field], 'upscale', '--oem 3 --psm 6 --dpi 300').upper()
+            text = ' '.join(text.split())
+            power = next((name for name in POWER_NAMES if name in text), None)
+            if power and classifier.learn(subsections[field], power):
+                learned[power] = learned.get(power, 0) + 1
+                print(f"  [OK] {os.path.basename(path)} {field}: {power}")
+
+    if not learned:
+        print("No power names could be learned - templates not saved")
+        return
+
+    classifier.save(output_path)
+    print(f"\nLearned {sum(learned.values())} renders of {len(learned)}/{len(POWER_NAMES)} powers -> {output_path}")
+    missing = [name for name in POWER_NAMES if name not in learned]
+    if missing:
+        print(f"No renders yet for: {', '.join(name.title() for name in missing)} (OCR is used for these)")
+
+
+if __name__ == "__main__":
+    dirs = sys.argv[1:] or ['screenshots', 'auto_capture/screenshots']
+    build_templates(dirs, config.POWER_TEMPLATES_PATH)
@@ -0,0 +1,94 @@
+"""
+Test the screen capture backends (replay backend, in-memory capture)
+"""
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+import config
+from capture import ReplayBackend, create_backend
+from screenshot_context import FRAME_EXTENDED_PANEL, ScreenshotContext, panel_capture_region
+
+
+def write_frames(directory, count):
+    """Recorded frames whose top-left pixel holds their index"""
+    for index in range(count):
+        frame = np.zeros((40, 60, 3), dtype=np.uint8)
+        frame[0, 0] = index
+        frame[10:20, 30:50] = (0, 128, 255)
+        cv2.imwrite(os.path.join(directory, f'frame_{index:03d}.png'), frame)
+
+
+def test_replay():
+    with tempfile.TemporaryDirectory() as tmp:
+        write_frames(tmp, 3)
+
+        backend = create_backend('replay', tmp)
+        assert isinstance(backend, ReplayBackend)
+        assert backend.grab()[0, 0, 0] == 0, "the first frame is served before any next_frame()"
+
+        # Every grab of a capture cycle is cut from the same frame
+        served = []
+        for _ in range(4):
+            backend.next_frame()
+            served.append((backend.grab(region=(0, 0, 5, 5))[0, 0, 0], backend.grab()[0, 0, 0]))
+        assert served == [(1, 1), (2, 2), (0, 0), (1, 1)], "frames are served in order, then loop"
+
+        # Regions are (x, y, width, height), like a screen capture
+        region = backend.grab(region=(30, 10, 20, 10))
+        assert region.shape == (10, 20, 3)
+        assert (region == (0, 128, 255)).all()
+
+        once = ReplayBackend(tmp, loop=False)
+        for _ in range(3):
+            once.next_frame()
+        assert once.grab()[0, 0, 0] == 2
+        try:
+            once.next_frame()
+        except IndexError:
+            pass
+        else:
+            raise AssertionError("a non-looping replay must stop after the last frame")
+
+
+def test_replay_requires_frames():
+    with tempfile.TemporaryDirectory() as tmp:
+        for directory in (tmp, None):
+            try:
+                create_backend('replay', directory)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("replay without recorded frames must fail")
+
+
+def test_in_memory_context():
+    frame = np.full((40, 60, 3), 7, dtype=np.uint8)
+    screenshot = ScreenshotContext(frame, path='saved.png')
+    assert screenshot.path == 'saved.png'
+    assert screenshot.image is frame, "a captured frame is used as-is, not re-read from disk"
+
+
+def test_panel_region_capture():
+    desktop = np.random.default_rng(0).integers(0, 256, (config.EXPECTED_SCREEN_HEIGHT, config.EXPECTED_SCREEN_WIDTH, 3),
+                                                dtype=np.uint8)
+    full = ScreenshotContext(desktop)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cv2.imwrite(os.path.join(tmp, 'desktop.png'), desktop)
+        region = panel_capture_region()
+        frame = ReplayBackend(tmp).grab(region)
+    assert frame.shape == (config.PANEL_HEIGHT_EXTENDED, config.PANEL_WIDTH_EXTENDED, 3)
+
+    # Panel-origin frames yield exactly the crops of the full screenshot, with or without the frame hint
+    for roi in (ScreenshotContext(frame, frame=FRAME_EXTENDED_PANEL), ScreenshotContext(frame.copy())):
+        assert roi.frame == FRAME_EXTENDED_PANEL
+        assert not roi.is_full_screenshot
+        for extended in (False, True):
+            assert np.array_equal(roi.panel(extended), full.panel(extended))
+
+    # Standard panel crops are still used as-is
+    standard = ScreenshotContext(full.panel().copy())
+    assert np.array_equal(standard.panel(), full.panel())
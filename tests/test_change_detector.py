@@ -0,0 +1,33 @@
+"""
+Test the panel change detector used by continuous monitoring
+"""
+import cv2
+import numpy as np
+
+from change_detector import PanelChangeDetector
+
+
+def render_panel(system_name, status, points, seed=0):
+    """Standard panel crop (740x646) with slight pixel noise"""
+    rng = np.random.default_rng(seed)
+    panel = rng.integers(10, 16, (646, 740, 3), dtype=np.uint8)
+    cv2.putText(panel, system_name, (20, 88), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 160, 40), 2)
+    cv2.putText(panel, status, (20, 250), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (230, 230, 230), 2)
+    cv2.putText(panel, points, (80, 468), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (230, 230, 230), 2)
+    return panel
+
+
+def test_changes():
+    detector = PanelChangeDetector()
+    assert detector.changed(render_panel('LTT 970', 'EXPLOITED', '1,234'))
+    # Same system, different noise - no OCR needed
+    assert not detector.changed(render_panel('LTT 970', 'EXPLOITED', '1,234', seed=1))
+    # A different system
+    assert detector.changed(render_panel('LTT 971', 'EXPLOITED', '1,234'))
+    # Same system, new status
+    assert detector.changed(render_panel('LTT 971', 'FORTIFIED', '1,234'))
+    # Point values are not fingerprinted
+    assert not detector.changed(render_panel('LTT 971', 'FORTIFIED', '9,999'))
+
+    detector.reset()
+    assert detector.changed(render_panel('LTT 971', 'FORTIFIED', '9,999')), "first frame after reset is new"
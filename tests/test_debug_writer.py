@@ -0,0 +1,95 @@
+"""
+Test the background debug artifact writer (always / on_failure modes)
+"""
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+from debug_writer import DebugWriter, capture_artifacts
+from screenshot_context import ScreenshotContext
+
+
+def fake_artifacts(directory, index, calls):
+    """Image and lazily formatted text of one capture; calls records which texts were formatted"""
+    def text():
+        calls.append(index)
+        return f"capture {index}\n"
+
+    image = np.full((8, 12, 3), index, dtype=np.uint8)
+    return [(os.path.join(directory, 'cropped', f'capture_{index:03d}.png'), image),
+            (os.path.join(directory, 'ocr_text', f'capture_{index:03d}.txt'), text)]
+
+
+def test_always():
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        writer = DebugWriter('always', max_pending=2)
+        for index in range(1, 6):
+            writer.submit(fake_artifacts(tmp, index, calls))
+        writer.flush()
+
+        assert writer.written == 10 and writer.errors == 0
+        image = cv2.imread(os.path.join(tmp, 'cropped', 'capture_005.png'))
+        assert image.shape == (8, 12, 3) and (image == 5).all()
+        with open(os.path.join(tmp, 'ocr_text', 'capture_003.txt'), encoding='utf-8') as f:
+            assert f.read() == "capture 3\n"
+        writer.close()
+
+
+def test_on_failure():
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        writer = DebugWriter('on_failure', ring_size=2)
+        for index in range(1, 5):
+            writer.submit(fake_artifacts(tmp, index, calls))
+        writer.flush()
+        assert not os.path.exists(os.path.join(tmp, 'cropped')), "successful captures stay in memory"
+        assert calls == [], "text of unwritten captures must not be formatted"
+
+        # A failure writes itself and the last ring_size successful captures before it
+        writer.submit(fake_artifacts(tmp, 5, calls), failed=True)
+        writer.close()
+        assert sorted(os.listdir(os.path.join(tmp, 'cropped'))) == ['capture_003.png', 'capture_004.png',
+                                                                     'capture_005.png']
+        assert calls == [3, 4, 5]
+
+
+class FakeOCR:
+    """Just enough of PowerplayOCR for capture_artifacts(); counts full-panel OCR passes"""
+
+    def __init__(self):
+        self.raw_text_calls = 0
+
+    def crop_powerplay_subsections(self, screenshot, as_array=False):
+        return {'system_name': screenshot.panel()[:10, :20]}
+
+    def is_valid_powerplay_data(self, info):
+        return bool(info['system_name'])
+
+    def raw_text(self, screenshot):
+        self.raw_text_calls += 1
+        return "POWERPLAY INFORMATION"
+
+
+def test_capture_artifacts():
+    ocr = FakeOCR()
+    screenshot = ScreenshotContext(np.zeros((646, 740, 3), dtype=np.uint8))
+    info = {'system_name': 'LTT 970', 'controlling_power': 'Zemina Torval', 'opposing_power': None,
+            'system_status': 'EXPLOITED', 'undermining_points': 10, 'reinforcing_points': 20,
+            '_ocr_fields': {'system_name': 'LTT 970'}}
+
+    artifacts, failed = capture_artifacts(ocr, screenshot, info, 'debug', 3, "CAPTURE #3 - LTT 970")
+    assert not failed
+    paths = [path for path, _ in artifacts]
+    assert paths == [os.path.join('debug', 'cropped', 'capture_003.png'),
+                     os.path.join('debug', 'subsections', 'capture_003_system_name.png'),
+                     os.path.join('debug', 'ocr_text', 'capture_003.txt')]
+    text = artifacts[-1][1]()
+    assert "CAPTURE #3 - LTT 970" in text and "system_name: LTT 970" in text
+    assert ocr.raw_text_calls == 0, "valid captures reuse the field OCR text"
+
+    info['system_name'] = None
+    artifacts, failed = capture_artifacts(ocr, screenshot, info, 'debug', 4, "CAPTURE #4")
+    assert failed and "RAW OCR TEXT" in artifacts[-1][1]() and ocr.raw_text_calls == 1
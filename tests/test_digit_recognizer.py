@@ -0,0 +1,51 @@
+"""
+Test the template-matching digit recognizer on synthetic game-style number fields
+"""
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+from digit_recognizer import DigitRecognizer
+
+
+def render(text, width=420):
+    """Render light text on a dark background, like the in-game panel"""
+    img = np.zeros((30, width, 3), dtype=np.uint8)
+    cv2.putText(img, text, (5, 22), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (80, 160, 255), 2, cv2.LINE_AA)
+    return img
+
+
+def trained_recognizer():
+    recognizer = DigitRecognizer()
+    for text in ['0123456789', '1,234 CONTROL POINTS 5,678', '9,870']:
+        assert recognizer.learn(render(text), text), f"failed to learn '{text}'"
+    return recognizer
+
+
+def test_read_control_points():
+    recognizer = trained_recognizer()
+    assert recognizer.read_numbers(render('3,141 CONTROL POINTS 59')) == [3141, 59]
+    assert recognizer.read_numbers(render('0 CONTROL POINTS 0')) == [0, 0]
+    assert recognizer.read_numbers(render('12,345')) == [12345]
+
+
+def test_falls_back_without_templates():
+    assert DigitRecognizer().read_numbers(render('1,234')) is None
+    assert DigitRecognizer.load(os.path.join(tempfile.gettempdir(), 'missing_templates.npz')) is None
+
+
+def test_low_confidence_returns_none():
+    recognizer = trained_recognizer()
+    recognizer.min_confidence = 1.01  # Nothing can match this well
+    assert recognizer.read_numbers(render('3,141')) is None
+
+
+def test_save_and_load():
+    recognizer = trained_recognizer()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'digits.npz')
+        recognizer.save(path)
+        loaded = DigitRecognizer.load(path)
+    assert loaded.read_numbers(render('8,765 CONTROL POINTS 4,321')) == [8765, 4321]
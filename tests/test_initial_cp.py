@@ -3,9 +3,42 @@
 Test script to check initial CP detection on cropped debug images
 """
 from powerplay_ocr import PowerplayOCR
+import config
+import cv2
+import numpy as np
 import os
 import glob
 
+
+def render_desktop(marker_ratio):
+    """Full screenshot with a white initial CP marker on the status bar of the panel"""
+    desktop = np.full((config.EXPECTED_SCREEN_HEIGHT, config.EXPECTED_SCREEN_WIDTH, 3), 20, dtype=np.uint8)
+    bar_left, bar_top, bar_right, bar_bottom = 16, 568, 735, 609  # In standard panel pixels
+    x = config.PANEL_LEFT + bar_left + round(marker_ratio * (bar_right - bar_left))
+    top, bottom = config.PANEL_TOP + bar_top, config.PANEL_TOP + bar_bottom
+    desktop[top:bottom, x - 1:x + 2] = 220
+    desktop[top:bottom, x] = 255
+    return desktop
+
+
+def test_batch_frames():
+    """The batch API crops full screenshots and extended crops like the single-image API"""
+    ocr = PowerplayOCR(use_easyocr=False)
+    desktop = render_desktop(0.6)
+    left, top = config.PANEL_LEFT, config.PANEL_TOP
+    frames = [
+        desktop,
+        desktop[top:config.PANEL_BOTTOM_EXTENDED, left:config.PANEL_RIGHT_EXTENDED].copy(),
+        desktop[top:config.PANEL_BOTTOM_STANDARD, left:config.PANEL_RIGHT_STANDARD].copy(),
+    ]
+
+    expected = ocr.detect_initial_control_points_from_bar(desktop)
+    assert abs(expected - 610000) <= 2000, expected
+    assert [ocr.detect_initial_control_points_from_bar(frame) for frame in frames] == [expected] * 3
+    assert ocr.detect_initial_control_points_batch(frames) == [expected] * 3
+    assert ocr.detect_initial_control_points_batch([cv2.cvtColor(frames[1], cv2.COLOR_BGR2GRAY)]) == [expected]
+
+
 def main():
     ocr = PowerplayOCR()
 
@@ -0,0 +1,64 @@
+"""
+Test the pixel-signature layout classifier on synthetic extended panels
+"""
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+from layout_classifier import LayoutClassifier, layout_features
+
+
+def synthetic_panel(layout, seed):
+    """Dark extended panel with either a tug-of-war bar or three ranked power rows"""
+    rng = np.random.default_rng(seed)
+    panel = rng.integers(0, 30, size=(840, 742, 3), dtype=np.uint8)
+    if layout == 'standard':
+        split = int(rng.integers(200, 550))
+        panel[568:609, 16:split] = (200, 120, 30)
+        panel[568:609, split:735] = (30, 60, 200)
+        panel[568:609, split - 2:split + 2] = 255
+        cv2.putText(panel, '12,345 CONTROL POINTS 6,789', (80, 468), cv2.FONT_HERSHEY_SIMPLEX, 0.7,
+                    (80, 160, 255), 2)
+    else:
+        for top in (330, 464, 692):
+            cv2.putText(panel, 'ZACHARY HUDSON', (110, top + 24), cv2.FONT_HERSHEY_SIMPLEX, 0.7,
+                        (80, 160, 255), 2)
+    return panel
+
+
+def trained_classifier():
+    classifier = LayoutClassifier()
+    for seed in range(5):
+        for layout in ('standard', 'competitive'):
+            classifier.learn(layout_features(synthetic_panel(layout, seed)), layout)
+    return classifier
+
+
+def test_classifies_layouts():
+    classifier = trained_classifier()
+    for seed in range(100, 105):
+        for layout in ('standard', 'competitive'):
+            result, confidence = classifier.classify(layout_features(synthetic_panel(layout, seed)))
+            assert result == layout and confidence > 0.5, (layout, result, confidence)
+
+
+def test_untrained_and_unknown_frames():
+    assert LayoutClassifier().classify(layout_features(synthetic_panel('standard', 0))) == (None, 0.0)
+    # Standard-height crops do not contain the competitive probe rows
+    assert layout_features(np.zeros((646, 740, 3), dtype=np.uint8)) is None
+    # A frame unlike either layout must not be routed confidently
+    _, confidence = trained_classifier().classify(layout_features(np.full((840, 742, 3), 255, np.uint8)))
+    assert confidence == 0.0
+
+
+def test_save_load():
+    classifier = trained_classifier()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'layout.json')
+        classifier.save(path)
+        loaded = LayoutClassifier.load(path)
+
+    layout, _ = loaded.classify(layout_features(synthetic_panel('competitive', 42)))
+    assert layout == 'competitive'
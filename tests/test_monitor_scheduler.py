@@ -0,0 +1,137 @@
+"""
+Test the continuous monitoring scheduler (timer captures, latest-frame-wins hand-off)
+
+The tests synchronize on semaphores instead of sleeping: with an interval of an hour
+the only captures are the immediate ones start() triggers.
+"""
+import itertools
+import threading
+
+from monitor_scheduler import MonitorScheduler
+
+HOUR = 3600.0
+TIMEOUT = 10.0  # Safety net only - nothing should ever wait this long
+
+
+def counting_capture(frames):
+    """
+    Capture callable returning the next frame, and a semaphore released as each capture starts
+
+    The timer thread captures one frame at a time, so once capture N has started
+    frame N-1 has been handed to the workers.
+    """
+    started = threading.Semaphore(0)
+
+    def capture():
+        started.release()
+        return next(frames)
+
+    return capture, started
+
+
+def counting_process(process):
+    """Wrap process(frame) with a semaphore released after each call"""
+    done = threading.Semaphore(0)
+
+    def wrapped(frame):
+        try:
+            process(frame)
+        finally:
+            done.release()
+
+    return wrapped, done
+
+
+def test_start_stop():
+    capture, _ = counting_capture(itertools.count())
+    processed = []
+    process, done = counting_process(processed.append)
+    scheduler = MonitorScheduler(capture, process, interval=HOUR)
+    assert not scheduler.active
+
+    # Every start captures right away; the next timed capture would be an hour later
+    assert scheduler.toggle() is True
+    assert done.acquire(timeout=TIMEOUT)
+    assert scheduler.toggle() is False
+    scheduler.start()
+    assert done.acquire(timeout=TIMEOUT)
+    scheduler.close()
+    assert processed == [0, 1]
+
+
+def test_timer_repeats():
+    capture, started = counting_capture(itertools.count())
+    scheduler = MonitorScheduler(capture, lambda frame: None, interval=0.001)
+    scheduler.start()
+    for _ in range(3):
+        assert started.acquire(timeout=TIMEOUT)
+    scheduler.close()
+
+
+def test_latest_frame_wins():
+    capture, started = counting_capture(itertools.chain(range(4), itertools.repeat(None)))
+    processing = threading.Event()
+    release = threading.Event()
+    processed = []
+
+    def process(frame):
+        processing.set()
+        release.wait()
+        processed.append(frame)
+
+    scheduler = MonitorScheduler(capture, process, interval=HOUR)
+    scheduler.start()
+    assert started.acquire(timeout=TIMEOUT)
+    assert processing.wait(timeout=TIMEOUT)
+
+    # The worker is stuck on frame 0 - captures go on and only the newest frame waits.
+    # The last capture returns None and only ensures frame 3 has been handed over.
+    for _ in range(4):
+        scheduler.stop()
+        scheduler.start()
+        assert started.acquire(timeout=TIMEOUT)
+    scheduler.stop()
+    release.set()
+    scheduler.close()
+
+    assert processed == [0, 3]
+    assert (scheduler.submitted, scheduler.dropped) == (4, 2)
+
+
+def test_skipped_frames():
+    capture, started = counting_capture(itertools.repeat(None))
+    processed = []
+    scheduler = MonitorScheduler(capture, processed.append, interval=HOUR)
+    scheduler.start()
+    assert started.acquire(timeout=TIMEOUT)
+    scheduler.close()
+    assert processed == [] and scheduler.submitted == 0, "captures returning None are not processed"
+
+
+def test_errors_keep_running():
+    frames = itertools.count()
+
+    def frame_or_error():
+        frame = next(frames)
+        if frame == 0:
+            raise Exception("screen locked")
+        return frame
+
+    def failing_process(frame):
+        processed.append(frame)
+        if frame == 1:
+            raise Exception("OCR failed")
+
+    capture, started = counting_capture(iter(frame_or_error, None))
+    processed = []
+    process, done = counting_process(failing_process)
+    scheduler = MonitorScheduler(capture, process, interval=HOUR, workers=2)
+    for frame in range(3):
+        scheduler.start()
+        assert started.acquire(timeout=TIMEOUT)
+        if frame:
+            # Wait for the worker so the next frame doesn't replace this one
+            assert done.acquire(timeout=TIMEOUT)
+        scheduler.stop()
+    scheduler.close()
+    assert sorted(processed) == [1, 2]
@@ -0,0 +1,86 @@
+"""
+Test the content-hash OCR result cache (keys, LRU eviction, persistence)
+"""
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from ocr_cache import OCRCache
+
+
+def test_keys():
+    img = np.zeros((20, 40, 3), dtype=np.uint8)
+    same = img.copy()
+    changed = img.copy()
+    changed[5, 5, 0] = 1
+
+    key = OCRCache.make_key(img, 'upscale', '--psm 7')
+    assert key == OCRCache.make_key(same, 'upscale', '--psm 7'), "identical pixels must share a key"
+    assert key != OCRCache.make_key(changed, 'upscale', '--psm 7'), "one changed pixel must change the key"
+    assert key != OCRCache.make_key(img, 'threshold', '--psm 7'), "preprocessing must be part of the key"
+    assert key != OCRCache.make_key(img, 'upscale', '--psm 8'), "OCR config must be part of the key"
+    # Non-contiguous views (subsection crops) hash like their contents
+    big = np.zeros((50, 80, 3), dtype=np.uint8)
+    assert key == OCRCache.make_key(big[10:30, 20:60], 'upscale', '--psm 7')
+
+
+def test_lru_eviction():
+    cache = OCRCache(max_entries=2)
+    cache.put('a', 'A')
+    cache.put('b', 'B')
+    assert cache.get('a') == 'A'  # 'a' is now most recently used
+    cache.put('c', 'C')
+    assert cache.get('b') is None, "least recently used entry should be evicted"
+    assert cache.get('a') == 'A'
+    assert cache.get('c') == 'C'
+    assert (cache.hits, cache.misses) == (3, 1)
+    assert abs(cache.hit_rate - 0.75) < 1e-9
+
+
+def test_persistence():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.json')
+
+        first = OCRCache(path)
+        first.put('k1', 'ZACHARY HUDSON')
+        first.save()
+
+        # A second process saving its own entries must not drop the first one's
+        second = OCRCache(path)
+        third = OCRCache(path)
+        second.put('k2', 'FORTIFIED')
+        third.put('k3', 'EXPLOITED')
+        second.save()
+        third.save()
+
+        reloaded = OCRCache(path)
+        assert reloaded.get('k1') == 'ZACHARY HUDSON'
+        assert reloaded.get('k2') == 'FORTIFIED'
+        assert reloaded.get('k3') == 'EXPLOITED'
+
+
+def test_concurrent_saves():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.json')
+
+        # Every worker saves at the same moment, like Phase 2 workers shutting down
+        workers = 8
+        barrier = threading.Barrier(workers)
+        caches = [OCRCache(path) for _ in range(workers)]
+
+        def save(index):
+            for entry in range(500):
+                caches[index].put(f'{index}-{entry}', 'FORTIFIED')
+            barrier.wait()
+            caches[index].save()
+
+        threads = [threading.Thread(target=save, args=(index,)) for index in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(OCRCache(path)) == workers * 500, "a concurrent save lost entries"
+        assert not os.path.exists(f'{path}.lock')
@@ -0,0 +1,84 @@
+"""
+Test the panel presence check used by continuous monitoring
+"""
+import os
+import tempfile
+import threading
+
+import cv2
+import numpy as np
+
+import config
+from panel_detector import PanelDetector
+
+
+def render_panel(system_name, seed=0):
+    """Extended panel frame (742x840) with the header title and slight pixel noise"""
+    rng = np.random.default_rng(seed)
+    panel = rng.integers(10, 16, (840, 742, 3), dtype=np.uint8)
+    cv2.putText(panel, 'POWERPLAY INFORMATION', (20, 36), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (230, 230, 230), 2)
+    cv2.putText(panel, system_name, (20, 88), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 160, 40), 2)
+    return panel
+
+
+def render_galaxy_map(seed=0):
+    """Same screen area without the panel: dark space with a few stars"""
+    rng = np.random.default_rng(seed)
+    frame = rng.integers(0, 12, (840, 742, 3), dtype=np.uint8)
+    for x, y in rng.integers(0, 742, (60, 2)):
+        cv2.circle(frame, (int(x), int(y) % 840), 2, (255, 255, 255), -1)
+    return frame
+
+
+def render_other_ui():
+    """Another UI with text of its own in the header area"""
+    frame = np.full((840, 742, 3), 40, dtype=np.uint8)
+    cv2.putText(frame, 'SYSTEM MAP   BODIES', (20, 36), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (230, 230, 230), 2)
+    return frame
+
+
+def test_contrast_gate():
+    detector = PanelDetector()
+    assert not detector.trained
+    assert detector.present(render_panel('LTT 970')), "untrained detector accepts every frame with a header"
+    assert not detector.present(np.full((840, 742, 3), 30, dtype=np.uint8)), "blank header area"
+
+
+def test_template():
+    detector = PanelDetector(max_samples=2)
+    assert detector.learn(render_panel('LTT 970'))
+    assert detector.learn(render_panel('COL 285 SECTOR AB-C D1-23', seed=1))
+    assert not detector.learn(render_panel('HIP 1', seed=2)), "template is complete"
+
+    assert detector.present(render_panel('SOL', seed=3))
+    assert not detector.present(render_galaxy_map())
+    assert not detector.present(render_other_ui())
+
+    # Full screenshots are checked at the panel position
+    desktop = np.zeros((config.EXPECTED_SCREEN_HEIGHT, config.EXPECTED_SCREEN_WIDTH, 3), dtype=np.uint8)
+    desktop[config.PANEL_TOP:config.PANEL_BOTTOM_EXTENDED, config.PANEL_LEFT:config.PANEL_RIGHT_EXTENDED] = \
+        render_panel('SOL')
+    assert detector.present(desktop)
+    assert not detector.present(np.zeros_like(desktop))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'panel_header.npz')
+        detector.save(path)
+        loaded = PanelDetector.load(path)
+        assert loaded.trained and not loaded.learn(render_panel('SOL'))
+        assert abs(loaded.score(render_panel('SOL', seed=4)) - detector.score(render_panel('SOL', seed=4))) < 1e-5
+    assert PanelDetector.load(os.path.join('missing', 'panel_header.npz')) is None
+
+
+def test_concurrent_learning():
+    # OCR worker threads learn while the capture thread checks frames
+    detector = PanelDetector(max_samples=4)
+    panels = [render_panel('LTT 970', seed) for seed in range(16)]
+    threads = [threading.Thread(target=detector.learn, args=(panel,)) for panel in panels]
+    threads.append(threading.Thread(target=lambda: [detector.present(panel) for panel in panels]))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert detector.samples == 4
+    assert detector.score(render_panel('SOL')) > 0.99
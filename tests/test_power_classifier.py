@@ -0,0 +1,42 @@
+"""
+Test image-based power identification on synthetic power name renders
+"""
+import cv2
+import numpy as np
+
+from power_classifier import PowerClassifier
+
+POWERS = ['ZACHARY HUDSON', 'ZEMINA TORVAL', 'YURI GROM', 'LI YONG-RUI', 'AISLING DUVAL']
+
+
+def render(text, offset=(8, 22), size=(30, 306)):
+    """Render light text on a dark background, like the in-game power rows"""
+    img = np.zeros(size + (3,), dtype=np.uint8)
+    cv2.putText(img, text, offset, cv2.FONT_HERSHEY_SIMPLEX, 0.6, (80, 160, 255), 1, cv2.LINE_AA)
+    return img
+
+
+def trained_classifier():
+    classifier = PowerClassifier()
+    for power in POWERS:
+        assert classifier.learn(render(power), power)
+    return classifier
+
+
+def test_identifies_shifted_renders():
+    classifier = trained_classifier()
+    for power in POWERS:
+        # Same name at a different position inside the ROI
+        name, score = classifier.classify(render(power, offset=(20, 24)))
+        assert name == power, f"{power} classified as {name} ({score:.2f})"
+
+
+def test_unknown_text_falls_back():
+    classifier = trained_classifier()
+    name, _ = classifier.classify(render('UNOCCUPIED SYSTEM'))
+    assert name is None
+    assert classifier.classify(np.zeros((30, 306, 3), dtype=np.uint8)) == (None, 0.0)
+
+
+def test_empty_bank_falls_back():
+    assert PowerClassifier().classify(render('YURI GROM')) == (None, 0.0)
@@ -0,0 +1,42 @@
+"""
+Test the shared power name matcher (exact, fuzzy and in-line mentions)
+"""
+from power_names import POWER_NAMES, PowerNameMatcher
+
+
+def test_exact_match():
+    matcher = PowerNameMatcher()
+    for name in POWER_NAMES:
+        assert matcher.match(name) == (name, 0), name
+    # Case, line breaks and surrounding noise don't matter for exact hits
+    assert matcher.match('  zachary\nhudson ') == ('ZACHARY HUDSON', 0)
+    assert matcher.match('PRANAV ANTAL\n~~ ..') == ('PRANAV ANTAL', 0)
+
+
+def test_fuzzy_match():
+    matcher = PowerNameMatcher()
+    assert matcher.match('ARlSSA LAVIGNY-DUVAI') == ('ARISSA LAVIGNY-DUVAL', 2)
+    assert matcher.match('LI YONG-RU1') == ('LI YONG-RUI', 1)
+    assert matcher.match('YURl GR0M') == ('YURI GROM', 2)
+    # Noise around a misread name isn't counted against the bound
+    assert matcher.match('| YURI GR0M |') == ('YURI GROM', 1)
+    assert matcher.match('. ZACHARY HUDS0N ~~') == ('ZACHARY HUDSON', 1)
+    assert matcher.match('~\nLl YONG-RUI\n_ .') == ('LI YONG-RUI', 1)
+    assert matcher.match('| ARCHON DELAlNE 12,345') == ('ARCHON DELAINE', 1)
+    # Too far from every name
+    assert matcher.match('EDMUND') == (None, None)
+    assert matcher.match('garbage') == (None, None)
+    assert matcher.match('') == (None, None)
+
+
+def test_mentioned_power():
+    matcher = PowerNameMatcher()
+    assert matcher.mentioned_power('A.LAVIGNY-DUVAL') == 'ARISSA LAVIGNY-DUVAL'
+    assert matcher.mentioned_power('ALAVIGNY-DUVAL') == 'ARISSA LAVIGNY-DUVAL'
+    # Longest last name wins - DUVAL alone is Aisling Duval
+    assert matcher.mentioned_power('AISLING DUVAL') == 'AISLING DUVAL'
+    assert matcher.mentioned_power('DUVAL') == 'AISLING DUVAL'
+    # First names are whole words only
+    assert matcher.mentioned_power('LI') == 'LI YONG-RUI'
+    assert matcher.mentioned_power('BEYOND FRONTLINE PENALTY') is None
+    assert matcher.mentioned_power('CONTROL POINTS') is None
@@ -0,0 +1,73 @@
+"""
+Test the system name lexicon (edit distance, BK-tree lookup, persistence)
+"""
+import os
+import tempfile
+
+from system_lexicon import SystemLexicon, edit_distance, is_misread
+
+
+def test_edit_distance():
+    assert edit_distance('FLOARPH MJ-O D7-19', 'FLOARPH MJ-O D7-19') == 0
+    assert edit_distance('COL 359 SECTOR DE2-16', 'COL 359 SECTOR D2-16') == 1
+    assert edit_distance('GOL 285 SECTOR', 'COL 285 SECTOR') == 1
+    assert edit_distance('KITTEN', 'SITTING') == 3
+    # Early exit reports "more than max_distance"
+    assert edit_distance('LTT 970', 'SYNUEFE XR-H D11-102', max_distance=2) == 3
+
+
+def test_lookup():
+    lexicon = SystemLexicon()
+    for name in ['COL 359 SECTOR EK-L B10-4', 'COL 359 SECTOR EK-L B10-5', 'FLOARPH MJ-O D7-19',
+                 'SYNUEFE XR-H D11-102', 'LTT 970', 'LTT 971']:
+        lexicon.add(name)
+    assert len(lexicon) == 6
+    assert not lexicon.add('ltt 970'), "names are case-insensitive"
+
+    # OCR errors within the bound snap to the known name
+    assert lexicon.lookup('FL0ARPH MJ-O D7-19') == ('FLOARPH MJ-O D7-19', 1)
+    assert lexicon.lookup('COL 359 SECTOR EK-L BI0-4') == ('COL 359 SECTOR EK-L B10-4', 1)
+    # ...but not beyond it (2 edits in a 19 character name)
+    assert lexicon.lookup('FL0ARPH MJ-O DE7-19') == (None, None)
+    assert lexicon.lookup('SYNUEFE XR-H D11-1O2') == ('SYNUEFE XR-H D11-102', 1)
+    # Equally close to two known names - don't guess
+    assert lexicon.lookup('COL 359 SECTOR EK-L B10-6') == (None, None)
+    # Short names must match exactly - "LTT 972" may well be a new system
+    assert lexicon.lookup('LTT 970') == ('LTT 970', 0)
+    assert lexicon.lookup('LTT 972') == (None, None)
+    assert lexicon.lookup('HIP 12345') == (None, None)
+
+
+def test_neighbouring_systems():
+    lexicon = SystemLexicon()
+    for name in ['SYNUEFE XR-H D11-102', 'HIP 123456', 'COL 285 SECTOR AB-C D12-34']:
+        lexicon.add(name)
+
+    # Correct reads of systems that are not known yet must not become their neighbours
+    assert lexicon.lookup('SYNUEFE XR-H D11-103') == (None, None)
+    assert lexicon.lookup('HIP 123457') == (None, None)
+    assert lexicon.lookup('COL 285 SECTOR AB-C D12-35') == (None, None)
+    assert lexicon.lookup('SYNUEFE XR-J D11-102') == (None, None)
+    # Misreads still snap: lookalike characters anywhere, other letters only in plain words
+    assert lexicon.lookup('SYNUEFE XR-H D11-1O2') == ('SYNUEFE XR-H D11-102', 1)
+    assert lexicon.lookup('SYNUEPE XR-H D11-102') == ('SYNUEFE XR-H D11-102', 1)
+    assert lexicon.lookup('COL 285 SECTR AB-C D12-34') == ('COL 285 SECTOR AB-C D12-34', 1)
+
+    assert is_misread('HIP 12345G', 'HIP 123456')
+    assert not is_misread('HIP 12345', 'HIP 123456')
+
+
+def test_persistence():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'system_names.json')
+
+        first = SystemLexicon(path)
+        second = SystemLexicon(path)
+        first.add('FLOARPH MJ-O D7-19')
+        second.add('LTT 970')
+        first.save()
+        second.save()
+
+        reloaded = SystemLexicon(path)
+        assert 'FLOARPH MJ-O D7-19' in reloaded
+        assert 'LTT 970' in reloaded
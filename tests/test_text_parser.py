@@ -0,0 +1,59 @@
+"""
+Test the precompiled Powerplay panel text parser on typical OCR output
+"""
+from text_parser import PowerplayTextParser
+
+STANDARD_PANEL = """POWERPLAY INFORMATION
+_ COL 359 SECTOR DE2-16 LAST UPDATED:
+DISTANCE: 19,812.17LY 5 MINUTES AGO
+=XPLOITED
+Exploited systems have a low control score and need a Fortified
+TUG OF WAR
+Opposing Powers Controlling Power
+A.LAVIGNY-DUVAL
+52317 ° CONTROL POINTS » 150642
+SYSTEM STRENGTH PENALTY: NONE
+BEYOND FRONTLINE PENALTY: HIGH"""
+
+
+def test_standard_panel():
+    info = PowerplayTextParser().parse(STANDARD_PANEL)
+    assert info['system_name'] == 'COL 359 SECTOR D2-16', info['system_name']
+    assert info['distance_ly'] == 19812.17
+    assert info['time_ago'] == '5 minutes ago'
+    assert info['system_status'] == 'EXPLOITED'
+    assert info['controlling_power'] == 'Arissa Lavigny-Duval'
+    assert (info['undermining_points'], info['reinforcing_points']) == (52317, 150642)
+    assert info['system_strength_penalty'] == 'NONE'
+    assert info['beyond_frontline_penalty'] == 'HIGH'
+
+
+def test_opposing_power():
+    text = "\n".join([
+        "POWERPLAY INFORMATION",
+        "FLOARPH MJ-O D7-19",
+        "STRONGHOLD",
+        "OPPOSING POWERS",
+        "LI YONG-RUI",
+        "4,500 UNDERMINING",
+        "2098 x CONTROL POINTS",
+    ])
+    info = PowerplayTextParser().parse(text)
+    assert info['system_name'] == 'FLOARPH MJ-O D7-19', info['system_name']
+    assert info['system_status'] == 'STRONGHOLD'
+    assert info['opposing_power'] == 'Li Yong-Rui'
+    assert info['controlling_power'] == ''
+    # Only the CONTROL POINTS line is authoritative - "-1" (not parsed) skips the fallbacks
+    assert info['undermining_points'] == -1
+    assert info['reinforcing_points'] == -1
+
+
+def test_status_rules():
+    parser = PowerplayTextParser()
+    # Fuzzy keyword match with OCR noise
+    assert parser.parse("VEXPLOTED")['system_status'] == 'EXPLOITED'
+    # The legend line and description sentences are not a status
+    assert parser.parse("UNOCCUPIED EXPLOITED FORTIFIED STRONGHOLD")['system_status'] == ''
+    assert parser.parse("Stronghold status needs more reinforcement")['system_status'] == ''
+    # "LI" must not match inside other words
+    assert parser.parse("BEYOND FRONTLINE")['controlling_power'] == ''
@@ -0,0 +1,56 @@
+"""
+Test tracing spans and Chrome trace export
+"""
+import json
+import os
+import tempfile
+import time
+
+import tracing
+
+
+@tracing.traced()
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return seconds
+
+
+def test_disabled():
+    tracing.disable()
+    tracing.drain()
+    with tracing.span('ignored'):
+        busy(0.001)
+    assert busy(0) == 0
+    assert tracing.drain() == [], "disabled tracing must not record anything"
+
+
+def test_spans_and_export():
+    tracing.drain()
+    tracing.enable('test process')
+    try:
+        with tracing.span('outer', system='LTT 970'):
+            busy(0.005)
+    finally:
+        tracing.disable()
+
+    # Events from another process (e.g. a Phase 2 worker) are merged before export
+    worker_events = [{'name': 'worker_span', 'ph': 'X', 'ts': 0, 'dur': 10, 'pid': 1, 'tid': 1}]
+    tracing.add_events(worker_events)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'trace', 'run.json')
+        assert tracing.export(path) == 3
+        with open(path, 'r', encoding='utf-8') as f:
+            events = json.load(f)['traceEvents']
+
+    spans = {event['name']: event for event in events if event['ph'] == 'X'}
+    assert set(spans) == {'outer', 'busy', 'worker_span'}
+    outer, inner = spans['outer'], spans['busy']
+    assert outer['args'] == {'system': 'LTT 970'}
+    assert inner['dur'] >= 5000, "busy span should last at least 5 ms"
+    assert outer['ts'] <= inner['ts'] and inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur']
+    assert inner['tdur'] > 0, "busy loop should use CPU time"
+    assert any(event['ph'] == 'M' and event['args']['name'] == 'test process' for event in events)
+    assert tracing.drain() == [], "export must consume the events"
@@ -0,0 +1,321 @@
+"""
+Precompiled Powerplay panel text parser for PowerplayParser
+Builds all patterns, keyword tables and context lookups once, then parses
+OCR text in a single pass over its lines
+"""
+
+# Standard library imports
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+# Local imports
+from power_names import PowerNameMatcher
+
+# Status keywords - order matters, STRONGHOLD is checked before FORTIFIED
+STATUS_KEYWORDS = ['STRONGHOLD', 'FORTIFIED', 'EXPLOITED', 'UNOCCUPIED']
+
+
+@lru_cache(maxsize=65536)
+def _similar(word, keyword):
+    """True if word is a >75% SequenceMatcher match for keyword (memoized across parses)"""
+    matcher = SequenceMatcher(None, word, keyword)
+    # quick_ratio() is an upper bound of ratio() - skip the full comparison when it can't pass
+    return matcher.quick_ratio() > 0.75 and matcher.ratio() > 0.75
+
+
+class PowerplayTextParser:
+    """
+    Parser for the raw OCR text of a Powerplay information panel
+
+    Produces exactly the same result as the original line-by-line rules, but
+    everything that does not depend on the text is prepared once in __init__,
+    and per-text lookups (header position, CONTROLLING/OPPOSING context windows)
+    are computed once per text instead of once per line.
+    """
+
+    def __init__(self, matcher=None):
+        """
+        Args:
+            matcher: PowerNameMatcher shared with the field extractors (a new one if None)
+        """
+        self._distance = re.compile(r'DISTANCE[:\s]+(\d+[,.\s]*\d*\.?\d*)\s*LY', re.IGNORECASE)
+        self._time_ago = re.compile(r'(\d+)\s+(SECOND|MINUTE|HOUR|DAY)S?\s+AGO', re.IGNORECASE)
+        self._system_name = re.compile(r'^([A-Za-z0-9][A-Za-z0-9\s\-]+?)(?:\s+LAST\s+UPDATED|[\s=,._]*$)',
+                                       re.IGNORECASE)
+        self._extra_e = re.compile(r'([A-Z])E(\d)')
+        self._name_parts = re.compile(r'(\s+|-)')
+        self._b_for_5 = re.compile(r'^[A-Z]B-\d')
+        self._non_letters = re.compile(r'[^A-Z\s]')
+
+        self._points_pair = re.compile(r'(\d{4,}(?:,\d{3})*)\D+CONTROL\s+POINTS\D+(\d{4,}(?:,\d{3})*)', re.IGNORECASE)
+        self._points_single = re.compile(r'(\d{4,}(?:,\d{3})*)\s+\S*\s*CONTROL\s+POINTS', re.IGNORECASE)
+        self._points_after = re.compile(r'CONTROL\s+POINTS\s*[>»\)�]*\s*(\d{1,3})(?:\)|$)', re.IGNORECASE)
+        self._undermining = re.compile(r'UNDERMINING\s*[:\s_,]*(\d{4,}(?:,\d{3})*)', re.IGNORECASE)
+        self._undermining_next = re.compile(r'^:?\s*(\d{4,}(?:,\d{3})*)$')
+        self._standalone_number = re.compile(r'^(\d{4,}(?:,\d{3})*)$')
+        self._reinforcing = re.compile(r'REINFORCING\s*[:\s]*(\d+)', re.IGNORECASE)
+        self._digits_only = re.compile(r'^\d+$')
+        self._penalty = re.compile(r'PENALTY[:\s]+(\w+)', re.IGNORECASE)
+
+        # Power names: last name, abbreviated name or first name, longest last name first
+        self._matcher = matcher if matcher is not None else PowerNameMatcher()
+
+    def parse(self, text):
+        """
+        Parse Powerplay information panel text
+
+        Args:
+            text: Raw OCR text
+
+        Returns:
+            Dictionary with parsed Powerplay information (see PowerplayOCR.parse_powerplay_info)
+        """
+        info = {
+            'system_name': '',
+            'last_updated': '',
+            'distance_ly': 0.0,
+            'time_ago': '',
+            'system_status': '',
+            'status_description': '',
+            'opposing_power': '',
+            'controlling_power': '',
+            'undermining_points': -1,  # -1 means not parsed, 0 is valid
+            'reinforcing_points': -1,  # -1 means not parsed, 0 is valid
+            'control_points': -1,      # -1 means not parsed, 0 is valid
+            'system_strength_penalty': '',
+            'beyond_frontline_penalty': ''
+        }
+
+        lines = text.strip().split('\n')
+        upper_lines = [raw.upper() for raw in lines]
+        line_count = len(lines)
+
+        # Per-text lookups: last "POWERPLAY INFORMATION" header before each line, and running
+        # counts of lines mentioning CONTROLLING / OPPOSING for O(1) context window checks
+        last_header = []
+        controlling_counts = [0]
+        opposing_counts = [0]
+        header = -10
+        for j, upper in enumerate(upper_lines):
+            last_header.append(header)
+            # Allow for OCR variations like "POVWERPLAY", "POWERPIAY", etc.
+            if 'POVWERPLAY INFORMATION' in upper or ('POWER' in upper and 'INFORMATION' in upper):
+                header = j
+            controlling_counts.append(controlling_counts[-1] + ('CONTROLLING' in upper))
+            opposing_counts.append(opposing_counts[-1] + ('OPPOSING' in upper))
+
+        for i, raw_line in enumerate(lines):
+            line = raw_line.strip()
+            if not line:
+                continue
+            line_upper = line.upper()
+
+            # System name - follows "POWERPLAY INFORMATION" within 3 lines
+            if not info['system_name'] and last_header[i] >= i - 3:
+                self._parse_system_name(line, info)
+
+            # Distance in light years
+            # Handle various formats: "19,812.17LY", "19,839.2 1LY" (with space before last digit)
+            distance_match = self._distance.search(line)
+            if distance_match:
+                dist_str = distance_match.group(1).replace(',', '').replace(' ', '')
+                try:
+                    info['distance_ly'] = float(dist_str)
+                except ValueError:
+                    pass
+
+            # Time since last update
+            time_match = self._time_ago.search(line)
+            if time_match:
+                info['time_ago'] = f"{time_match.group(1)} {time_match.group(2).lower()}s ago"
+
+            # System status - skip once found and in the legend / TUG OF WAR section
+            if not info['system_status'] and not any(x in line_upper for x in ['TUG OF WAR', 'OPPOSING POWERS', 'UNOCCUPIED EXPLOITED FORTIFIED STRONGHOLD']):
+                self._parse_status(lines, i, line, line_upper, info)
+
+            # Fallback: standardized description text is often more reliably OCR'd
+            if not info['system_status']:
+                self._parse_status_description(line, info)
+
+            # Power names (known Powerplay leaders)
+            power = self._matcher.mentioned_power(line_upper)
+            if power:
+                self._assign_power(power.title(), i, line_count, controlling_counts, opposing_counts, info)
+
+            self._parse_points(lines, i, line, line_upper, info)
+
+            # System strength penalty
+            if 'SYSTEM STRENGTH PENALTY' in line_upper:
+                penalty_match = self._penalty.search(line)
+                if penalty_match:
+                    info['system_strength_penalty'] = penalty_match.group(1).upper()
+
+            # Beyond frontline penalty
+            if 'BEYOND FRONTLINE PENALTY' in line_upper:
+                penalty_match = self._penalty.search(line)
+                if penalty_match:
+                    info['beyond_frontline_penalty'] = penalty_match.group(1).upper()
+
+        return info
+
+    def _parse_system_name(self, line, info):
+        # Remove common prefix characters like "_ ", "A ", "= ", etc.
+        cleaned_line = line
+        for prefix in ['= ', '_ ', 'A ', 'V ', '> ', '- ', '| ']:
+            if cleaned_line.startswith(prefix):
+                cleaned_line = cleaned_line[len(prefix):].strip()
+
+        # Extract system name (stops at LAST UPDATED or special chars)
+        system_match = self._system_name.match(cleaned_line)
+        if not system_match or len(system_match.group(1).strip()) <= 5:
+            return
+
+        name = system_match.group(1).strip().upper()
+        if any(x in name for x in ['DISTANCE', 'MINUTES', 'EXPLOITED', 'FORTIFIED']):
+            return
+
+        # Fix pattern like "DE2" -> "D2", "CE5" -> "C5" (extra E before digit)
+        name = self._extra_e.sub(r'\1\2', name)
+
+        # Fix CB-X -> C5-X (B misread for 5), only in the suffix after the last space/hyphen
+        parts = self._name_parts.split(name)
+        if self._b_for_5.match(parts[-1]):
+            parts[-1] = parts[-1].replace('B-', '5-', 1)
+        info['system_name'] = ''.join(parts)
+
+    def _parse_status(self, lines, i, line, line_upper, info):
+        # A status needs a word matching the keyword exactly or with >75% similarity
+        # (handles "=XPLOITED" and "VEXPLOTED" for "EXPLOITED")
+        if any(x in line_upper for x in ['PENALTY', 'POINTS']):
+            return
+
+        # Skip description lines (e.g. "Exploited systems have a low control score and need a Fortified")
+        # but allow lines like "Bm + STRONGHOLD |" which just have lowercase prefixes
+        lowercase_words = [w for w in line.split() if any(c.islower() for c in w) and len(w) > 3]
+        if len(lowercase_words) >= 2:
+            return
+
+        words = self._non_letters.sub('', line_upper).split()
+        for status in STATUS_KEYWORDS:
+            low = len(status) - 2
+            high = len(status) + 2
+            if not any(low <= len(word) <= high and (word == status or _similar(word, status)) for word in words):
+                continue
+
+            info['system_status'] = status
+            # Next line might be the description
+            if i + 1 < len(lines):
+                next_line = lines[i + 1].strip()
+                if next_line and len(next_line) > 20 and not any(kw in next_line.upper() for kw in ['TUG', 'WAR', 'OPPOSING', 'CONTROL', 'POWERPLAY']):
+                    info['status_description'] = next_line
+            return
+
+    @staticmethod
+    def _parse_status_description(line, info):
+        line_lower = line.lower()
+        # EXPLOITED: "Exploited systems have a low control score and need a Fortified"
+        if 'exploited systems have a low control score' in line_lower or \
+           ('exploited' in line_lower and 'low control score' in line_lower and 'fortified' in line_lower):
+            info['system_status'] = 'EXPLOITED'
+            info['status_description'] = line.strip()
+        # FORTIFIED: "Fortified systems have a high level of reinforcement and maintain control over nearby Exploited systems"
+        elif 'fortified systems have a high level of reinforcement' in line_lower or \
+             ('fortified' in line_lower and 'high level of reinforcement' in line_lower and 'exploited' in line_lower):
+            info['system_status'] = 'FORTIFIED'
+            info['status_description'] = line.strip()
+        # STRONGHOLD: "Stronghold systems have a very high level of reinforcement"
+        elif 'stronghold systems have a very high' in line_lower or \
+             ('stronghold' in line_lower and 'very high' in line_lower and 'reinforcement' in line_lower):
+            info['system_status'] = 'STRONGHOLD'
+            info['status_description'] = line.strip()
+
+    @staticmethod
+    def _assign_power(power_name, i, line_count, controlling_counts, opposing_counts, info):
+        # Opposing or controlling based on context up to 5 lines before and after
+        window_start = max(0, i - 5)
+        window_end = min(line_count, i + 6)
+        if controlling_counts[window_end] - controlling_counts[window_start]:
+            info['controlling_power'] = power_name
+        elif opposing_counts[window_end] - opposing_counts[window_start]:
+            info['opposing_power'] = power_name
+        else:
+            # Default to controlling if no clear context
+            info['controlling_power'] = power_name
+
+    def _parse_points(self, lines, i, line, line_upper, info):
+        # Control points: "NUMBER < CONTROL POINTS > NUMBER" and OCR-noisy variants
+        # This is the authoritative source - always use it if found
+        if 'CONTROL POINTS' in line_upper:
+            points_match = self._points_pair.search(line)
+            if points_match:
+                try:
+                    info['undermining_points'] = int(points_match.group(1).replace(',', ''))
+                    info['reinforcing_points'] = int(points_match.group(2).replace(',', ''))
+                except ValueError:
+                    pass
+            # If only one number found before CONTROL POINTS, it's the undermining value
+            elif not info['undermining_points']:
+                single_match = self._points_single.search(line)
+                if single_match:
+                    try:
+                        info['undermining_points'] = int(single_match.group(1).replace(',', ''))
+                        # Small numbers like "8)" after CONTROL POINTS are likely garbled zeros
+                        if self._points_after.search(line):
+                            info['reinforcing_points'] = 0
+                    except ValueError:
+                        pass
+
+        # UNDERMINING followed by a number on this line or within the next few lines
+        if 'UNDERMINING' in line_upper and not info['undermining_points']:
+            under_match = self._undermining.search(line)
+            if under_match:
+                try:
+                    info['undermining_points'] = int(under_match.group(1).replace(',', ''))
+                except ValueError:
+                    pass
+            else:
+                for j in range(1, 4):
+                    if i + j < len(lines):
+                        standalone_match = self._undermining_next.match(lines[i + j].strip())
+                        if standalone_match:
+                            try:
+                                info['undermining_points'] = int(standalone_match.group(1).replace(',', ''))
+                                break
+                            except ValueError:
+                                pass
+
+        # Standalone numbers after "Opposing Powers" are likely undermining values
+        if 'OPPOSING POWERS' in line_upper and not info['undermining_points']:
+            for j in range(1, 6):
+                if i + j < len(lines):
+                    future_line = lines[i + j].strip()
+                    standalone_match = self._standalone_number.match(future_line)
+                    if standalone_match:
+                        # Make sure this isn't already captured as reinforcing
+                        potential_undermining = int(standalone_match.group(1).replace(',', ''))
+                        if potential_undermining != info['reinforcing_points']:
+                            info['undermining_points'] = potential_undermining
+                            break
+                    # Stop if we hit another section
+                    if any(keyword in future_line.upper() for keyword in ['TUG OF WAR', 'CONTROLLING POWER', 'REINFORCING']):
+                        break
+
+        # REINFORCING followed by a number on this line or within the next few lines
+        if 'REINFORCING' in line_upper and not info['reinforcing_points']:
+            reinf_match = self._reinforcing.search(line)
+            if reinf_match:
+                try:
+                    info['reinforcing_points'] = int(reinf_match.group(1).replace(',', ''))
+                except ValueError:
+                    pass
+            else:
+                for j in range(1, 4):
+                    if i + j < len(lines):
+                        future_line = lines[i + j].strip()
+                        if self._digits_only.match(future_line):
+                            try:
+                                info['reinforcing_points'] = int(future_line)
+                                break
+                            except ValueError:
+                                pass
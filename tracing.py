@@ -0,0 +1,168 @@
+"""
+Lightweight tracing for PowerplayParser
+Records wall and CPU time of pipeline spans and exports them as Chrome trace-event
+JSON (open in chrome://tracing or https://ui.perfetto.dev)
+
+Disabled by default; a disabled span costs one flag check.
+"""
+
+# Standard library imports
+import functools
+import json
+import os
+import threading
+import time
+
+_enabled = False
+_events = []
+_pid = None
+_epoch_offset_ns = 0  # Added to perf_counter_ns() so timestamps of all processes share one clock
+
+
+class _Span:
+    """Context manager recording one complete ('X') trace event"""
+
+    __slots__ = ('name', 'args', 'start', 'cpu_start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.cpu_start = time.thread_time_ns()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter_ns()
+        cpu_end = time.thread_time_ns()
+        event = {
+            'name': self.name,
+            'ph': 'X',
+            'ts': (self.start + _epoch_offset_ns) / 1000,
+            'dur': (end - self.start) / 1000,
+            'tts': self.cpu_start / 1000,
+            'tdur': (cpu_end - self.cpu_start) / 1000,  # CPU time of the thread
+            'pid': _pid,
+            'tid': threading.get_ident(),
+        }
+        if self.args:
+            event['args'] = self.args
+        _events.append(event)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable(process_name=None):
+    """
+    Start recording spans in this process
+
+    Args:
+        process_name: Label of this process in the trace viewer (optional)
+    """
+    global _enabled, _pid, _epoch_offset_ns
+    _pid = os.getpid()
+    _epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+    if process_name:
+        _events.append({'name': 'process_name', 'ph': 'M', 'pid': _pid, 'args': {'name': process_name}})
+    _enabled = True
+
+
+def disable():
+    """Stop recording spans (recorded events are kept until drained or exported)"""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """True while spans are being recorded"""
+    return _enabled
+
+
+def span(name, **args):
+    """
+    Time a block of code
+
+    Args:
+        name: Span name shown in the trace viewer
+        **args: Extra values attached to the span (only evaluated by the caller)
+
+    Returns:
+        Context manager (a shared no-op when tracing is disabled)
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name=None):
+    """
+    Decorator recording a span for every call of the function
+
+    Args:
+        name: Span name (default: the function's qualified name)
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def drain():
+    """
+    Take all recorded events (e.g. to send them from a worker process to the main process)
+
+    Returns:
+        List of trace events
+    """
+    events = _events[:]
+    del _events[:len(events)]
+    return events
+
+
+def add_events(events):
+    """
+    Merge events recorded by another process
+
+    Args:
+        events: List of trace events from drain()
+    """
+    _events.extend(events)
+
+
+def export(path):
+    """
+    Write all recorded events as a Chrome trace-event JSON file
+
+    Args:
+        path: Output file path (parent directories are created)
+
+    Returns:
+        Number of spans written
+    """
+    events = drain()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    return sum(1 for event in events if event['ph'] == 'X')